@@ -26,11 +26,13 @@ from homeassistant.helpers import area_registry, device_registry, entity_registr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_start_timeline,
 )
 from homeassistant.util.async_ import gather_with_concurrency
 import homeassistant.util.dt as dt_util
@@ -204,41 +206,47 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    timeline = async_start_timeline(hass)
 
-    hass.config_entries = config_entries.ConfigEntries(hass, config)
-    await hass.config_entries.async_initialize()
+    try:
+        hass.config_entries = config_entries.ConfigEntries(hass, config)
+        await hass.config_entries.async_initialize()
 
-    # Set up core.
-    _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
+        # Set up core.
+        _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
-            *(
-                async_setup_component(hass, domain, config)
-                for domain in CORE_INTEGRATIONS
+        if not all(
+            await asyncio.gather(
+                *(
+                    async_setup_component(hass, domain, config)
+                    for domain in CORE_INTEGRATIONS
+                )
             )
-        )
-    ):
-        _LOGGER.error("Home Assistant core failed to initialize. ")
-        return None
+        ):
+            _LOGGER.error("Home Assistant core failed to initialize. ")
+            return None
 
-    _LOGGER.debug("Home Assistant core initialized")
+        _LOGGER.debug("Home Assistant core initialized")
 
-    core_config = config.get(core.DOMAIN, {})
+        core_config = config.get(core.DOMAIN, {})
 
-    try:
-        await conf_util.async_process_ha_core_config(hass, core_config)
-    except vol.Invalid as config_err:
-        conf_util.async_log_exception(config_err, "homeassistant", core_config, hass)
-        return None
-    except HomeAssistantError:
-        _LOGGER.error(
-            "Home Assistant core failed to initialize. "
-            "Further initialization aborted"
-        )
-        return None
+        try:
+            await conf_util.async_process_ha_core_config(hass, core_config)
+        except vol.Invalid as config_err:
+            conf_util.async_log_exception(
+                config_err, "homeassistant", core_config, hass
+            )
+            return None
+        except HomeAssistantError:
+            _LOGGER.error(
+                "Home Assistant core failed to initialize. "
+                "Further initialization aborted"
+            )
+            return None
 
-    await _async_set_up_integrations(hass, config)
+        await _async_set_up_integrations(hass, config)
+    finally:
+        timeline.async_stop()
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
@@ -446,6 +454,41 @@ async def async_setup_multi_components(
         )
 
 
+@core.callback
+def _async_preload_stages(
+    hass: core.HomeAssistant,
+    integration_cache: dict[str, loader.Integration],
+    stages: list[set[str]],
+    platform_names: set[str],
+) -> list[asyncio.Future[None]]:
+    """Import the modules of each stage in the executor, one stage after another.
+
+    Returns a future for each stage that is done once its modules are imported.
+    """
+    futures: list[asyncio.Future[None]] = [hass.loop.create_future() for _ in stages]
+
+    async def _async_preload() -> None:
+        try:
+            for domains, future in zip(stages, futures):
+                await loader.async_preload_integrations(
+                    hass,
+                    (
+                        integration_cache[domain]
+                        for domain in domains
+                        if domain in integration_cache
+                    ),
+                    platform_names,
+                )
+                future.set_result(None)
+        finally:
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+    hass.async_create_task(_async_preload())
+    return futures
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -457,6 +500,9 @@ async def _async_set_up_integrations(
 
     domains_to_setup = _get_domains(hass, config)
 
+    # Manifests and dependencies are read from the cache when unchanged
+    await loader.async_load_integration_cache(hass)
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start rightaway
     integration_cache: dict[str, loader.Integration] = {}
@@ -496,17 +542,12 @@ async def _async_set_up_integrations(
                 domains_to_setup.add(dep)
                 to_resolve.add(dep)
 
-    _LOGGER.info("Domains to be set up: %s", domains_to_setup)
+    loader.async_schedule_save_integration_cache(hass)
 
-    # Load logging as soon as possible
-    if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
-        _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+    _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
-    # Start up debuggers. Start these first in case they want to wait.
-    if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
-        _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+    logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
+    debuggers = domains_to_setup & DEBUGGER_INTEGRATIONS
 
     # calculate what components to setup in what stage
     stage_1_domains = set()
@@ -531,6 +572,26 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    # Import the integrations of the next stage while the current one is set up
+    preload_logging, preload_stage_1, preload_stage_2 = _async_preload_stages(
+        hass,
+        integration_cache,
+        [logging_domains | debuggers, stage_1_domains, stage_2_domains],
+        domains_to_setup & BASE_PLATFORMS,
+    )
+
+    # Load logging as soon as possible
+    if logging_domains:
+        _LOGGER.info("Setting up logging: %s", logging_domains)
+        await preload_logging
+        await async_setup_multi_components(hass, logging_domains, config)
+
+    # Start up debuggers. Start these first in case they want to wait.
+    if debuggers:
+        _LOGGER.debug("Setting up debuggers: %s", debuggers)
+        await preload_logging
+        await async_setup_multi_components(hass, debuggers, config)
+
     # Load the registries
     await asyncio.gather(
         device_registry.async_load(hass),
@@ -545,6 +606,7 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
+                await preload_stage_1
                 await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
@@ -558,6 +620,7 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
+                await preload_stage_2
                 await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
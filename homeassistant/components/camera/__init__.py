@@ -61,12 +61,17 @@ from .const import (
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
+    DATA_SCALED_IMAGES,
+    DATA_STILL_STREAMS,
     DOMAIN,
+    SCALED_IMAGE_CACHE_TTL,
+    SCALED_IMAGE_MAX_SIZES,
     SERVICE_RECORD,
+    STILL_STREAM_QUEUE_SIZE,
     STREAM_TYPE_HLS,
     STREAM_TYPE_WEB_RTC,
 )
-from .img_util import scale_jpeg_camera_image
+from .img_util import scale_jpeg_camera_image_if_changed
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls
@@ -136,6 +141,89 @@ class Image:
     content: bytes = attr.ib()
 
 
+class ScaledImageCache:
+    """Share scaled snapshots between requests for the same camera and size.
+
+    Concurrent requests share one fetch, and the result is served for a
+    short time to later requests. The last scaled image is kept with the
+    hash of its source for the most recently requested sizes of each
+    camera, so an unchanged snapshot is only scaled once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._pending: dict[tuple[str, int, int], asyncio.Future[Image]] = {}
+        # Key -> image, dropped when it expires
+        self._images: dict[tuple[str, int, int], Image] = {}
+        # Entity id -> size -> hash of the source image, scaled image
+        self._scaled: dict[
+            str, collections.OrderedDict[tuple[int, int], tuple[bytes, bytes]]
+        ] = {}
+
+    async def async_get_image(
+        self, camera: Camera, timeout: int, width: int, height: int
+    ) -> Image:
+        """Return a recent scaled image or fetch and scale one."""
+        key = (camera.entity_id, width, height)
+        if (cached := self._images.get(key)) is not None:
+            return cached
+
+        if (pending := self._pending.get(key)) is None:
+            pending = self._pending[key] = self.hass.async_create_task(
+                self._async_fetch_image(key, camera, timeout, width, height)
+            )
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _async_fetch_image(
+        self,
+        key: tuple[str, int, int],
+        camera: Camera,
+        timeout: int,
+        width: int,
+        height: int,
+    ) -> Image:
+        """Fetch and scale an image."""
+        image = await _async_fetch_image(camera, timeout, width, height)
+        if "jpeg" in image.content_type or "jpg" in image.content_type:
+            scaled_sizes = self._scaled.setdefault(
+                camera.entity_id, collections.OrderedDict()
+            )
+            size = (width, height)
+            source_hash, scaled = await self.hass.async_add_executor_job(
+                scale_jpeg_camera_image_if_changed,
+                image,
+                width,
+                height,
+                scaled_sizes.get(size),
+            )
+            scaled_sizes[size] = (source_hash, scaled)
+            scaled_sizes.move_to_end(size)
+            if len(scaled_sizes) > SCALED_IMAGE_MAX_SIZES:
+                scaled_sizes.popitem(last=False)
+            image = Image(image.content_type, scaled)
+
+        self._images[key] = image
+        self.hass.loop.call_later(
+            SCALED_IMAGE_CACHE_TTL, self._async_expire_image, key, image
+        )
+        return image
+
+    @callback
+    def _async_expire_image(self, key: tuple[str, int, int], image: Image) -> None:
+        """Drop an image once it is no longer served to other requests."""
+        if self._images.get(key) is image:
+            del self._images[key]
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Forget the images of a camera."""
+        for key in [key for key in self._images if key[0] == entity_id]:
+            del self._images[key]
+        self._scaled.pop(entity_id, None)
+
+
 @bind_hass
 async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) -> str:
     """Request a stream for a camera entity."""
@@ -155,8 +243,36 @@ async def _async_get_image(
     the image will be made on a best effort basis.
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
-    are handled.
+    are handled. Scaled images are shared with other
+    requests for the same size.
     """
+    if (
+        width is not None
+        and height is not None
+        and (cache := camera.hass.data.get(DATA_SCALED_IMAGES)) is not None
+    ):
+        return await cache.async_get_image(camera, timeout, width, height)
+
+    image = await _async_fetch_image(camera, timeout, width, height)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in image.content_type or "jpg" in image.content_type)
+    ):
+        _, scaled = await camera.hass.async_add_executor_job(
+            scale_jpeg_camera_image_if_changed, image, width, height, None
+        )
+        return Image(image.content_type, scaled)
+    return image
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image:
+    """Fetch a snapshot image from a camera without scaling it."""
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
             # Calling inspect will be removed in 2022.1 after all
@@ -171,20 +287,7 @@ async def _async_get_image(
                 image_bytes = await camera.async_camera_image()
 
             if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
-                return image
+                return Image(camera.content_type, image_bytes)
 
     raise HomeAssistantError("Unable to get image")
 
@@ -236,19 +339,6 @@ async def async_get_still_stream(
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
 
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
-
     last_image = None
 
     while True:
@@ -257,12 +347,13 @@ async def async_get_still_stream(
             break
 
         if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
+            frame = _mjpeg_frame(content_type, img_bytes)
+            await response.write(frame)
 
             # Chrome seems to always ignore first picture,
             # print it twice.
             if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
+                await response.write(frame)
             last_image = img_bytes
 
         await asyncio.sleep(interval)
@@ -270,6 +361,164 @@ async def async_get_still_stream(
     return response
 
 
+def _mjpeg_frame(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image framed as a part of an MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+class StillStreamBroadcaster:
+    """Poll a camera once for every client of its MJPEG still stream.
+
+    Each client gets a small queue of framed images. A client that can not
+    keep up drops its oldest frames instead of slowing down the others.
+    Polling stops when the last client detaches.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+        on_done: Callable[[], None],
+    ) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self._image_cb = image_cb
+        self._content_type = content_type
+        self._interval = interval
+        self._on_done = on_done
+        self._clients: set[asyncio.Queue[bytes | None]] = set()
+        self._last_frame: bytes | None = None
+        self._task: asyncio.Task | None = None
+        self._done = False
+
+    @callback
+    def async_attach(self) -> asyncio.Queue[bytes | None]:
+        """Attach a client and return the queue its frames are put in."""
+        if self._done:
+            raise RuntimeError("Still stream broadcaster has stopped polling")
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(STILL_STREAM_QUEUE_SIZE)
+        self._clients.add(queue)
+        if self._last_frame is not None:
+            # Chrome seems to always ignore first picture,
+            # print it twice.
+            self._put(queue, self._last_frame)
+            self._put(queue, self._last_frame)
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._async_poll())
+        return queue
+
+    @callback
+    def async_detach(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Detach a client, stopping the polling if it was the last one."""
+        self._clients.discard(queue)
+        if not self._clients and self._task is not None:
+            self._task.cancel()
+            self._async_done()
+
+    @property
+    def done(self) -> bool:
+        """Return if the broadcaster stopped polling."""
+        return self._done
+
+    @callback
+    def _async_done(self) -> None:
+        """Stop accepting clients, new clients get a new broadcaster."""
+        if not self._done:
+            self._done = True
+            self._on_done()
+
+    @staticmethod
+    def _put(queue: asyncio.Queue[bytes | None], frame: bytes | None) -> None:
+        """Put a frame in a queue, dropping the oldest frame when it is full."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+
+    async def _async_poll(self) -> None:
+        """Poll the camera and send changed images to the clients."""
+        last_image = None
+        try:
+            while self._clients:
+                try:
+                    img_bytes = await self._image_cb()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error getting image for still stream")
+                    break
+                if not img_bytes:
+                    break
+
+                if img_bytes != last_image:
+                    frame = _mjpeg_frame(self._content_type, img_bytes)
+                    for queue in self._clients:
+                        if self._last_frame is None:
+                            self._put(queue, frame)
+                        self._put(queue, frame)
+                    self._last_frame = frame
+                    last_image = img_bytes
+
+                await asyncio.sleep(self._interval)
+        finally:
+            self._async_done()
+            # Ends the response of the remaining clients
+            for queue in self._clients:
+                self._put(queue, None)
+
+
+async def async_get_shared_still_stream(
+    request: web.Request, camera: Camera, interval: float
+) -> web.StreamResponse:
+    """Generate an HTTP MJPEG stream from camera images shared between clients.
+
+    This method must be run in the event loop.
+    """
+    broadcasters: dict[tuple[str, float], StillStreamBroadcaster] = camera.hass.data[
+        DATA_STILL_STREAMS
+    ]
+    response = web.StreamResponse()
+    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+    await response.prepare(request)
+
+    # The broadcaster may stop while the response is prepared
+    key = (camera.entity_id, interval)
+    if (broadcaster := broadcasters.get(key)) is None or broadcaster.done:
+        broadcaster = broadcasters[key] = StillStreamBroadcaster(
+            camera.hass,
+            camera.async_camera_image,
+            camera.content_type,
+            interval,
+            partial(_async_remove_broadcaster, broadcasters, key),
+        )
+
+    queue = broadcaster.async_attach()
+    try:
+        while (frame := await queue.get()) is not None:
+            await response.write(frame)
+    finally:
+        broadcaster.async_detach(queue)
+
+    return response
+
+
+@callback
+def _async_remove_broadcaster(
+    broadcasters: dict[tuple[str, float], StillStreamBroadcaster],
+    key: tuple[str, float],
+) -> None:
+    """Forget a broadcaster that stopped polling."""
+    broadcasters.pop(key, None)
+
+
 def _get_camera_from_entity_id(hass: HomeAssistant, entity_id: str) -> Camera:
     """Get camera component from entity_id."""
     component = hass.data.get(DOMAIN)
@@ -297,6 +546,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     prefs = CameraPreferences(hass)
     await prefs.async_initialize()
     hass.data[DATA_CAMERA_PREFS] = prefs
+    hass.data[DATA_SCALED_IMAGES] = ScaledImageCache(hass)
+    hass.data[DATA_STILL_STREAMS] = {}
 
     hass.http.register_view(CameraImageView(component))
     hass.http.register_view(CameraMjpegStream(component))
@@ -497,6 +748,8 @@ class Camera(Entity):
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
+        if DATA_STILL_STREAMS in self.hass.data:
+            return await async_get_shared_still_stream(request, self, interval)
         return await async_get_still_stream(
             request, self.async_camera_image, self.content_type, interval
         )
@@ -584,6 +837,12 @@ class Camera(Entity):
             hashlib.sha256(_RND.getrandbits(256).to_bytes(32, "little")).hexdigest()
         )
 
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Drop the scaled images of the camera when it is removed."""
+        await super().async_internal_will_remove_from_hass()
+        if (cache := self.hass.data.get(DATA_SCALED_IMAGES)) is not None:
+            cache.async_remove(self.entity_id)
+
 
 class CameraView(HomeAssistantView):
     """Base CameraView."""
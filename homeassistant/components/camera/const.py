@@ -4,6 +4,8 @@ from typing import Final
 DOMAIN: Final = "camera"
 
 DATA_CAMERA_PREFS: Final = "camera_prefs"
+DATA_SCALED_IMAGES: Final = "camera_scaled_images"
+DATA_STILL_STREAMS: Final = "camera_still_streams"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 
@@ -14,6 +16,12 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+# How long a scaled image is served to other requests for the same size
+SCALED_IMAGE_CACHE_TTL: Final = 2
+# Sizes of a camera for which the last scaled image is kept
+SCALED_IMAGE_MAX_SIZES: Final = 4
+# Frames queued for a still stream client before older frames are dropped
+STILL_STREAM_QUEUE_SIZE: Final = 2
 
 # A camera that supports CAMERA_SUPPORT_STREAM may have a single stream
 # type which is used to inform the frontend which player to use.
@@ -1,6 +1,7 @@
 """Image processing for cameras."""
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import TYPE_CHECKING, cast
 
@@ -66,6 +67,23 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
     )
 
 
+def scale_jpeg_camera_image_if_changed(
+    cam_image: Image,
+    width: int,
+    height: int,
+    previous: tuple[bytes, bytes] | None,
+) -> tuple[bytes, bytes]:
+    """Scale a camera image unless it matches the previously scaled image.
+
+    Returns the hash of the source image and the scaled image. The previous
+    result is passed in the same form and reused when the hash matches.
+    """
+    source_hash = hashlib.sha1(cam_image.content).digest()
+    if previous is not None and previous[0] == source_hash:
+        return previous
+    return source_hash, scale_jpeg_camera_image(cam_image, width, height)
+
+
 class TurboJPEGSingleton:
     """
     Load TurboJPEG only once.
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
+from functools import partial
 from http import HTTPStatus
 import logging
 import time
@@ -37,6 +38,9 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# The first and last point are always kept when downsampling
+MIN_MAX_POINTS = 3
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -104,6 +108,9 @@ async def async_setup(hass, config):
         ws_get_statistics_during_period
     )
     hass.components.websocket_api.async_register_command(ws_get_list_statistic_ids)
+    hass.components.websocket_api.async_register_command(
+        ws_get_history_columns_during_period
+    )
 
     return True
 
@@ -177,6 +184,58 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_columns_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [cv.entity_id],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=MIN_MAX_POINTS)),
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_columns_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle columnar history websocket command."""
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    start_time = dt_util.parse_datetime(start_time_str)
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        end_time = dt_util.parse_datetime(end_time_str)
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    columns = await hass.async_add_executor_job(
+        partial(
+            history.get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            msg["entity_ids"],
+            include_start_time_state=msg["include_start_time_state"],
+            significant_changes_only=msg["significant_changes_only"],
+            columnar=True,
+            max_points=msg.get("max_points"),
+        )
+    )
+    connection.send_result(msg["id"], list(columns.values()))
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -230,6 +289,17 @@ class HistoryPeriodView(HomeAssistantView):
         )
 
         minimal_response = "minimal_response" in request.query
+        columnar = "columnar" in request.query
+
+        max_points = None
+        max_points_str = request.query.get("max_points")
+        if max_points_str:
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points < MIN_MAX_POINTS:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
 
         hass = request.app["hass"]
 
@@ -251,6 +321,8 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                columnar,
+                max_points,
             ),
         )
 
@@ -263,6 +335,8 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        columnar=False,
+        max_points=None,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -278,6 +352,8 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                columnar,
+                max_points,
             )
 
         result = list(result.values())
@@ -291,7 +367,10 @@ class HistoryPeriodView(HomeAssistantView):
             sorted_result = []
             for order_entity in self.filters.included_entities:
                 for state_list in result:
-                    if state_list[0].entity_id == order_entity:
+                    entity_id = (
+                        state_list.entity_id if columnar else state_list[0].entity_id
+                    )
+                    if entity_id == order_entity:
                         sorted_result.append(state_list)
                         result.remove(state_list)
                         break
@@ -1,21 +1,29 @@
 """Event parser and human readable log generator."""
+from __future__ import annotations
+
 from contextlib import suppress
-from datetime import timedelta
+from datetime import datetime as dt, timedelta
+from functools import partial
 from http import HTTPStatus
 from itertools import groupby
 import json
+import logging
 import re
+from typing import NamedTuple
 
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -28,13 +36,20 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
 )
-from homeassistant.core import DOMAIN as HA_DOMAIN, callback, split_entity_id
+from homeassistant.core import (
+    DOMAIN as HA_DOMAIN,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import InvalidEntityFormatError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
@@ -45,9 +60,12 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
+_LOGGER = logging.getLogger(__name__)
+
 ENTITY_ID_JSON_TEMPLATE = '"entity_id":"{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": ?"([^"]+)"')
 DOMAIN_JSON_EXTRACT = re.compile('"domain": ?"([^"]+)"')
@@ -57,9 +75,16 @@ ATTR_MESSAGE = "message"
 CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
+LOGBOOK_FILTERS = "logbook_filters"
 
 GROUP_BY_MINUTES = 15
 
+# Streamed pages end on whole hours so the grouping by
+# GROUP_BY_MINUTES is the same as for a single query
+STREAM_PAGE_DURATION = timedelta(hours=1)
+# How long the last page waits for the recorder to commit
+STREAM_COMMIT_TIMEOUT = 10
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -80,11 +105,6 @@ ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED = [
     *HOMEASSISTANT_EVENTS,
 ]
 
-ALL_EVENT_TYPES = [
-    EVENT_STATE_CHANGED,
-    *ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED,
-]
-
 EVENT_COLUMNS = [
     Events.event_type,
     Events.event_data,
@@ -159,7 +179,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[LOGBOOK_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    hass.components.websocket_api.async_register_command(ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -256,6 +278,179 @@ class LogbookView(HomeAssistantView):
         return await hass.async_add_executor_job(json_events)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [cv.entity_id],
+    }
+)
+@callback
+def ws_event_stream(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Stream logbook entries in pages, followed by live entries.
+
+    Every page carries a cursor. Entries fired before the cursor have been
+    sent, so a stream can be resumed by passing it as start_time. Live
+    entries are only sent when no end_time is given.
+    """
+    msg_id = msg["id"]
+    utc_now = dt_util.utcnow()
+
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+    start_time = dt_util.as_utc(start_time)
+
+    end_time = None
+    if end_time_str := msg.get("end_time"):
+        end_time = dt_util.parse_datetime(end_time_str)
+        if end_time is None:
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+        end_time = dt_util.as_utc(end_time)
+
+    entity_ids = msg.get("entity_ids")
+    filters, entities_filter = hass.data[LOGBOOK_FILTERS]
+    if entity_ids is not None:
+        filters = None
+        entities_filter = generate_filter([], entity_ids, [], [])
+
+    entity_attr_cache = EntityAttributeCache(hass)
+    context_lookup = {None: None}
+    # Live events are held back until all pages have been sent since
+    # the context lookup is shared with the executor
+    pending_events: list[LazyEventPartialState] | None = []
+    unsubs = []
+
+    @callback
+    def _send_live_events(lazy_events):
+        """Humanify live events and send them."""
+        events = []
+        for lazy_event in lazy_events:
+            context_lookup.setdefault(lazy_event.context_id, lazy_event)
+            if lazy_event.event_type == EVENT_CALL_SERVICE:
+                continue
+            if lazy_event.event_type == EVENT_STATE_CHANGED:
+                if entities_filter is None or entities_filter(lazy_event.entity_id):
+                    events.append(lazy_event)
+            elif _keep_event(hass, lazy_event, entities_filter):
+                events.append(lazy_event)
+
+        if entries := list(
+            humanify(hass, events, entity_attr_cache, context_lookup)
+        ):
+            cursor = lazy_events[-1].time_fired + timedelta(microseconds=1)
+            connection.send_message(
+                websocket_api.event_message(
+                    msg_id, {"events": entries, "cursor": cursor.isoformat()}
+                )
+            )
+
+    @callback
+    def _forward_event(event: Event) -> None:
+        """Queue or send a fired event."""
+        if (row := _row_from_event(event)) is None:
+            return
+        lazy_event = LazyEventPartialState(row)
+        if pending_events is not None:
+            pending_events.append(lazy_event)
+            return
+        _send_live_events([lazy_event])
+
+    async def _async_send_pages():
+        """Send the recorded entries page by page."""
+        nonlocal pending_events
+        history_end = min(end_time, utc_now) if end_time else utc_now
+        page_start = start_time
+        while True:
+            page_end = min(
+                page_start.replace(minute=0, second=0, microsecond=0)
+                + STREAM_PAGE_DURATION,
+                history_end,
+            )
+            if (
+                page_end == utc_now
+                and DATA_INSTANCE in hass.data
+                # Events fired since the last commit of the recorder are
+                # neither in the database nor in the live events
+                and not await hass.data[DATA_INSTANCE].async_commit(
+                    STREAM_COMMIT_TIMEOUT
+                )
+            ):
+                _LOGGER.debug(
+                    "The recorder did not commit, entries fired just before "
+                    "the logbook stream started may be missing"
+                )
+            entries = await hass.async_add_executor_job(
+                partial(
+                    _get_events,
+                    hass,
+                    page_start,
+                    page_end,
+                    entity_ids,
+                    filters,
+                    entities_filter,
+                    entity_attr_cache=entity_attr_cache,
+                    context_lookup=context_lookup,
+                )
+            )
+            connection.send_message(
+                websocket_api.event_message(
+                    msg_id,
+                    {
+                        "events": entries,
+                        "cursor": page_end.isoformat(),
+                        "partial": page_end < history_end,
+                    },
+                )
+            )
+            if page_end >= history_end:
+                break
+            page_start = page_end
+
+        events, pending_events = pending_events, None
+        if events:
+            _send_live_events(events)
+
+    async def _async_send_pages_or_error():
+        """Send the recorded entries, stop streaming if that fails."""
+        nonlocal pending_events
+        try:
+            await _async_send_pages()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Error sending the logbook entries")
+            pending_events = None
+            for unsub in unsubs:
+                unsub()
+            unsubs.clear()
+            connection.send_error(msg_id, websocket_api.ERR_UNKNOWN_ERROR, str(err))
+
+    if end_time is None:
+        event_types = {
+            EVENT_STATE_CHANGED,
+            *ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED,
+            *hass.data.get(DOMAIN, {}),
+        }
+        for event_type in event_types:
+            unsubs.append(hass.bus.async_listen(event_type, _forward_event))
+
+    task = hass.async_create_task(_async_send_pages_or_error())
+
+    @callback
+    def _unsub():
+        """Stop streaming."""
+        for unsub in unsubs:
+            unsub()
+        task.cancel()
+
+    connection.subscriptions[msg_id] = _unsub
+    connection.send_result(msg_id)
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -419,14 +614,22 @@ def _get_events(
     entities_filter=None,
     entity_matches_only=False,
     context_id=None,
+    entity_attr_cache=None,
+    context_lookup=None,
 ):
-    """Get events for a period of time."""
+    """Get events for a period of time.
+
+    The attribute cache and context lookup can be passed in to share
+    them between consecutive periods.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
-    entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
+    if entity_attr_cache is None:
+        entity_attr_cache = EntityAttributeCache(hass)
+    if context_lookup is None:
+        context_lookup = {None: None}
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
@@ -463,21 +666,22 @@ def _get_events(
                 )
             )
         else:
-            query = _generate_events_query(session)
+            query = _generate_events_query_without_states(session)
             query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
+            query = _apply_event_types_filter(
+                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+            )
+            states_query = _generate_states_query(
+                session, start_day, end_day, old_state
             )
             if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+                states_query = states_query.filter(filters.entity_filter())
 
             if context_id is not None:
                 query = query.filter(Events.context_id == context_id)
+                states_query = states_query.filter(States.context_id == context_id)
+
+            query = query.union_all(states_query)
 
         query = query.order_by(Events.time_fired)
 
@@ -486,16 +690,67 @@ def _get_events(
         )
 
 
-def _generate_events_query(session):
-    return session.query(
-        *EVENT_COLUMNS,
-        States.state,
-        States.entity_id,
-        States.domain,
-        States.attributes,
+def _row_from_event(event):
+    """Return a row like the logbook query returns for a fired event.
+
+    None is returned for state changes the query would filter out.
+    """
+    if event.event_type != EVENT_STATE_CHANGED:
+        return _LiveRow(
+            event.event_type,
+            json.dumps(event.data, cls=JSONEncoder),
+            event.time_fired,
+            event.context.id,
+            event.context.user_id,
+            event.context.parent_id,
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+
+    new_state = event.data.get("new_state")
+    old_state = event.data.get("old_state")
+    if new_state is None or old_state is None or new_state.state == old_state.state:
+        return None
+    if (
+        new_state.domain in CONTINUOUS_DOMAINS
+        and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+    ):
+        return None
+
+    return _LiveRow(
+        EVENT_STATE_CHANGED,
+        EMPTY_JSON_OBJECT,
+        new_state.last_updated,
+        new_state.context.id,
+        new_state.context.user_id,
+        new_state.context.parent_id,
+        new_state.state,
+        new_state.entity_id,
+        new_state.domain,
+        None,
+        json.dumps(dict(new_state.attributes), cls=JSONEncoder),
     )
 
 
+class _LiveRow(NamedTuple):
+    """A fired event with the columns of the logbook query."""
+
+    event_type: str
+    event_data: str
+    time_fired: dt
+    context_id: str | None
+    context_user_id: str | None
+    context_parent_id: str | None
+    state: str | None
+    entity_id: str | None
+    domain: str | None
+    attributes: str | None
+    shared_attrs: str | None
+
+
 def _generate_events_query_without_states(session):
     return session.query(
         *EVENT_COLUMNS,
@@ -503,37 +758,43 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
-def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
-    return (
-        _generate_events_query(session)
-        .outerjoin(Events, (States.event_id == Events.event_id))
-        .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-        .filter(_missing_state_matcher(old_state))
-        .filter(_continuous_entity_matcher())
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .filter(
-            (States.last_updated == States.last_changed)
-            & States.entity_id.in_(entity_ids)
+def _generate_states_query(session, start_day, end_day, old_state, entity_ids=None):
+    # State changes are not stored in the events table, the columns of
+    # the events query are generated from the states instead
+    query = (
+        session.query(
+            literal(value=EVENT_STATE_CHANGED, type_=sqlalchemy.String).label(
+                "event_type"
+            ),
+            literal(value=EMPTY_JSON_OBJECT, type_=sqlalchemy.Text).label(
+                "event_data"
+            ),
+            States.last_updated.label("time_fired"),
+            States.context_id.label("context_id"),
+            States.context_user_id.label("context_user_id"),
+            States.context_parent_id.label("context_parent_id"),
+            States.state,
+            States.entity_id,
+            States.domain,
+            States.attributes,
+            StateAttributes.shared_attrs,
         )
-    )
-
-
-def _apply_events_types_and_states_filter(hass, query, old_state):
-    events_query = (
-        query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-        .filter(
-            (Events.event_type != EVENT_STATE_CHANGED)
-            | _missing_state_matcher(old_state)
-        )
-        .filter(
-            (Events.event_type != EVENT_STATE_CHANGED) | _continuous_entity_matcher()
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
         )
+        .filter(_missing_state_matcher(old_state))
+        .filter(_continuous_entity_matcher())
+        .filter((States.last_updated >= start_day) & (States.last_updated < end_day))
+        .filter(States.last_updated == States.last_changed)
     )
-    return _apply_event_types_filter(hass, events_query, ALL_EVENT_TYPES)
+    if entity_ids is not None:
+        query = query.filter(States.entity_id.in_(entity_ids))
+    return query
 
 
 def _missing_state_matcher(old_state):
@@ -555,12 +816,15 @@ def _continuous_entity_matcher():
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
         sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            StateAttributes.shared_attrs.contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
 def _apply_event_time_filter(events_query, start_day, end_day):
     return events_query.filter(
-        (Events.time_fired > start_day) & (Events.time_fired < end_day)
+        (Events.time_fired >= start_day) & (Events.time_fired < end_day)
     )
 
 
@@ -714,7 +978,7 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(self._attributes_json or EMPTY_JSON_OBJECT)
         return result and result.group(1)
 
     @property
@@ -735,17 +999,24 @@ class LazyEventPartialState:
         result = DOMAIN_JSON_EXTRACT.search(self._row.event_data)
         return result and result.group(1)
 
+    @property
+    def _attributes_json(self):
+        """Return the json encoded state attributes.
+
+        States recorded since schema version 23 store them in the
+        shared state_attributes table.
+        """
+        return self._row.shared_attrs or self._row.attributes
+
     @property
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            attributes_json = self._attributes_json
+            if attributes_json is None or attributes_json == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(attributes_json)
         return self._attributes
 
     @property
@@ -758,6 +1029,11 @@ class LazyEventPartialState:
                 self._event_data = json.loads(self._row.event_data)
         return self._event_data
 
+    @property
+    def time_fired(self):
+        """Time event was fired."""
+        return self._row.time_fired
+
     @property
     def time_fired_isoformat(self):
         """Time event was fired in utc isoformat."""
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import Any, Awaitable, Callable, Union, cast
 import uuid
@@ -546,7 +547,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -564,12 +564,19 @@ class MQTT:
         """Initialize Home Assistant MQTT client."""
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
-        import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        # A topic trie of all subscriptions, the values are lists of subscriptions
+        self._matcher = MQTTMatcher()
+        # Messages received by paho which are not yet handled in the event loop
+        self._pending_messages: list[mqtt.MQTTMessage] = []
+        self._pending_messages_lock = threading.Lock()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -745,11 +752,12 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        try:
+            self._matcher[topic].append(subscription)
+        except KeyError:
+            self._matcher[topic] = [subscription]
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -762,11 +770,13 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            topic_subscriptions = self._matcher[topic]
+            topic_subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
+            del self._matcher[topic]
 
             # Only unsubscribe if currently connected.
             if self.connected:
@@ -852,16 +862,33 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are handed to the event loop in batches, a new batch is only
+        scheduled when the previous one has been picked up.
+        """
+        with self._pending_messages_lock:
+            self._pending_messages.append(msg)
+            if len(self._pending_messages) > 1:
+                return
+        self.hass.add_job(self._mqtt_handle_pending_messages)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    @callback
+    def _mqtt_handle_pending_messages(self) -> None:
+        """Handle the messages received since the last batch."""
+        with self._pending_messages_lock:
+            messages = self._pending_messages
+            self._pending_messages = []
+        for msg in messages:
+            self._mqtt_handle_message(msg)
+
+    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        return [
+            subscription
+            for subscriptions in self._matcher.iter_match(topic)
+            for subscription in subscriptions
+        ]
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -973,16 +1000,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
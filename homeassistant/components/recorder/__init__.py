@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 import concurrent.futures
 from datetime import datetime, timedelta
@@ -12,7 +13,16 @@ import threading
 import time
 from typing import Any, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
+from sqlalchemy import (
+    bindparam,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
@@ -51,16 +61,24 @@ from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics, websocket_api
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DOMAIN,
+    SQLITE_MAX_BIND_VARS,
+    SQLITE_URL_PREFIX,
+)
 from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
 )
 from .pool import RecorderPool
+from .spill import SpillBuffer
 from .util import (
     dburl_to_path,
     end_incomplete_runs,
@@ -84,6 +102,12 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 MAX_QUEUE_BACKLOG = 30000
 
+# Events are spilled to disk instead of queued once the queue
+# holds this many items, until the spilled events are recorded
+SPILL_QUEUE_BACKLOG = 10000
+SPILL_MAX_BYTES = 256 * 1024 * 1024
+SPILL_REPLAY_BATCH_SIZE = 1000
+
 SERVICE_PURGE_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_KEEP_DAYS): cv.positive_int,
@@ -108,6 +132,7 @@ SERVICE_DISABLE_SCHEMA = vol.Schema({})
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
+DEFAULT_SPILL_FILE = "home-assistant_v2.spill"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
@@ -118,6 +143,10 @@ KEEPALIVE_TIME = 30
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of attribute ids to keep in memory so
+# we do not have to look them up in the database
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -260,6 +289,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_t=exclude_t,
     )
+    await instance.spill_buffer.async_load()
     instance.async_initialize()
     instance.start()
     _async_register_services(hass, instance)
@@ -365,6 +395,23 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class SpillReplayTask:
+    """An object to insert into the recorder queue to record spilled events."""
+
+
+class CommitTask(NamedTuple):
+    """Object to commit the queued events and resolve a future when done."""
+
+    future: asyncio.Future
+
+
+@callback
+def _async_set_future_done(future: asyncio.Future) -> None:
+    """Resolve a future unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -388,6 +435,10 @@ class Recorder(threading.Thread):
         self.keep_days = keep_days
         self.commit_interval = commit_interval
         self.queue: Any = queue.SimpleQueue()
+        self.spill_buffer = SpillBuffer(
+            hass, hass.config.path(DEFAULT_SPILL_FILE), SPILL_MAX_BYTES
+        )
+        self.last_event_time_fired: datetime | None = None
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -404,8 +455,11 @@ class Recorder(threading.Thread):
         self._timechanges_seen = 0
         self._commits_without_expire = 0
         self._keepalive_count = 0
-        self._old_states: dict[str, States] = {}
-        self._pending_expunge: list[States] = []
+        self._old_states: dict[str, int] = {}
+        self._pending_events: list[dict[str, Any]] = []
+        # The States rows with their shared attributes
+        self._pending_states: list[tuple[dict[str, Any], str | None]] = []
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -424,7 +478,10 @@ class Recorder(threading.Thread):
     def async_initialize(self):
         """Initialize the recorder."""
         self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
+            MATCH_ALL,
+            self.event_listener,
+            event_filter=self._async_event_filter,
+            exclude_event_types=self.exclude_t,
         )
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
@@ -458,10 +515,10 @@ class Recorder(threading.Thread):
 
     @callback
     def _async_event_filter(self, event) -> bool:
-        """Filter events."""
-        if event.event_type in self.exclude_t:
-            return False
+        """Filter events.
 
+        Excluded event types are not dispatched to the recorder by the bus.
+        """
         entity_id = event.data.get(ATTR_ENTITY_ID)
 
         if entity_id is None:
@@ -668,7 +725,11 @@ class Recorder(threading.Thread):
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
-        while event := self.queue.get():
+        while True:
+            if self.spill_buffer.pending_bytes and self.queue.empty():
+                self._replay_spill_buffer()
+            if not (event := self.queue.get()):
+                break
             try:
                 self._process_one_event_or_recover(event)
             except Exception as err:  # pylint: disable=broad-except
@@ -676,6 +737,27 @@ class Recorder(threading.Thread):
 
         self._shutdown()
 
+    def _replay_spill_buffer(self):
+        """Record the events that were spilled to disk."""
+        while events := self.spill_buffer.read_batch(SPILL_REPLAY_BATCH_SIZE):
+            for event in events:
+                try:
+                    self._process_one_event_or_recover(event)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while processing event %s: %s", event, err
+                    )
+            self._commit_event_session_or_retry()
+            self.spill_buffer.mark_recorded()
+        self.hass.add_job(self._async_finish_spill_replay)
+
+    @callback
+    def _async_finish_spill_replay(self):
+        """Queue new events again once the spill buffer is recorded."""
+        if not self.spill_buffer.async_deactivate():
+            # Events were spilled while the buffer was replayed
+            self.queue.put(SpillReplayTask())
+
     def _process_one_event_or_recover(self, event):
         """Process an event, reconnect, or recover a malformed database."""
         try:
@@ -795,9 +877,24 @@ class Recorder(threading.Thread):
                 self, event.statistic_id, event.unit_of_measurement
             )
             return
+        if isinstance(event, SpillReplayTask):
+            self._replay_spill_buffer()
+            return
         if isinstance(event, WaitTask):
+            if self.spill_buffer.pending_bytes:
+                self._replay_spill_buffer()
             self._queue_watch.set()
             return
+        if isinstance(event, CommitTask):
+            try:
+                if self.spill_buffer.pending_bytes:
+                    self._replay_spill_buffer()
+                self._commit_event_session_or_retry()
+            finally:
+                self.hass.loop.call_soon_threadsafe(
+                    _async_set_future_done, event.future
+                )
+            return
         if event.event_type == EVENT_TIME_CHANGED:
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
@@ -810,43 +907,36 @@ class Recorder(threading.Thread):
                     self._commit_event_session_or_retry()
             return
 
-        if not self.enabled:
-            return
+        self.last_event_time_fired = event.time_fired
 
-        try:
-            if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
-            else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
-        except (TypeError, ValueError):
-            _LOGGER.warning("Event is not JSON serializable: %s", event)
+        if not self.enabled:
             return
 
         if event.event_type == EVENT_STATE_CHANGED:
+            # The context of a state change is stored with the state
+            # so there is no need for an event row
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                state_row = States.row_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+            else:
+                # The attributes are stored in the shared state_attributes table
+                shared_attrs = state_row.pop("attributes")
+                if not event.data.get("new_state"):
+                    state_row["state"] = None
+                state_row["created"] = event.time_fired
+                self._pending_states.append((state_row, shared_attrs))
+        else:
+            try:
+                event_row = Events.row_from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                return
+            event_row["created"] = event.time_fired
+            self._pending_events.append(event_row)
 
         # If they do not have a commit interval
         # than we commit right away
@@ -865,7 +955,12 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_events
+            and not self._pending_states
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -888,16 +983,19 @@ class Recorder(threading.Thread):
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        old_states, attributes_ids = self._write_pending_rows()
         self.event_session.commit()
 
+        self._pending_events = []
+        self._pending_states = []
+        for entity_id, state_id in old_states.items():
+            if state_id is None:
+                self._old_states.pop(entity_id, None)
+            else:
+                self._old_states[entity_id] = state_id
+        for shared_attrs, attributes_id in attributes_ids.items():
+            self._cache_attributes_id(shared_attrs, attributes_id)
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -905,6 +1003,146 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _write_pending_rows(
+        self,
+    ) -> tuple[dict[str, int | None], dict[str, int]]:
+        """Write the buffered event and state rows in bulk.
+
+        All events are written with one multi-row insert, and so are all
+        states. The state_id of the inserted states are looked up with one
+        query. The old_state_id of a state which follows another state of the
+        same entity in the commit is only known then, it is set with one
+        multi-row update.
+
+        Returns the state_id of the newest row written for each entity,
+        or None if the entity was removed, so the old_state_id of the
+        next state can be resolved once the commit succeeds. Also returns
+        the attributes_id of every shared attributes row that was used.
+
+        The buffered state rows are copied before the generated ids are
+        filled in so they can be written again if the commit has to be
+        retried.
+        """
+        session = self.event_session
+        if self._pending_events:
+            session.execute(insert(Events), self._pending_events)
+
+        if not self._pending_states:
+            return {}, {}
+
+        attributes_ids = self._write_state_attributes(
+            {shared_attrs for _, shared_attrs in self._pending_states}
+        )
+        state_rows: list[dict[str, Any]] = []
+        entity_ids: set[str] = set()
+        for pending_row, shared_attrs in self._pending_states:
+            state_row = dict(pending_row)
+            entity_id = state_row["entity_id"]
+            state_row["attributes_id"] = attributes_ids[shared_attrs]
+            # The old state of a later state of an entity is set below
+            state_row["old_state_id"] = (
+                None if entity_id in entity_ids else self._old_states.get(entity_id)
+            )
+            entity_ids.add(entity_id)
+            state_rows.append(state_row)
+
+        last_state_id = session.query(func.max(States.state_id)).scalar() or 0
+        session.execute(insert(States), state_rows)
+
+        # The state_id of the states of an entity increase in insert order
+        state_ids: dict[str, list[int]] = {}
+        for entity_id, state_id in (
+            session.query(States.entity_id, States.state_id)
+            .filter(States.state_id > last_state_id)
+            .order_by(States.state_id)
+        ):
+            state_ids.setdefault(entity_id, []).append(state_id)
+
+        old_states: dict[str, int | None] = {}
+        old_state_ids: list[dict[str, int]] = []
+        for state_row in state_rows:
+            entity_id = state_row["entity_id"]
+            state_id = state_ids[entity_id].pop(0)
+            if (old_state_id := old_states.get(entity_id)) is not None:
+                old_state_ids.append(
+                    {"b_state_id": state_id, "b_old_state_id": old_state_id}
+                )
+            old_states[entity_id] = None if state_row["state"] is None else state_id
+        if old_state_ids:
+            session.execute(
+                update(States)
+                .where(States.state_id == bindparam("b_state_id"))
+                .values(old_state_id=bindparam("b_old_state_id"))
+                .execution_options(synchronize_session=False),
+                old_state_ids,
+            )
+
+        return old_states, attributes_ids
+
+    def _write_state_attributes(self, shared_attrs_set: set[str]) -> dict[str, int]:
+        """Find or insert the state_attributes rows for the shared attributes.
+
+        The attributes_id of recently used attributes are kept in memory,
+        the rest are looked up by hash in the database and only attributes
+        that have never been seen before are inserted.
+        """
+        attributes_ids: dict[str, int] = {}
+        missing: dict[str, int] = {}
+        for shared_attrs in shared_attrs_set:
+            if (attributes_id := self._state_attributes_ids.get(shared_attrs)) is None:
+                missing[shared_attrs] = StateAttributes.hash_shared_attrs(shared_attrs)
+            else:
+                attributes_ids[shared_attrs] = attributes_id
+
+        if not missing:
+            return attributes_ids
+
+        self._find_state_attributes(missing, attributes_ids)
+        if missing:
+            self.event_session.execute(
+                insert(StateAttributes),
+                [
+                    {"hash": attributes_hash, "shared_attrs": shared_attrs}
+                    for shared_attrs, attributes_hash in missing.items()
+                ],
+            )
+            # Look up the attributes_id of the inserted rows
+            self._find_state_attributes(missing, attributes_ids)
+
+        return attributes_ids
+
+    def _find_state_attributes(
+        self, missing: dict[str, int], attributes_ids: dict[str, int]
+    ) -> None:
+        """Look up the attributes_id of shared attributes by hash.
+
+        The attributes that are found are moved from missing to
+        attributes_ids.
+        """
+        session = self.event_session
+        hashes = list(set(missing.values()))
+        for offset in range(0, len(hashes), SQLITE_MAX_BIND_VARS):
+            query = session.query(
+                StateAttributes.attributes_id, StateAttributes.shared_attrs
+            ).filter(
+                StateAttributes.hash.in_(hashes[offset : offset + SQLITE_MAX_BIND_VARS])
+            )
+            for attributes_id, shared_attrs in query:
+                # Hashes can collide so the attributes are compared as well
+                if shared_attrs in missing:
+                    attributes_ids[shared_attrs] = attributes_id
+                    del missing[shared_attrs]
+
+    def _cache_attributes_id(self, shared_attrs: str, attributes_id: int) -> None:
+        """Remember the attributes_id of shared attributes.
+
+        The least recently used entry is evicted when the cache is full.
+        """
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        self._state_attributes_ids.move_to_end(shared_attrs)
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -916,6 +1154,9 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids = OrderedDict()
+        self._pending_events = []
+        self._pending_states = []
 
         if not self.event_session:
             return
@@ -945,9 +1186,50 @@ class Recorder(threading.Thread):
 
     @callback
     def event_listener(self, event):
-        """Listen for new events and put them in the process queue."""
+        """Listen for new events and put them in the process queue.
+
+        Once the queue is backlogged, events are spilled to disk until the
+        recorder has caught up. Time changed events keep driving the commits
+        and are never spilled.
+        """
+        if event.event_type != EVENT_TIME_CHANGED and (
+            self.spill_buffer.active or self.queue.qsize() >= SPILL_QUEUE_BACKLOG
+        ):
+            self.spill_buffer.async_append(event)
+            return
         self.queue.put(event)
 
+    @callback
+    def async_lag(self) -> float:
+        """Return how many seconds the recorder is behind the event bus."""
+        if self.last_event_time_fired is None or not (
+            self.queue.qsize() or self.spill_buffer.pending_bytes
+        ):
+            return 0
+        return (dt_util.utcnow() - self.last_event_time_fired).total_seconds()
+
+    async def async_commit(self, timeout: float) -> bool:
+        """Wait until the events fired before the call are in the database.
+
+        The events spilled to disk are recorded first. Returns False without
+        waiting if the recorder is not recording, for example while it
+        migrates the database, and if the commit did not finish in time or
+        the spill buffer dropped events.
+        """
+        if not (
+            self.async_recorder_ready.is_set()
+            and self._event_listener is not None
+            and self.is_alive()
+        ):
+            return False
+        future = self.hass.loop.create_future()
+        self.queue.put(CommitTask(future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        return not self.spill_buffer.dropped_events
+
     def block_till_done(self):
         """Block till all events processed.
 
@@ -1060,5 +1342,7 @@ class Recorder(threading.Thread):
     def _shutdown(self):
         """Save end time for current run."""
         self.hass.add_job(self._async_stop_queue_watcher_and_event_listener)
+        # Spilled events that were not recorded are replayed on the next start
+        self.spill_buffer.flush()
         self._end_session()
         self._close_connection()
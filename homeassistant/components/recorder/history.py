@@ -1,9 +1,12 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from itertools import groupby
+import json
 import logging
+import math
 import time
 
 from sqlalchemy import and_, bindparam, func
@@ -11,7 +14,9 @@ from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import execute, session_scope
@@ -48,6 +53,7 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
@@ -55,6 +61,74 @@ QUERY_STATES = [
 HISTORY_BAKERY = "recorder_history_bakery"
 
 
+class HistoryColumns:
+    """Columnar history of a single entity.
+
+    Timestamps and numeric state values are stored in contiguous float64
+    arrays which can be wrapped without copying, e.g. with numpy.frombuffer.
+    Attributes are kept as the raw JSON from the database and only decoded
+    when requested.
+    """
+
+    __slots__ = (
+        "entity_id",
+        "last_changed",
+        "last_updated",
+        "states",
+        "values",
+        "_attributes",
+    )
+
+    def __init__(self, entity_id: str) -> None:
+        """Initialize the columns."""
+        self.entity_id = entity_id
+        self.last_changed = array("d")
+        self.last_updated = array("d")
+        self.states: list[str] = []
+        self.values = array("d")
+        self._attributes: list[str | None] = []
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.states)
+
+    def append(self, state, last_changed, last_updated, attributes) -> None:
+        """Append a row, timestamps are POSIX timestamps."""
+        self.states.append(state)
+        try:
+            self.values.append(float(state))
+        except (TypeError, ValueError):
+            self.values.append(math.nan)
+        self.last_changed.append(last_changed)
+        self.last_updated.append(last_updated)
+        self._attributes.append(attributes)
+
+    def attributes(self, index: int) -> dict:
+        """Decode the attributes of a single row."""
+        try:
+            return json.loads(self._attributes[index] or "{}")
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes")
+            return {}
+
+    def as_dict(self) -> dict:
+        """Return a compact JSON representation.
+
+        Finite numeric states are sent as numbers, all other states as strings
+        as JSON has no infinity or NaN.
+        """
+        return {
+            "entity_id": self.entity_id,
+            "lc": self.last_changed.tolist(),
+            "lu": self.last_updated.tolist(),
+            "s": [
+                value if math.isfinite(value) else state
+                for state, value in zip(self.states, self.values)
+            ],
+        }
+
+
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
@@ -76,12 +150,21 @@ def get_significant_states_with_session(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    columnar=False,
+    max_points=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
 
     entity_ids is an optional iterable of entities to include in the results.
 
+    If columnar is set, a HistoryColumns instance is returned for each entity
+    instead of a list of states.
+
+    If max_points is set, the numeric states of each entity are downsampled
+    to at most max_points rows with the largest-triangle-three-buckets
+    algorithm. Non numeric states are always returned.
+
     filters is an optional SQLAlchemy filter which will be applied to the database
     queries unless entity_ids is given, in which case its ignored.
 
@@ -92,7 +175,9 @@ def get_significant_states_with_session(
     timer_start = time.perf_counter()
 
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*QUERY_STATES).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
     )
 
     if significant_changes_only:
@@ -130,6 +215,18 @@ def get_significant_states_with_session(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("get_significant_states took %fs", elapsed)
 
+    if columnar:
+        return _sorted_states_to_columns(
+            hass,
+            session,
+            states,
+            start_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            max_points,
+        )
+
     return _sorted_states_to_dict(
         hass,
         session,
@@ -139,6 +236,7 @@ def get_significant_states_with_session(
         filters,
         include_start_time_state,
         minimal_response,
+        max_points,
     )
 
 
@@ -146,7 +244,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*QUERY_STATES).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
         )
 
         baked_query += lambda q: q.filter(
@@ -182,7 +282,9 @@ def get_last_state_changes(hass, number_of_states, entity_id):
 
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*QUERY_STATES).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
         )
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
@@ -233,8 +335,20 @@ def _get_states_with_session(
     hass, session, utc_point_in_time, entity_ids=None, run=None, filters=None
 ):
     """Return the states at a specific point in time."""
+    return [
+        LazyState(row)
+        for row in _get_rows_with_session(
+            hass, session, utc_point_in_time, entity_ids, run, filters
+        )
+    ]
+
+
+def _get_rows_with_session(
+    hass, session, utc_point_in_time, entity_ids=None, run=None, filters=None
+):
+    """Return the database rows of the states at a specific point in time."""
     if entity_ids and len(entity_ids) == 1:
-        return _get_single_entity_states_with_session(
+        return _get_single_entity_rows_with_session(
             hass, session, utc_point_in_time, entity_ids[0]
         )
 
@@ -247,7 +361,9 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -306,14 +422,16 @@ def _get_states_with_session(
         if filters:
             query = filters.apply(query)
 
-    return [LazyState(row) for row in execute(query)]
+    return execute(query)
 
 
-def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
+def _get_single_entity_rows_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*QUERY_STATES).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
     )
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
@@ -326,7 +444,7 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
         utc_point_in_time=utc_point_in_time, entity_id=entity_id
     )
 
-    return [LazyState(row) for row in execute(query)]
+    return execute(query)
 
 
 def _sorted_states_to_dict(
@@ -338,6 +456,7 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    max_points=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -377,6 +496,8 @@ def _sorted_states_to_dict(
 
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
+        if max_points:
+            group = iter(_downsample_rows(list(group), max_points))
         domain = split_entity_id(ent_id)[0]
         ent_results = result[ent_id]
         if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
@@ -418,6 +539,142 @@ def _sorted_states_to_dict(
     return {key: val for key, val in result.items() if val}
 
 
+def _sorted_states_to_columns(
+    hass,
+    session,
+    states,
+    start_time,
+    entity_ids,
+    filters=None,
+    include_start_time_state=True,
+    max_points=None,
+):
+    """Convert SQL results into a HistoryColumns instance per entity.
+
+    States must be sorted by entity_id and last_updated.
+
+    Unlike _sorted_states_to_dict no State object is created for the rows.
+    """
+    result: dict[str, HistoryColumns] = {}
+    if entity_ids is not None:
+        for ent_id in entity_ids:
+            result[ent_id] = HistoryColumns(ent_id)
+
+    if include_start_time_state:
+        start_timestamp = start_time.timestamp()
+        run = recorder.run_information_from_instance(hass, start_time)
+        for row in _get_rows_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            if (columns := result.get(row.entity_id)) is None:
+                columns = result[row.entity_id] = HistoryColumns(row.entity_id)
+            columns.append(
+                row.state,
+                start_timestamp,
+                start_timestamp,
+                row.shared_attrs or row.attributes,
+            )
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp = process_timestamp
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        if (columns := result.get(ent_id)) is None:
+            columns = result[ent_id] = HistoryColumns(ent_id)
+        if max_points:
+            group = _downsample_rows(list(group), max_points)
+        append = columns.append
+        for row in group:
+            append(
+                row.state,
+                _process_timestamp(row.last_changed).timestamp(),
+                _process_timestamp(row.last_updated).timestamp(),
+                row.shared_attrs or row.attributes,
+            )
+
+    # Filter out the entities without any rows
+    return {key: val for key, val in result.items() if val}
+
+
+def _downsample_rows(rows, max_points):
+    """Downsample the numeric rows of a single entity.
+
+    Rows with a non numeric state, e.g. unavailable, are always kept.
+    """
+    numeric_indexes = []
+    values = []
+    for index, row in enumerate(rows):
+        try:
+            value = float(row.state)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(value):
+            numeric_indexes.append(index)
+            values.append(value)
+
+    if len(numeric_indexes) <= max_points:
+        return rows
+
+    timestamps = [
+        process_timestamp(rows[index].last_updated).timestamp()
+        for index in numeric_indexes
+    ]
+    keep = {
+        numeric_indexes[index]
+        for index in _largest_triangle_three_buckets(timestamps, values, max_points)
+    }
+    numeric = set(numeric_indexes)
+    return [
+        row
+        for index, row in enumerate(rows)
+        if index in keep or index not in numeric
+    ]
+
+
+def _largest_triangle_three_buckets(x, y, threshold):
+    """Return the indexes of the points selected by LTTB.
+
+    The first and last points are always selected, the others are split
+    into threshold - 2 buckets from which the point forming the largest
+    triangle with the previous selected point and the average of the next
+    bucket is selected.
+    """
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return list(range(length))
+
+    every = (length - 2) / (threshold - 2)
+    selected = 0
+    indexes = [0]
+
+    for bucket in range(threshold - 2):
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, length)
+        avg_length = avg_end - avg_start
+        avg_x = sum(x[avg_start:avg_end]) / avg_length
+        avg_y = sum(y[avg_start:avg_end]) / avg_length
+
+        point_x = x[selected]
+        point_y = y[selected]
+        max_area = -1.0
+        next_selected = range_start = int(bucket * every) + 1
+        for index in range(range_start, avg_start):
+            area = abs(
+                (point_x - avg_x) * (y[index] - point_y)
+                - (point_x - x[index]) * (avg_y - point_y)
+            )
+            if area > max_area:
+                max_area = area
+                next_selected = index
+
+        indexes.append(next_selected)
+        selected = next_selected
+
+    indexes.append(length - 1)
+    return indexes
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -29,6 +29,10 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# The states of this many state_ids are updated per commit when the context
+# is copied from the events
+CONTEXT_BACKFILL_BATCH_SIZE = 10000
+
 
 def raise_if_exception_missing_str(ex, match_substrs):
     """Raise an exception if the exception and cause do not contain the match substrs."""
@@ -204,7 +208,7 @@ def _add_columns(connection, table_name, columns_def):
             )
         )
         return
-    except (InternalError, OperationalError):
+    except (InternalError, OperationalError, ProgrammingError):
         # Some engines support adding all columns at once,
         # this error is when they don't
         _LOGGER.info("Unable to use quick column add. Adding 1 by 1")
@@ -218,8 +222,8 @@ def _add_columns(connection, table_name, columns_def):
                     )
                 )
             )
-        except (InternalError, OperationalError) as err:
-            raise_if_exception_missing_str(err, ["duplicate"])
+        except (InternalError, OperationalError, ProgrammingError) as err:
+            raise_if_exception_missing_str(err, ["already exists", "duplicate"])
             _LOGGER.warning(
                 "Column %s already exists on %s, continuing",
                 column_def.split(" ")[1],
@@ -579,10 +583,81 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
                         sum=last_statistic.sum,
                     )
                 )
+    elif new_version == 23:
+        # Add the state_attributes table that attributes shared between
+        # states are stored in. The table itself is created by create_all.
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 24:
+        # Store the context with the states so state changes no longer
+        # need a row in the events table. Databases that were created
+        # before version 9 still have the context_id and context_user_id
+        # columns on the states table.
+        _add_columns(
+            connection,
+            "states",
+            [
+                "context_id CHARACTER(36)",
+                "context_user_id CHARACTER(36)",
+                "context_parent_id CHARACTER(36)",
+            ],
+        )
+        _create_index(connection, "states", "ix_states_context_id")
+        _backfill_states_context(session, engine.dialect.name)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _backfill_states_context(session, dialect_name):
+    """Copy the context of the state_changed events to the states.
+
+    The states are updated in batches of state_id ranges with a commit after
+    each batch, so an interrupted migration continues where it stopped.
+    """
+    _LOGGER.warning(
+        "Copying the context of state changes to the states table. Note: this "
+        "can take several minutes on large databases and slow computers. Please "
+        "be patient!"
+    )
+    if dialect_name == "mysql":
+        update = text(
+            "UPDATE states INNER JOIN events ON events.event_id = states.event_id "
+            "SET states.context_id = events.context_id, "
+            "states.context_user_id = events.context_user_id, "
+            "states.context_parent_id = events.context_parent_id "
+            "WHERE states.state_id > :start AND states.state_id <= :end "
+            "AND states.context_id IS NULL"
+        )
+    elif dialect_name == "postgresql":
+        update = text(
+            "UPDATE states SET context_id = events.context_id, "
+            "context_user_id = events.context_user_id, "
+            "context_parent_id = events.context_parent_id "
+            "FROM events WHERE events.event_id = states.event_id "
+            "AND states.state_id > :start AND states.state_id <= :end "
+            "AND states.context_id IS NULL"
+        )
+    else:
+        update = text(
+            "UPDATE states SET "
+            "context_id = (SELECT events.context_id FROM events "
+            "WHERE events.event_id = states.event_id), "
+            "context_user_id = (SELECT events.context_user_id FROM events "
+            "WHERE events.event_id = states.event_id), "
+            "context_parent_id = (SELECT events.context_parent_id FROM events "
+            "WHERE events.event_id = states.event_id) "
+            "WHERE states.state_id > :start AND states.state_id <= :end "
+            "AND states.event_id IS NOT NULL AND states.context_id IS NULL"
+        )
+
+    max_state_id = session.execute(text("SELECT MAX(state_id) FROM states")).scalar()
+    for start in range(0, max_state_id or 0, CONTEXT_BACKFILL_BATCH_SIZE):
+        session.execute(
+            update, {"start": start, "end": start + CONTEXT_BACKFILL_BATCH_SIZE}
+        )
+        session.commit()
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
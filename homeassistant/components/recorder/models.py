@@ -5,9 +5,11 @@ from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
-from typing import TypedDict, overload
+from typing import Any, TypedDict, cast, overload
 
+from fnvhash import fnv1a_32
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -34,14 +36,14 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json_encoder import JSON_DUMP, JSONEncoder
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 22
+SCHEMA_VERSION = 24
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +51,7 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -58,6 +61,7 @@ TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -78,6 +82,26 @@ DOUBLE_TYPE = (
 )
 
 
+def _event_data_json(event: Event) -> str:
+    """Return the event data as JSON, reusing the cached encoding of the event."""
+    try:
+        return event.data_json()
+    except ValueError:
+        # NaN and infinity are not allowed in the shared encoding
+        return json.dumps(event.data, cls=JSONEncoder, separators=(",", ":"))
+
+
+def _attributes_json(state: State) -> str:
+    """Return the attributes as JSON, reusing the cached encoding of the state."""
+    try:
+        return state.attributes_json()
+    except ValueError:
+        # NaN and infinity are not allowed in the shared encoding
+        return json.dumps(
+            dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
+        )
+
+
 class Events(Base):  # type: ignore
     """Event history data."""
 
@@ -110,16 +134,24 @@ class Events(Base):  # type: ignore
     @staticmethod
     def from_event(event, event_data=None):
         """Create an event database object from a native event."""
-        return Events(
-            event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
-            origin=str(event.origin.value),
-            time_fired=event.time_fired,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-        )
+        return Events(**Events.row_from_event(event, event_data))
+
+    @staticmethod
+    def row_from_event(event, event_data=None) -> dict[str, Any]:
+        """Create an events table row from a native event.
+
+        The row is a plain mapping of column to value so it can be
+        written in bulk without going through the ORM unit of work.
+        """
+        return {
+            "event_type": event.event_type,
+            "event_data": event_data or _event_data_json(event),
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to a native HA Event."""
@@ -164,8 +196,16 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
+    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
+    context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    # Loaded on access, queries reading the attributes join the table
+    state_attributes = relationship("StateAttributes", lazy="select")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -174,48 +214,69 @@ class States(Base):  # type: ignore
             f"id={self.state_id}, domain='{self.domain}', entity_id='{self.entity_id}', "
             f"state='{self.state}', event_id='{self.event_id}', "
             f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
-            f"old_state_id={self.old_state_id}"
+            f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}"
             f")>"
         )
 
     @staticmethod
     def from_event(event):
         """Create object from a state_changed event."""
+        return States(**States.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event) -> dict[str, Any]:
+        """Create a states table row from a state_changed event."""
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
-
         # State got deleted
         if state is None:
-            dbstate.state = ""
-            dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
-            dbstate.last_changed = event.time_fired
-            dbstate.last_updated = event.time_fired
-        else:
-            dbstate.domain = state.domain
-            dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
-            dbstate.last_changed = state.last_changed
-            dbstate.last_updated = state.last_updated
+            return {
+                "entity_id": entity_id,
+                "state": "",
+                "domain": split_entity_id(entity_id)[0],
+                "attributes": "{}",
+                "last_changed": event.time_fired,
+                "last_updated": event.time_fired,
+                "context_id": event.context.id,
+                "context_user_id": event.context.user_id,
+                "context_parent_id": event.context.parent_id,
+            }
 
-        return dbstate
+        return {
+            "entity_id": entity_id,
+            "state": state.state,
+            "domain": state.domain,
+            "attributes": _attributes_json(state),
+            "last_changed": state.last_changed,
+            "last_updated": state.last_updated,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
         try:
+            # Attributes of states recorded since schema version 23
+            # are stored in the shared state_attributes table
+            if self.attributes is not None:
+                attributes = json.loads(self.attributes)
+            elif self.state_attributes is not None:
+                attributes = self.state_attributes.to_native()
+            else:
+                attributes = {}
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                attributes,
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
-                # Join the events table on event_id to get the context instead
-                # as it will always be there for state_changed events
-                context=Context(id=None),
+                context=Context(
+                    id=self.context_id,
+                    user_id=self.context_user_id,
+                    parent_id=self.context_parent_id,
+                ),
                 validate_entity_id=validate_entity_id,
             )
         except ValueError:
@@ -224,6 +285,54 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history.
+
+    Attributes are shared between all states that have identical
+    attributes; rows are looked up by a hash of the attribute JSON.
+    """
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named attributes to avoid confusion with the states table
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Create shared_attrs from a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        return _attributes_json(state)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of json encoded shared attributes."""
+        return cast(int, fnv1a_32(shared_attrs.encode("utf-8")))
+
+    def to_native(self) -> dict[str, Any]:
+        """Convert to a state attributes dictionary."""
+        try:
+            return cast(dict[str, Any], json.loads(self.shared_attrs))
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -495,13 +604,18 @@ class LazyState(State):
         self._last_changed = None
         self._last_updated = None
         self._context = None
+        self._attributes_json = None
+        self._as_json = None
 
     @property  # type: ignore
     def attributes(self):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                attributes_json = (
+                    getattr(self._row, "shared_attrs", None) or self._row.attributes
+                )
+                self._attributes = json.loads(attributes_json or "{}")
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
@@ -512,6 +626,8 @@ class LazyState(State):
     def attributes(self, value):
         """Set attributes."""
         self._attributes = value
+        self._attributes_json = None
+        self._as_json = None
 
     @property  # type: ignore
     def context(self):
@@ -536,6 +652,7 @@ class LazyState(State):
     def last_changed(self, value):
         """Set last changed datetime."""
         self._last_changed = value
+        self._as_json = None
 
     @property  # type: ignore
     def last_updated(self):
@@ -548,6 +665,7 @@ class LazyState(State):
     def last_updated(self, value):
         """Set last updated datetime."""
         self._last_updated = value
+        self._as_json = None
 
     def as_dict(self):
         """Return a dict representation of the LazyState.
@@ -576,6 +694,23 @@ class LazyState(State):
             "last_updated": last_updated_isoformat,
         }
 
+    def as_json(self):
+        """Return the LazyState encoded as JSON, like as_dict.
+
+        The result is cached. Raises ValueError or TypeError if the
+        attributes can't be serialized.
+        """
+        if self._as_json is None:
+            as_dict = self.as_dict()
+            self._as_json = (
+                f'{{"entity_id":{JSON_DUMP(self.entity_id)},'
+                f'"state":{JSON_DUMP(self.state)},'
+                f'"attributes":{self.attributes_json()},'
+                f'"last_changed":"{as_dict["last_changed"]}",'
+                f'"last_updated":"{as_dict["last_updated"]}"}}'
+            )
+        return self._as_json
+
     def __eq__(self, other):
         """Return the comparison."""
         return (
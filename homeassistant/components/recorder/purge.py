@@ -10,7 +10,7 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateAttributes, States
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -42,6 +42,8 @@ def purge_old_data(
 
         if event_ids:
             _purge_event_ids(session, event_ids)
+
+        if state_ids or event_ids:
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -70,21 +72,37 @@ def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list
 def _select_state_ids_to_purge(
     session: Session, purge_before: datetime, event_ids: list[int]
 ) -> set[int]:
-    """Return a list of state ids to purge."""
-    if not event_ids:
-        return set()
-    states = (
-        session.query(States.state_id)
-        .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
-        .all()
-    )
-    _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return {state.state_id for state in states}
+    """Return a list of state ids to purge.
+
+    States recorded before schema version 24 have an event, those
+    states must be purged with their event.
+    """
+    state_ids: set[int] = set()
+    if event_ids:
+        states = (
+            session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        )
+        state_ids.update(state.state_id for state in states)
+    if limit := MAX_ROWS_TO_PURGE - len(state_ids):
+        states = (
+            session.query(States.state_id)
+            .filter(States.last_updated < purge_before)
+            .limit(limit)
+            .all()
+        )
+        state_ids.update(state.state_id for state in states)
+    _LOGGER.debug("Selected %s state ids to remove", len(state_ids))
+    return state_ids
 
 
 def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id))
+        .filter(States.state_id.in_(state_ids))
+        .filter(States.attributes_id.isnot(None))
+    }
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -107,6 +125,34 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # Evict eny entries in the old_states cache referring to a purged state
     _evict_purged_states_from_old_states_cache(instance, state_ids)
 
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the state attributes that are no longer used by any state."""
+    used_attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.attributes_id.in_(attributes_ids)
+        )
+    }
+    unused_attributes_ids = attributes_ids - used_attributes_ids
+    if not unused_attributes_ids:
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state attributes cache referring to a purged row
+    _evict_purged_attributes_from_attributes_cache(instance, unused_attributes_ids)
+
 
 def _evict_purged_states_from_old_states_cache(
     instance: Recorder, purged_state_ids: set[int]
@@ -115,9 +161,7 @@ def _evict_purged_states_from_old_states_cache(
     # Make a map from old_state_id to entity_id
     old_states = instance._old_states  # pylint: disable=protected-access
     old_state_reversed = {
-        old_state.state_id: entity_id
-        for entity_id, old_state in old_states.items()
-        if old_state.state_id
+        old_state_id: entity_id for entity_id, old_state_id in old_states.items()
     }
 
     # Evict any purged state from the old states cache
@@ -125,6 +169,18 @@ def _evict_purged_states_from_old_states_cache(
         old_states.pop(old_state_reversed[purged_state_id], None)
 
 
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    for shared_attrs, attributes_id in list(state_attributes_ids.items()):
+        if attributes_id in purged_attributes_ids:
+            del state_attributes_ids[shared_attrs]
+
+
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
     deleted_rows = (
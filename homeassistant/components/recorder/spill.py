@@ -0,0 +1,237 @@
+"""Spill buffer for events the recorder can not keep up with."""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import suppress
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    Event,
+    EventOrigin,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def event_to_line(event: Event) -> bytes:
+    """Encode an event as a line of the spill file."""
+    try:
+        line = event.as_json()
+    except ValueError:
+        # NaN and infinity are not allowed in the shared encoding
+        line = json.dumps(event, cls=JSONEncoder, separators=(",", ":"))
+    return f"{line}\n".encode()
+
+
+def _context_from_dict(context: dict[str, str | None]) -> Context:
+    """Return a context from its dict representation."""
+    return Context(
+        user_id=context["user_id"], parent_id=context["parent_id"], id=context["id"]
+    )
+
+
+def _state_from_dict(state_dict: dict[str, Any] | None) -> State | None:
+    """Return a state from its dict representation, keeping the parent context."""
+    if (state := State.from_dict(state_dict)) is not None:
+        state.context = _context_from_dict(state_dict["context"])  # type: ignore[index]
+    return state
+
+
+def event_from_line(line: bytes) -> Event:
+    """Decode an event from a line of the spill file."""
+    event_dict = json.loads(line)
+    event_type = event_dict["event_type"]
+    data = event_dict["data"]
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = _state_from_dict(data.get("old_state"))
+        data["new_state"] = _state_from_dict(data.get("new_state"))
+    return Event(
+        event_type,
+        data,
+        EventOrigin(event_dict["origin"]),
+        dt_util.parse_datetime(event_dict["time_fired"]),
+        _context_from_dict(event_dict["context"]),
+    )
+
+
+class SpillBuffer:
+    """A bounded append-only file of events.
+
+    Events are appended in the event loop and written to disk in the
+    executor. The recorder thread reads them back in batches once the
+    database has caught up. The buffer stays active until every spilled
+    event has been read, so the order of the events is kept.
+
+    The offset of the events that are recorded is kept next to the file,
+    so a restart only replays the events that were not recorded yet.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, max_bytes: int) -> None:
+        """Initialize the spill buffer."""
+        self.hass = hass
+        self.path = path
+        self.offset_path = f"{path}.offset"
+        self.max_bytes = max_bytes
+        self.dropped_events = 0
+        self._lines: deque[bytes] = deque()
+        self._file_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._read_offset = 0
+        # Written in the event loop
+        self._spilled_bytes = 0
+        self._spilled_events = 0
+        # Written by the recorder thread
+        self._read_bytes = 0
+        self._read_events = 0
+        self.active = False
+
+    async def async_load(self) -> None:
+        """Load the events left over from a previous run.
+
+        They are replayed before any new event is recorded.
+        """
+        spilled_bytes, read_offset = await self.hass.async_add_executor_job(
+            self._load
+        )
+        self._spilled_bytes += spilled_bytes
+        self._read_bytes += read_offset
+        self.active = self.pending_bytes > 0
+
+    def _load(self) -> tuple[int, int]:
+        """Return the size of the file and the offset of the recorded events."""
+        with self._file_lock:
+            try:
+                spilled_bytes = os.path.getsize(self.path)
+            except FileNotFoundError:
+                spilled_bytes = 0
+            try:
+                with open(self.offset_path, encoding="utf8") as offset_file:
+                    read_offset = int(offset_file.read())
+            except (FileNotFoundError, ValueError):
+                read_offset = 0
+            if not 0 <= read_offset <= spilled_bytes:
+                read_offset = 0
+            self._read_offset = read_offset
+        return spilled_bytes, read_offset
+
+    @property
+    def pending_bytes(self) -> int:
+        """Return the number of bytes that have not been read back."""
+        return self._spilled_bytes - self._read_bytes
+
+    @property
+    def pending_events(self) -> int:
+        """Return the number of events spilled in this run not read back."""
+        return max(self._spilled_events - self._read_events, 0)
+
+    @callback
+    def async_append(self, event: Event) -> None:
+        """Append an event to the buffer."""
+        try:
+            line = event_to_line(event)
+        except TypeError:
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        if self.pending_bytes + len(line) > self.max_bytes:
+            if not self.dropped_events:
+                _LOGGER.error(
+                    "The recorder spill buffer reached the maximum size of %s bytes; "
+                    "Events are no longer being recorded until the database catches up",
+                    self.max_bytes,
+                )
+            self.dropped_events += 1
+            return
+
+        self.active = True
+        self._spilled_bytes += len(line)
+        self._spilled_events += 1
+        self._lines.append(line)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.hass.async_add_executor_job(self.flush)
+
+    @callback
+    def async_deactivate(self) -> bool:
+        """Stop spilling if every spilled event has been read back."""
+        if self.pending_bytes or self._lines:
+            return False
+        self.active = False
+        self.dropped_events = 0
+        return True
+
+    def flush(self) -> None:
+        """Write the appended lines to disk."""
+        self._flush_scheduled = False
+        with self._file_lock:
+            self._write_lines()
+
+    def _write_lines(self) -> None:
+        """Write the appended lines to disk, the file lock must be held."""
+        lines = []
+        with suppress(IndexError):
+            while True:
+                lines.append(self._lines.popleft())
+        if not lines:
+            return
+        with open(self.path, "ab") as spill_file:
+            spill_file.writelines(lines)
+
+    def read_batch(self, max_events: int) -> list[Event]:
+        """Read the next batch of spilled events.
+
+        Call mark_recorded once the events are recorded.
+        """
+        events: list[Event] = []
+        with self._file_lock:
+            self._write_lines()
+            try:
+                spill_file = open(self.path, "rb")  # pylint: disable=consider-using-with
+            except FileNotFoundError:
+                return events
+
+            with spill_file:
+                spill_file.seek(self._read_offset)
+                while len(events) < max_events and (line := spill_file.readline()):
+                    self._read_bytes += len(line)
+                    self._read_events += 1
+                    try:
+                        events.append(event_from_line(line))
+                    except (KeyError, TypeError, ValueError):
+                        _LOGGER.warning("Skipping invalid spilled event: %s", line)
+                self._read_offset = spill_file.tell()
+
+        return events
+
+    def mark_recorded(self) -> None:
+        """Forget the events that were read, they are recorded.
+
+        The file is removed once every line has been recorded.
+        """
+        with self._file_lock:
+            self._write_lines()
+            try:
+                spilled_bytes = os.path.getsize(self.path)
+            except FileNotFoundError:
+                return
+
+            if self._read_offset < spilled_bytes:
+                with open(self.offset_path, "w", encoding="utf8") as offset_file:
+                    offset_file.write(str(self._read_offset))
+                return
+
+            os.remove(self.path)
+            with suppress(FileNotFoundError):
+                os.remove(self.offset_path)
+            self._read_offset = 0
@@ -16,6 +16,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate_statistics)
     websocket_api.async_register_command(hass, ws_clear_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
+    websocket_api.async_register_command(hass, ws_info)
 
 
 @websocket_api.websocket_command(
@@ -72,3 +73,29 @@ def ws_update_statistics_metadata(
         msg["statistic_id"], msg["unit_of_measurement"]
     )
     connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command({vol.Required("type"): "recorder/info"})
+@callback
+def ws_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the backlog and lag of the recorder.
+
+    These are not exposed as sensors: their states would be recorded too,
+    adding writes while the recorder is behind.
+    """
+    instance = hass.data[DATA_INSTANCE]
+    spill_buffer = instance.spill_buffer
+    connection.send_result(
+        msg["id"],
+        {
+            "backlog": instance.queue.qsize(),
+            "spilled": spill_buffer.pending_events,
+            "spilled_bytes": spill_buffer.pending_bytes,
+            "dropped": spill_buffer.dropped_events,
+            "lag": instance.async_lag(),
+            "migration_in_progress": instance.migration_in_progress,
+            "recording": instance.enabled and instance.async_recorder_ready.is_set(),
+        },
+    )
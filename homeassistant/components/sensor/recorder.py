@@ -7,6 +7,7 @@ import datetime
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -36,10 +37,12 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_ID,
     ATTR_UNIT_OF_MEASUREMENT,
     DEVICE_CLASS_POWER,
     ENERGY_KILO_WATT_HOUR,
     ENERGY_WATT_HOUR,
+    EVENT_STATE_CHANGED,
     POWER_KILO_WATT,
     POWER_WATT,
     PRESSURE_BAR,
@@ -54,7 +57,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -134,6 +137,8 @@ WARN_NEGATIVE = "sensor_warn_total_increasing_negative"
 # Keep track of entities for which a warning about unsupported unit has been logged
 WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
+# The in-memory history of sensors for which statistics are compiled
+STATES_ACCUMULATOR = "sensor_states_accumulator"
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -151,6 +156,131 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     return statistics_sensors
 
 
+class StatesAccumulator:
+    """Keep the states of statistics sensors for the open periods in memory.
+
+    States are collected from state changed events, so compiling the statistics
+    of a period does not have to read the history back from the database. The
+    database is still used for periods which started before the accumulator
+    was complete, for example after a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self._lock = threading.Lock()
+        # Every state changed at or after this time is in _states
+        self._complete_from: datetime.datetime | None = None
+        self._states: dict[str, list[State]] = {}
+        # Entities which statistics were compiled for since the last prune
+        self._compiled: set[str] = set()
+
+    @callback
+    def async_start(self) -> None:
+        """Start collecting states."""
+        complete_from = dt_util.utcnow()
+        with self._lock:
+            for state in _get_sensor_states(self.hass):
+                self._states[state.entity_id] = [state]
+                complete_from = max(complete_from, state.last_updated)
+            self._complete_from = complete_from
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_state_changed_filter,
+        )
+
+    @callback
+    def _async_state_changed_filter(self, event: Event) -> bool:
+        """Filter state changes of sensors with statistics."""
+        return (
+            event.data[ATTR_ENTITY_ID].startswith(f"{DOMAIN}.")
+            and (new_state := event.data["new_state"]) is not None
+            and new_state.attributes.get(ATTR_STATE_CLASS) in STATE_CLASSES
+            and is_entity_recorded(self.hass, new_state.entity_id)
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Collect a state change."""
+        new_state: State = event.data["new_state"]
+        with self._lock:
+            if (states := self._states.get(new_state.entity_id)) is None:
+                # The old state is the state at the start of the period
+                old_state = event.data["old_state"]
+                states = self._states[new_state.entity_id] = (
+                    [old_state] if old_state else []
+                )
+            states.append(new_state)
+
+    def get_history(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entity_ids: list[str],
+        significant_changes_only: bool,
+    ) -> dict[str, list[State]] | None:
+        """Return the states during start-end like the recorder history.
+
+        The state at the start of the period is included. Returns None if the
+        accumulator does not have every state of the period.
+        """
+        with self._lock:
+            self._compiled.update(entity_ids)
+            if self._complete_from is None or start < self._complete_from:
+                return None
+            history_list = {}
+            for entity_id in entity_ids:
+                if not (states := self._states.get(entity_id)):
+                    continue
+                entity_history: list[State] = []
+                start_state = None
+                for state in sorted(states, key=lambda state: state.last_updated):
+                    if state.last_updated < start:
+                        start_state = state
+                    elif state.last_updated < end and (
+                        not significant_changes_only
+                        or state.last_changed == state.last_updated
+                    ):
+                        entity_history.append(state)
+                if start_state:
+                    entity_history.insert(0, start_state)
+                if entity_history:
+                    history_list[entity_id] = entity_history
+        return history_list
+
+    def prune(self, end: datetime.datetime) -> None:
+        """Forget the states which are no longer needed once start-end is compiled.
+
+        Entities which were not compiled and did not change during the period,
+        for example removed sensors, are forgotten.
+        """
+        with self._lock:
+            compiled = self._compiled
+            self._compiled = set()
+            if self._complete_from is None or end <= self._complete_from:
+                return
+            for entity_id, states in list(self._states.items()):
+                states.sort(key=lambda state: state.last_updated)
+                if entity_id not in compiled and (
+                    not states or states[-1].last_updated < self._complete_from
+                ):
+                    del self._states[entity_id]
+                    continue
+                start_state = None
+                index = 0
+                for index, state in enumerate(states):
+                    if state.last_updated >= end:
+                        break
+                    start_state = state
+                else:
+                    index = len(states)
+                self._states[entity_id] = (
+                    [start_state] if start_state else []
+                ) + states[index:]
+            self._complete_from = end
+
+
 def _time_weighted_average(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
 ) -> float:
@@ -386,11 +516,43 @@ def compile_statistics(
 
     Note: This will query the database and must not be run in the event loop
     """
+    if (accumulator := hass.data.get(STATES_ACCUMULATOR)) is None:
+        accumulator = hass.data[STATES_ACCUMULATOR] = StatesAccumulator(hass)
+        hass.add_job(accumulator.async_start)
+
     with recorder_util.session_scope(hass=hass) as session:
         result = _compile_statistics(hass, session, start, end)
+    accumulator.prune(end)
     return result
 
 
+def _get_history(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> dict[str, Iterable[State]]:
+    """Get the history during start-end, from memory if possible."""
+    accumulator: StatesAccumulator | None = hass.data.get(STATES_ACCUMULATOR)
+    if accumulator and (
+        history_list := accumulator.get_history(
+            start, end, entity_ids, significant_changes_only
+        )
+    ) is not None:
+        return history_list  # type: ignore[return-value]
+
+    return history.get_significant_states_with_session(  # type: ignore
+        hass,
+        session,
+        start - datetime.timedelta.resolution,
+        end,
+        entity_ids=entity_ids,
+        significant_changes_only=significant_changes_only,
+    )
+
+
 def _compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -412,13 +574,8 @@ def _compile_statistics(  # noqa: C901
     ]
     history_list = {}
     if entities_full_history:
-        history_list = history.get_significant_states_with_session(  # type: ignore
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list = _get_history(
+            hass, session, start, end, entities_full_history, False
         )
     entities_significant_history = [
         i.entity_id
@@ -426,12 +583,8 @@ def _compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_significant_states_with_session(  # type: ignore
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        _history_list = _get_history(
+            hass, session, start, end, entities_significant_history, True
         )
         history_list = {**history_list, **_history_list}
     # If there are no recent state changes, the sensor's state may already be pruned
@@ -45,6 +45,7 @@ from .const import (
     MAX_SEGMENTS,
     OUTPUT_IDLE_TIMEOUT,
     RECORDER_PROVIDER,
+    RING_BUFFER_PROVIDER,
     SEGMENT_DURATION_ADJUSTER,
     STREAM_RESTART_INCREMENT,
     STREAM_RESTART_RESET_TIME,
@@ -52,6 +53,7 @@ from .const import (
 )
 from .core import PROVIDERS, IdleTimer, StreamOutput, StreamSettings
 from .hls import HlsStreamOutput, async_setup_hls
+from .ring_buffer import RingBufferOutput
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -311,6 +313,22 @@ class Stream:
             self._thread = None
             _LOGGER.info("Stopped stream: %s", redact_credentials(str(self.source)))
 
+    async def async_enable_ring_buffer(self, path: str, max_bytes: int) -> None:
+        """Keep the segments of the stream in a ring file of a bounded size.
+
+        The ring file is used for the lookback of recordings and to serve
+        HLS segments that are no longer held in memory. There is no
+        configuration option for it, it is only enabled by integrations
+        calling this method.
+        """
+        # Check for file access
+        if not self.hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Can't write {path}, no access to path!")
+
+        ring_buffer = cast(RingBufferOutput, self.add_provider(RING_BUFFER_PROVIDER))
+        await ring_buffer.async_open(path, max_bytes)
+        self.start()
+
     async def async_record(
         self, video_path: str, duration: int = 30, lookback: int = 5
     ) -> None:
@@ -341,7 +359,22 @@ class Stream:
 
         # Take advantage of lookback
         hls: HlsStreamOutput = cast(HlsStreamOutput, self.outputs().get(HLS_PROVIDER))
-        if lookback > 0 and hls:
+        ring_buffer = cast(
+            RingBufferOutput, self.outputs().get(RING_BUFFER_PROVIDER)
+        )
+        if lookback > 0 and ring_buffer:
+            # Wait for latest segment, then add the lookback
+            await ring_buffer.recv()
+            segments = await ring_buffer.async_get_segments(lookback)
+            target_duration = (
+                hls.target_duration
+                if hls
+                else max((segment.duration for segment in segments), default=0)
+            )
+            if target_duration:
+                num_segments = min(int(lookback // target_duration), MAX_SEGMENTS)
+                recorder.prepend(segments[-num_segments:] if num_segments else [])
+        elif lookback > 0 and hls:
             num_segments = min(int(lookback // hls.target_duration), MAX_SEGMENTS)
             # Wait for latest segment, then add the lookback
             await hls.recv()
@@ -7,6 +7,7 @@ ATTR_STREAMS = "streams"
 
 HLS_PROVIDER = "hls"
 RECORDER_PROVIDER = "recorder"
+RING_BUFFER_PROVIDER = "ring_buffer"
 
 OUTPUT_FORMATS = [HLS_PROVIDER]
 
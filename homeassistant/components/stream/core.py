@@ -66,6 +66,9 @@ class Segment:
     hls_num_parts_rendered: int = attr.ib(default=0)
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = attr.ib(default=False)
+    # Size of the part data, only new parts are summed on each call
+    _data_size: int = attr.ib(default=0, init=False)
+    _num_parts_sized: int = attr.ib(default=0, init=False)
 
     def __attrs_post_init__(self) -> None:
         """Run after init."""
@@ -85,7 +88,15 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
-        return sum(len(part.data) for part in self.parts)
+        if self._num_parts_sized != len(self.parts):
+            if self._num_parts_sized > len(self.parts):
+                # The parts were replaced
+                self._data_size = self._num_parts_sized = 0
+            self._data_size += sum(
+                len(part.data) for part in self.parts[self._num_parts_sized :]
+            )
+            self._num_parts_sized = len(self.parts)
+        return self._data_size
 
     @callback
     def async_add_part(
@@ -103,9 +114,20 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+        """Return reconstructed data for all parts as bytes, without init.
+
+        This copies the data of every part, use get_part_data to avoid the copy.
+        """
         return b"".join([part.data for part in self.parts])
 
+    def get_part_data(self) -> tuple[int, list[bytes]]:
+        """Return the size of the part data and the data of each part, without init.
+
+        The parts added later are not included, so the data can be written
+        without holding on to the Segment.
+        """
+        return self.data_size, [part.data for part in self.parts]
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
@@ -17,9 +17,11 @@ from .const import (
     HLS_PROVIDER,
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
+    RING_BUFFER_PROVIDER,
 )
 from .core import PROVIDERS, IdleTimer, StreamOutput, StreamSettings, StreamView
 from .fmp4utils import get_codec_string
+from .ring_buffer import RingBufferOutput
 
 if TYPE_CHECKING:
     from . import Stream
@@ -393,8 +395,16 @@ class HlsSegmentView(StreamView):
         # Ensure that we have a segment. If the request is from a hint for part 0
         # of a segment, there is a small chance it may have arrived before the
         # segment has been put. If this happens, wait for one part and retry.
+        # Segments no longer held in memory may still be in the ring buffer
+        ring_buffer = cast(
+            RingBufferOutput, stream.outputs().get(RING_BUFFER_PROVIDER)
+        )
         if not (
             (segment := track.get_segment(int(sequence)))
+            or (
+                ring_buffer
+                and (segment := await ring_buffer.async_get_segment(int(sequence)))
+            )
             or (
                 await track.part_recv(timeout=track.stream_settings.hls_part_timeout)
                 and (segment := track.get_segment(int(sequence)))
@@ -405,10 +415,17 @@ class HlsSegmentView(StreamView):
                 status=404,
                 headers={"Cache-Control": f"max-age={track.target_duration:.0f}"},
             )
-        return web.Response(
-            body=segment.get_data(),
+        # Write the data of each part instead of joining it into a copy
+        data_size, part_data = segment.get_part_data()
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
                 "Cache-Control": f"max-age={6*track.target_duration:.0f}",
             },
         )
+        response.content_length = data_size
+        await response.prepare(request)
+        for data in part_data:
+            await response.write(data)
+        await response.write_eof()
+        return response
@@ -0,0 +1,253 @@
+"""Provide a rolling on-disk buffer of stream segments."""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import suppress
+import datetime
+from itertools import takewhile
+import logging
+import mmap
+import os
+import threading
+
+import attr
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import RING_BUFFER_PROVIDER
+from .core import PROVIDERS, IdleTimer, Part, Segment, StreamOutput
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@attr.s(slots=True)
+class RingEntry:
+    """Represent a segment stored in the ring file."""
+
+    sequence: int = attr.ib()
+    # The init is shared by every segment of a stream, it is not copied
+    init: bytes = attr.ib()
+    stream_id: int = attr.ib()
+    start_time: datetime.datetime = attr.ib()
+    duration: float = attr.ib()
+    offset: int = attr.ib()
+    size: int = attr.ib()
+
+
+class RingFile:
+    """A memory-mapped file of a bounded size holding segment data.
+
+    Segment data is written one after the other and wraps around to the
+    start of the file, overwriting the oldest segments. Only the position
+    of each segment is kept in memory.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Create the ring file, must be run in the executor."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._entries: deque[RingEntry] = deque()
+        self._head = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w+b") as ring_file:
+            ring_file.truncate(max_bytes)
+            self._mmap = mmap.mmap(ring_file.fileno(), max_bytes)
+
+    def write_segment(self, segment: Segment) -> None:
+        """Write the data of a complete segment."""
+        size = segment.data_size
+        if size > self.max_bytes:
+            _LOGGER.warning(
+                "Segment of %s bytes does not fit in the ring buffer of %s bytes",
+                size,
+                self.max_bytes,
+            )
+            return
+
+        with self._lock:
+            if self._closed:
+                return
+            entries = self._entries
+            if self._head + size > self.max_bytes:
+                # The end of the file is left unused on this lap
+                while entries and entries[0].offset >= self._head:
+                    entries.popleft()
+                self._head = 0
+            end = self._head + size
+            while entries and self._head <= entries[0].offset < end:
+                entries.popleft()
+
+            offset = self._head
+            for part in segment.parts:
+                self._mmap[offset : offset + len(part.data)] = part.data
+                offset += len(part.data)
+            entries.append(
+                RingEntry(
+                    sequence=segment.sequence,
+                    init=segment.init,
+                    stream_id=segment.stream_id,
+                    start_time=segment.start_time,
+                    duration=segment.duration,
+                    offset=self._head,
+                    size=size,
+                )
+            )
+            self._head = end
+
+    def _read_segment(self, entry: RingEntry) -> Segment:
+        """Read a segment from the file, the lock must be held."""
+        segment = Segment(
+            sequence=entry.sequence,
+            init=entry.init,
+            stream_id=entry.stream_id,
+            start_time=entry.start_time,
+            stream_outputs=[],
+            duration=entry.duration,
+        )
+        segment.parts.append(
+            Part(
+                duration=entry.duration,
+                has_keyframe=True,
+                data=self._mmap[entry.offset : entry.offset + entry.size],
+            )
+        )
+        return segment
+
+    def read_segment(self, sequence: int) -> Segment | None:
+        """Read the segment with a sequence number."""
+        with self._lock:
+            if self._closed:
+                return None
+            for entry in reversed(self._entries):
+                if entry.sequence == sequence:
+                    return self._read_segment(entry)
+        return None
+
+    def read_segments(self, duration: float) -> list[Segment]:
+        """Read the most recent segments covering at least a duration."""
+        entries: list[RingEntry] = []
+        with self._lock:
+            if self._closed:
+                return []
+            for entry in reversed(self._entries):
+                if duration <= 0:
+                    break
+                entries.append(entry)
+                duration -= entry.duration
+            return [self._read_segment(entry) for entry in reversed(entries)]
+
+    def close(self) -> None:
+        """Close and remove the ring file."""
+        with self._lock:
+            self._closed = True
+            self._entries.clear()
+            self._mmap.close()
+        with suppress(FileNotFoundError):
+            os.remove(self.path)
+
+
+@PROVIDERS.register(RING_BUFFER_PROVIDER)
+class RingBufferOutput(StreamOutput):
+    """Represents a rolling on-disk buffer of segments.
+
+    Complete segments are moved from memory to the ring file, which is used
+    for recording lookback and for serving HLS segments that are no longer
+    held by the HLS output.
+    """
+
+    def __init__(self, hass: HomeAssistant, idle_timer: IdleTimer) -> None:
+        """Initialize the ring buffer output."""
+        super().__init__(hass, idle_timer)
+        self.ring: RingFile | None = None
+        self._flush_scheduled = False
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return RING_BUFFER_PROVIDER
+
+    async def async_open(self, path: str, max_bytes: int) -> None:
+        """Create the ring file."""
+        if self.ring is None:
+            self.ring = await self._hass.async_add_executor_job(
+                RingFile, path, max_bytes
+            )
+
+    @callback
+    def _async_put(self, segment: Segment) -> None:
+        """Store output from event loop."""
+        super()._async_put(segment)
+        # The buffer is kept as long as the stream produces segments
+        self.idle_timer.awake()
+
+    def part_put(self) -> None:
+        """Set event signalling the latest part segment."""
+        super().part_put()
+        self._async_flush()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Schedule moving the complete segments to the ring file."""
+        if self._flush_scheduled or (ring := self.ring) is None:
+            return
+        segments = list(takewhile(lambda segment: segment.complete, self._segments))
+        if segments:
+            self._flush_scheduled = True
+            self._hass.async_add_executor_job(self._write_segments, ring, segments)
+
+    def _write_segments(self, ring: RingFile, segments: list[Segment]) -> None:
+        """Write segments to the ring file."""
+        for segment in segments:
+            ring.write_segment(segment)
+        self._hass.loop.call_soon_threadsafe(self._async_segments_written, segments)
+
+    @callback
+    def _async_segments_written(self, segments: list[Segment]) -> None:
+        """Drop the segments that were written to the ring file from memory."""
+        for segment in segments:
+            if self._segments and self._segments[0] is segment:
+                self._segments.popleft()
+        self._flush_scheduled = False
+        self._async_flush()
+
+    async def async_get_segments(self, duration: float) -> list[Segment]:
+        """Return the most recent segments covering at least a duration.
+
+        The segments still held in memory take the place of their copy in the
+        ring file while a write is in flight.
+        """
+        segments = list(self._segments)
+        if (ring := self.ring) is not None:
+            in_memory = {segment.sequence for segment in segments}
+            segments = [
+                segment
+                for segment in await self._hass.async_add_executor_job(
+                    ring.read_segments, duration
+                )
+                if segment.sequence not in in_memory
+            ] + segments
+        lookback: list[Segment] = []
+        for segment in reversed(segments):
+            if duration <= 0:
+                break
+            lookback.append(segment)
+            duration -= segment.duration
+        lookback.reverse()
+        return lookback
+
+    async def async_get_segment(self, sequence: int) -> Segment | None:
+        """Return a segment from memory or the ring file."""
+        if (segment := self.get_segment(sequence)) is not None:
+            return segment
+        if (ring := self.ring) is None:
+            return None
+        return await self._hass.async_add_executor_job(ring.read_segment, sequence)
+
+    def cleanup(self) -> None:
+        """Handle cleanup."""
+        super().cleanup()
+        if (ring := self.ring) is not None:
+            self.ring = None
+            self._hass.async_add_executor_job(ring.close)
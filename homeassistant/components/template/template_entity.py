@@ -224,6 +224,14 @@ class TemplateEntity(Entity):
             return
 
         for update in updates:
+            if (render_cache := update.template.render_cache) is not None:
+                _LOGGER.debug(
+                    "Render cache of Template[%s] for %s: %s hits, %s misses",
+                    update.template.template,
+                    self.entity_id,
+                    render_cache.hits,
+                    render_cache.misses,
+                )
             for attr in self._template_attrs[update.template]:
                 attr.handle_result(
                     event, update.template, update.last_result, update.result
@@ -234,7 +242,7 @@ class TemplateEntity(Entity):
     async def _async_template_startup(self, *_) -> None:
         template_var_tups = []
         for template, attributes in self._template_attrs.items():
-            template_var_tups.append(TrackTemplate(template, None))
+            template_var_tups.append(TrackTemplate(template, None, render_cache=True))
             for attribute in attributes:
                 attribute.async_setup()
 
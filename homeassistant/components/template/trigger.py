@@ -134,7 +134,11 @@ async def async_attach_trigger(
 
     info = async_track_template_result(
         hass,
-        [TrackTemplate(value_template, automation_info["variables"])],
+        [
+            TrackTemplate(
+                value_template, automation_info["variables"], render_cache=True
+            )
+        ],
         template_listener,
     )
     unsub = info.async_remove
@@ -27,6 +27,14 @@ PENDING_MSG_PEAK: Final = 512
 PENDING_MSG_PEAK_TIME: Final = 5
 MAX_PENDING_MSG: Final = 2048
 
+# Clients that support this feature receive pending messages
+# coalesced into a JSON array
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
+# Bounds in seconds of the time the writer waits for more messages
+# to coalesce while the client is receiving a burst
+COALESCE_MIN_FLUSH_WINDOW: Final = 0.001
+COALESCE_MAX_FLUSH_WINDOW: Final = 0.016
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_FOUND: Final = "not_found"
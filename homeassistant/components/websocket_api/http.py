@@ -17,9 +17,13 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
+    COALESCE_MAX_FLUSH_WINDOW,
+    COALESCE_MIN_FLUSH_WINDOW,
     DATA_CONNECTIONS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -67,9 +71,16 @@ class WebSocketHandler:
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._connection: ActiveConnection | None = None
 
     async def _writer(self) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        When the client supports it, all pending messages are sent as a
+        single JSON array. While messages keep arriving in bursts the
+        writer waits a little longer before each frame to collect more.
+        """
+        flush_window = 0.0
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
@@ -77,8 +88,42 @@ class WebSocketHandler:
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if (
+                    self._connection is None
+                    or not self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
+                    )
+                ):
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    continue
+
+                if flush_window:
+                    await asyncio.sleep(flush_window)
+
+                messages = [message]
+                closing = False
+                while not self._to_write.empty():
+                    if (message := self._to_write.get_nowait()) is None:
+                        closing = True
+                        break
+                    messages.append(message)
+
+                if len(messages) == 1:
+                    flush_window = 0.0
+                    self._logger.debug("Sending %s", messages[0])
+                    await self.wsock.send_str(messages[0])
+                else:
+                    flush_window = min(
+                        max(flush_window * 2, COALESCE_MIN_FLUSH_WINDOW),
+                        COALESCE_MAX_FLUSH_WINDOW,
+                    )
+                    coalesced = f'[{",".join(messages)}]'
+                    self._logger.debug("Sending %s", coalesced)
+                    await self.wsock.send_str(coalesced)
+
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -198,6 +243,7 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._connection = connection
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
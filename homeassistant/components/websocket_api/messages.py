@@ -1,13 +1,12 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
-from functools import lru_cache
 import logging
 from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -31,6 +30,22 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+# Keys of a compressed state
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+# Keys of an entities event
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+# Keys of a state diff
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -55,23 +70,130 @@ def event_message(iden: JSON_TYPE, event: Any) -> dict[str, Any]:
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
-    Serialize to json once per message.
+    Serialize to json once per event.
 
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+    The encoding is cached on the event and shared with other
+    consumers like the recorder.
     """
     return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
 
 
-@lru_cache(maxsize=128)
 def _cached_event_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+    """Serialize the event to json using its cached encoding.
 
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    try:
+        return f'{{"id":{IDEN_JSON_TEMPLATE},"type":"event","event":{event.as_json()}}}'
+    except (ValueError, TypeError):
+        # Logs the path of the bad data and returns an error message
+        return message_to_json(event_message(IDEN_TEMPLATE, event))
+
+
+def compressed_state_dict(state: State) -> dict[str, Any]:
+    """Return a compact representation of a state.
+
+    The last updated time is left out when it equals the last changed time
+    and the context is sent as its id when it has no user or parent.
+    """
+    compressed: dict[str, Any] = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
+def _compressed_context(state: State) -> str | dict[str, str | None]:
+    """Return the context of a state, as its id if that is all there is."""
+    context = state.context
+    if context.user_id is None and context.parent_id is None:
+        return context.id
+    return context.as_dict()
+
+
+def entities_message(iden: int, states: list[State]) -> dict[str, Any]:
+    """Return an entities event message adding states."""
+    return event_message(
+        iden,
+        {
+            ENTITY_EVENT_ADD: {
+                state.entity_id: compressed_state_dict(state) for state in states
+            }
+        },
+    )
+
+
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an entities event message for a state changed event.
+
+    Serialize to json once per event, like cached_event_message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+def _cached_state_diff_message(event: Event) -> str:
+    """Serialize the changes of a state changed event to json.
+
+    The result is cached on the event.
+    """
+    # pylint: disable=protected-access
+    if event._state_diff_message is None:
+        event._state_diff_message = message_to_json(
+            event_message(IDEN_TEMPLATE, _state_diff_event(event))
+        )
+    return event._state_diff_message
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Return the changes of a state changed event."""
+    entity_id = event.data["entity_id"]
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if (old_state := event.data["old_state"]) is None:
+        return {ENTITY_EVENT_ADD: {entity_id: compressed_state_dict(new_state)}}
+    return {ENTITY_EVENT_CHANGE: {entity_id: _state_diff(old_state, new_state)}}
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return what changed between two states of an entity.
+
+    A missing last updated time means it equals the last changed time.
+    """
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    if new_state.last_updated != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context != new_state.context:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes != new_attributes:
+        if changed_attributes := {
+            key: value
+            for key, value in new_attributes.items()
+            if key not in old_attributes or old_attributes[key] != value
+        }:
+            additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+        if removed_attributes := [
+            key for key in old_attributes if key not in new_attributes
+        ]:
+            diff[STATE_DIFF_REMOVALS] = {
+                COMPRESSED_STATE_ATTRIBUTES: removed_attributes
+            }
+    return diff
 
 
 def message_to_json(message: dict[str, Any]) -> str:
@@ -27,7 +27,11 @@ from homeassistant.helpers.typing import (
     DiscoveryInfoType,
     UndefinedType,
 )
-from homeassistant.setup import async_process_deps_reqs, async_setup_component
+from homeassistant.setup import (
+    async_process_deps_reqs,
+    async_setup_component,
+    async_trace_setup_phase,
+)
 from homeassistant.util.decorator import Registry
 import homeassistant.util.uuid as uuid_util
 
@@ -301,7 +305,10 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)  # type: ignore
+            with async_trace_setup_phase(
+                hass, integration.domain, f"async_setup_entry {self.title}"
+            ):
+                result = await component.async_setup_entry(hass, self)  # type: ignore
 
             if not isinstance(result, bool):
                 _LOGGER.error(
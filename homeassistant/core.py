@@ -67,6 +67,7 @@ from homeassistant.util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json_encoder import JSON_DUMP
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -113,7 +114,6 @@ TIMEOUT_EVENT_START = 15
 
 _LOGGER = logging.getLogger(__name__)
 
-
 def split_entity_id(entity_id: str) -> list[str]:
     """Split a state entity ID into domain and object ID."""
     return entity_id.split(".", 1)
@@ -603,7 +603,16 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = [
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_data_json",
+        "_as_json",
+        "_state_diff_message",
+    ]
 
     def __init__(
         self,
@@ -619,6 +628,10 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._data_json: str | None = None
+        self._as_json: str | None = None
+        # Cached by the websocket api, shared by every subscribed connection
+        self._state_diff_message: str | None = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -638,6 +651,42 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def data_json(self) -> str:
+        """Return the event data encoded as JSON.
+
+        The result is cached, the states of a state changed event reuse
+        the encoding of State.as_json. Raises ValueError or TypeError if
+        the data can't be serialized.
+        """
+        if self._data_json is None:
+            if self.event_type == EVENT_STATE_CHANGED:
+                parts = []
+                for key, value in self.data.items():
+                    if isinstance(value, State):
+                        parts.append(f"{JSON_DUMP(key)}:{value.as_json()}")
+                    else:
+                        parts.append(f"{JSON_DUMP(key)}:{JSON_DUMP(value)}")
+                self._data_json = "{" + ",".join(parts) + "}"
+            else:
+                self._data_json = JSON_DUMP(self.data)
+        return self._data_json
+
+    def as_json(self) -> str:
+        """Return the event encoded as JSON, like as_dict.
+
+        The result is cached. Raises ValueError or TypeError if the data
+        can't be serialized.
+        """
+        if self._as_json is None:
+            self._as_json = (
+                f'{{"event_type":{JSON_DUMP(self.event_type)},'
+                f'"data":{self.data_json()},'
+                f'"origin":"{self.origin.value}",'
+                f'"time_fired":"{self.time_fired.isoformat()}",'
+                f'"context":{JSON_DUMP(self.context.as_dict())}}}'
+            )
+        return self._as_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -663,6 +712,10 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._match_all_exclusions: dict[
+            tuple[HassJob, Callable | None], frozenset[str]
+        ] = {}
+        self._dispatch: dict[str, list[tuple[HassJob, Callable | None]]] = {}
         self._hass = hass
 
     @callback
@@ -708,12 +761,12 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_dispatch_list(event_type)
+            # Event types without listeners are not cached, they can be
+            # fired with any name and are cheap to look up
+            if listeners:
+                self._dispatch[event_type] = listeners
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
@@ -733,6 +786,40 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_dispatch_list(
+        self, event_type: str
+    ) -> list[tuple[HassJob, Callable | None]]:
+        """Return the listeners an event of event_type is dispatched to.
+
+        A non-empty result is cached by async_fire until the listeners change.
+        """
+        listeners = self._listeners.get(event_type, [])
+
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        if event_type == EVENT_HOMEASSISTANT_CLOSE:
+            return list(listeners)
+
+        exclusions = self._match_all_exclusions
+        match_all_listeners = [
+            filterable_job
+            for filterable_job in self._listeners.get(MATCH_ALL, [])
+            if filterable_job not in exclusions
+            or event_type not in exclusions[filterable_job]
+        ]
+        return match_all_listeners + listeners
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: str) -> None:
+        """Forget the cached listeners after the listeners of event_type changed.
+
+        The listeners of MATCH_ALL are part of the listeners of every event type.
+        """
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -755,6 +842,7 @@ class EventBus:
         event_type: str,
         listener: Callable,
         event_filter: Callable | None = None,
+        exclude_event_types: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -765,19 +853,31 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        A listener for all events can pass exclude_event_types. Events of
+        these types are never dispatched to it, without calling the
+        event_filter.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        return self._async_listen_filterable_job(
-            event_type, (HassJob(listener), event_filter)
-        )
+        if exclude_event_types is not None and event_type != MATCH_ALL:
+            raise HomeAssistantError(
+                "Event types can only be excluded when listening to all events"
+            )
+        filterable_job = (HassJob(listener), event_filter)
+        if exclude_event_types:
+            self._match_all_exclusions[filterable_job] = frozenset(
+                exclude_event_types
+            )
+        return self._async_listen_filterable_job(event_type, filterable_job)
 
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -852,6 +952,8 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+            self._match_all_exclusions.pop(filterable_job, None)
+            self._async_invalidate_dispatch(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -883,6 +985,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_attributes_json",
+        "_as_json",
     ]
 
     def __init__(
@@ -918,6 +1022,8 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._attributes_json: str | None = None
+        self._as_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -950,6 +1056,34 @@ class State:
             }
         return self._as_dict
 
+    def attributes_json(self) -> str:
+        """Return the attributes encoded as JSON.
+
+        The result is cached. Raises ValueError or TypeError if the
+        attributes can't be serialized.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = JSON_DUMP(dict(self.attributes))
+        return self._attributes_json
+
+    def as_json(self) -> str:
+        """Return the state encoded as JSON, like as_dict.
+
+        The result is cached. Raises ValueError or TypeError if the
+        attributes can't be serialized.
+        """
+        if self._as_json is None:
+            as_dict = self.as_dict()
+            self._as_json = (
+                f'{{"entity_id":{JSON_DUMP(self.entity_id)},'
+                f'"state":{JSON_DUMP(self.state)},'
+                f'"attributes":{self.attributes_json()},'
+                f'"last_changed":"{as_dict["last_changed"]}",'
+                f'"last_updated":"{as_dict["last_updated"]}",'
+                f'"context":{JSON_DUMP(as_dict["context"])}}}'
+            )
+        return self._as_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -44,6 +44,10 @@ DISABLED_USER = "user"
 ORPHANED_DEVICE_KEEP_SECONDS = 86400 * 30
 
 
+# Attributes which can be used to look up devices
+INDEXED_ATTRIBUTES = ("area_id", "config_entries")
+
+
 class _DeviceIndex(NamedTuple):
     identifiers: dict[tuple[str, str], str]
     connections: dict[tuple[str, str], str]
@@ -157,11 +161,17 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    # Devices by the value of an attribute, then by device id
+    _attr_index: dict[str, dict[str, dict[str, DeviceEntry]]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            journal_keys={"devices": "id", "deleted_devices": "id"},
+        )
         self._clear_index()
 
     @callback
@@ -183,6 +193,16 @@ class DeviceRegistry:
             return None
         return self.devices[device_id]
 
+    @callback
+    def async_entries_for_attribute(
+        self, attr_name: str, value: str
+    ) -> dict[str, DeviceEntry]:
+        """Return the devices with an indexed attribute set to or containing value.
+
+        The result is indexed by device id and must not be modified.
+        """
+        return self._attr_index[attr_name].get(value, {})
+
     def _async_get_deleted_device(
         self,
         identifiers: set[tuple[str, str]],
@@ -201,9 +221,12 @@ class DeviceRegistry:
         if isinstance(device, DeletedDeviceEntry):
             devices_index = self._deleted_index
             self.deleted_devices[device.id] = device
+            self._store.async_journal_item_changed("deleted_devices", device.id)
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._add_attr_index(device)
+            self._store.async_journal_item_changed("devices", device.id)
 
         _add_device_to_index(devices_index, device)
 
@@ -212,30 +235,57 @@ class DeviceRegistry:
         if isinstance(device, DeletedDeviceEntry):
             devices_index = self._deleted_index
             self.deleted_devices.pop(device.id)
+            self._store.async_journal_item_changed("deleted_devices", device.id)
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._remove_attr_index(device)
+            self._store.async_journal_item_changed("devices", device.id)
 
         _remove_device_from_index(devices_index, device)
 
     def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
+        self._store.async_journal_item_changed("devices", new_device.id)
 
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+        # Keep the position of the device in unchanged lookups
+        for attr_name, index in self._attr_index.items():
+            old_values = _indexed_values(old_device, attr_name)
+            new_values = _indexed_values(new_device, attr_name)
+            for value in old_values - new_values:
+                _remove_from_attr_index(index, value, old_device.id)
+            for value in new_values:
+                index.setdefault(value, {})[new_device.id] = new_device
+
+    def _add_attr_index(self, device: DeviceEntry) -> None:
+        """Add a device to the attribute lookups."""
+        for attr_name, index in self._attr_index.items():
+            for value in _indexed_values(device, attr_name):
+                index.setdefault(value, {})[device.id] = device
+
+    def _remove_attr_index(self, device: DeviceEntry) -> None:
+        """Remove a device from the attribute lookups."""
+        for attr_name, index in self._attr_index.items():
+            for value in _indexed_values(device, attr_name):
+                _remove_from_attr_index(index, value, device.id)
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._attr_index = {attr_name: {} for attr_name in INDEXED_ATTRIBUTES}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._add_attr_index(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -576,8 +626,10 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in list(
+            self.async_entries_for_attribute("config_entries", config_entry_id)
+        ):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
@@ -594,6 +646,7 @@ class DeviceRegistry:
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
+            self._store.async_journal_item_changed("deleted_devices", deleted_device.id)
             self.async_schedule_save()
 
     @callback
@@ -617,9 +670,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self.async_entries_for_attribute("area_id", area_id)):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -647,7 +699,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return list(registry.async_entries_for_attribute("area_id", area_id).values())
 
 
 @callback
@@ -655,11 +707,8 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    devices = registry.async_entries_for_attribute("config_entries", config_entry_id)
+    return list(devices.values())
 
 
 @callback
@@ -807,6 +856,26 @@ def _add_device_to_index(
         devices_index.connections[connection] = device.id
 
 
+def _indexed_values(device: DeviceEntry, attr_name: str) -> set[str]:
+    """Return the values of an attribute to index a device by."""
+    value = getattr(device, attr_name)
+    if value is None:
+        return set()
+    if isinstance(value, set):
+        return value
+    return {value}
+
+
+def _remove_from_attr_index(
+    index: dict[str, dict[str, DeviceEntry]], value: str, device_id: str
+) -> None:
+    """Remove a device from the lookup of an attribute value."""
+    devices = index[value]
+    del devices[device_id]
+    if not devices:
+        del index[value]
+
+
 def _remove_device_from_index(
     devices_index: _DeviceIndex,
     device: DeviceEntry | DeletedDeviceEntry,
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Callable, Iterable, Mapping
+import itertools
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -73,6 +74,9 @@ ENTITY_DESCRIBING_ATTRIBUTES = {
     "unit_of_measurement",
 }
 
+# Attributes which can be used to look up entries
+INDEXED_ATTRIBUTES = ("area_id", "config_entry_id", "device_id", "domain")
+
 
 @attr.s(slots=True, frozen=True)
 class RegistryEntry:
@@ -154,7 +158,13 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # Entries by the value of an attribute, then by entity_id
+        self._attr_index: dict[str, dict[str, dict[str, RegistryEntry]]] = {
+            attr_name: {} for attr_name in INDEXED_ATTRIBUTES
+        }
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, journal_keys={"entities": "entity_id"}
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -169,7 +179,11 @@ class EntityRegistry:
         The result is indexed by device_id, then by the matching (domain, device_class)
         """
         lookup: dict[str, dict[tuple[Any, Any], str]] = {}
-        for entity in self.entities.values():
+        domains = {domain for domain, _ in domain_device_classes}
+        for entity in itertools.chain.from_iterable(
+            self.async_entries_for_attribute("domain", domain).values()
+            for domain in domains
+        ):
             if not entity.device_id:
                 continue
             domain_device_class = (entity.domain, entity.device_class)
@@ -191,6 +205,16 @@ class EntityRegistry:
         """Get EntityEntry for an entity_id."""
         return self.entities.get(entity_id)
 
+    @callback
+    def async_entries_for_attribute(
+        self, attr_name: str, value: str
+    ) -> dict[str, RegistryEntry]:
+        """Return the entries with an indexed attribute set to value.
+
+        The result is indexed by entity_id and must not be modified.
+        """
+        return self._attr_index[attr_name].get(value, {})
+
     @callback
     def async_get_entity_id(
         self, domain: str, platform: str, unique_id: str
@@ -472,9 +496,8 @@ class EntityRegistry:
         if not new_values:
             return old
 
-        self._remove_index(old)
         new = attr.evolve(old, **new_values)
-        self._register_entry(new)
+        self._update_entry(old, new)
 
         self.async_schedule_save()
 
@@ -564,36 +587,67 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(
+            self.async_entries_for_attribute("config_entry_id", config_entry)
+        ):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self.async_entries_for_attribute("area_id", area_id)):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
         self._add_index(entry)
+        self._store.async_journal_item_changed("entities", entry.entity_id)
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for attr_name, index in self._attr_index.items():
+            if (value := getattr(entry, attr_name)) is not None:
+                index.setdefault(value, {})[entry.entity_id] = entry
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
         del self.entities[entry.entity_id]
+        self._store.async_journal_item_changed("entities", entry.entity_id)
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for attr_name, index in self._attr_index.items():
+            if (value := getattr(entry, attr_name)) is not None:
+                entries = index[value]
+                del entries[entry.entity_id]
+                if not entries:
+                    del index[value]
+
+    def _update_entry(self, old: RegistryEntry, new: RegistryEntry) -> None:
+        """Replace an entry, keeping its position in unchanged indexes."""
+        self.entities[new.entity_id] = new
+        self._store.async_journal_item_changed("entities", old.entity_id)
+        self._store.async_journal_item_changed("entities", new.entity_id)
+        del self._index[(old.domain, old.platform, old.unique_id)]
+        self._index[(new.domain, new.platform, new.unique_id)] = new.entity_id
+        for attr_name, index in self._attr_index.items():
+            old_value = getattr(old, attr_name)
+            new_value = getattr(new, attr_name)
+            if old_value == new_value and old.entity_id == new.entity_id:
+                if new_value is not None:
+                    index[new_value][new.entity_id] = new
+                continue
+            if old_value is not None:
+                entries = index[old_value]
+                del entries[old.entity_id]
+                if not entries:
+                    del index[old_value]
+            if new_value is not None:
+                index.setdefault(new_value, {})[new.entity_id] = new
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._attr_index = {attr_name: {} for attr_name in INDEXED_ATTRIBUTES}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -627,9 +681,10 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.async_entries_for_attribute(
+            "device_id", device_id
+        ).values()
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -638,7 +693,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return list(registry.async_entries_for_attribute("area_id", area_id).values())
 
 
 @callback
@@ -646,11 +701,8 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    entries = registry.async_entries_for_attribute("config_entry_id", config_entry_id)
+    return list(entries.values())
 
 
 @callback
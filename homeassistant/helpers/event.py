@@ -82,11 +82,14 @@ class TrackTemplate:
     The template is template to calculate.
     The variables are variables to pass to the template.
     The rate_limit is a rate limit on how often the template is re-rendered.
+    The render_cache reuses the last render while the state values it read
+    are unchanged.
     """
 
     template: Template
     variables: TemplateVarsType
     rate_limit: timedelta | None = None
+    render_cache: bool = False
 
 
 @dataclass
@@ -776,6 +779,8 @@ class _TrackTemplateResultInfo:
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
+            if track_template_.render_cache:
+                track_template_.template.async_enable_render_cache()
         self._track_templates = track_templates
 
         self._last_result: dict[Template, str | TemplateError] = {}
@@ -1495,14 +1500,23 @@ def _render_infos_to_track_states(render_infos: Iterable[RenderInfo]) -> TrackSt
 def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
 
     if info.filter(entity_id):
-        return True
+        # Skip changes to attributes the template did not read, unless the
+        # entity is also seen by iterating over all states or its domain
+        if (
+            new_state is None
+            or old_state is None
+            or info.exception
+            or info.all_states
+            or split_entity_id(entity_id)[0] in info.domains
+        ):
+            return True
+        return info.state_change_was_read(entity_id, old_state, new_state)
 
-    if (
-        event.data.get("new_state") is not None
-        and event.data.get("old_state") is not None
-    ):
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -355,26 +355,28 @@ async def async_extract_referenced_entity_ids(
 
     # Find devices for this area
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            dev_reg.async_entries_for_attribute("area_id", area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+    # Entities which area matches the target area
+    for area_id in selector.area_ids:
+        selected.indirectly_referenced.update(
+            ent_reg.async_entries_for_attribute("area_id", area_id)
+        )
+
+    for device_id in selected.referenced_devices:
+        for entity_id, ent_entry in ent_reg.async_entries_for_attribute(
+            "device_id", device_id
+        ).items():
+            # Entities of a target device, or of a referenced device
+            # with no explicitly set area
+            if not ent_entry.area_id or device_id in selector.device_ids:
+                selected.indirectly_referenced.add(entity_id)
 
     return selected
 
@@ -564,24 +566,13 @@ async def entity_service_call(
     # A list with entities to call the service on.
     entity_candidates: list[Entity] = []
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
-            else:
-                assert all_referenced is not None
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
-                )
-
-    elif target_all_entities:
+    if target_all_entities:
         # If we target all entities, we will select all entities the user
         # is allowed to control.
         for platform in platforms:
+            if entity_perms is None:
+                entity_candidates.extend(platform.entities.values())
+                continue
             entity_candidates.extend(
                 [
                     entity
@@ -592,24 +583,40 @@ async def entity_service_call(
 
     else:
         assert all_referenced is not None
+        # The entities are called in the order of their entity_id
+        sorted_referenced = sorted(all_referenced)
 
         for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+            # Look up the referenced entities in the entity_id index of the
+            # platform, unless the platform has fewer entities than referenced.
+            platform_entities = platform.entities
+            if len(sorted_referenced) <= len(platform_entities):
+                entities_iter: Iterable[Entity] = (
+                    entity
+                    for entity_id in sorted_referenced
+                    if (entity := platform_entities.get(entity_id)) is not None
+                )
+            else:
+                entities_iter = sorted(
+                    (
+                        entity
+                        for entity in platform_entities.values()
+                        if entity.entity_id in all_referenced
+                    ),
+                    key=lambda entity: entity.entity_id,
+                )
 
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
+            for entity in entities_iter:
+                if entity_perms is not None and not entity_perms(
+                    entity.entity_id, POLICY_CONTROL
+                ):
                     raise Unauthorized(
                         context=call.context,
                         entity_id=entity.entity_id,
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
-            entity_candidates.extend(platform_entities)
+                entity_candidates.append(entity)
 
     if not target_all_entities:
         assert referenced is not None
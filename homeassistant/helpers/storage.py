@@ -4,10 +4,12 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import json
 from json import JSONEncoder
 import logging
 import os
 from typing import Any
+import uuid
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
@@ -23,6 +25,11 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+# A journaled store is compacted once the journal is bigger than this
+# part of the snapshot, or the minimum size
+JOURNAL_COMPACT_RATIO = 0.5
+JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+
 
 @bind_hass
 async def async_migrator(
@@ -78,8 +85,16 @@ class Store:
         private: bool = False,
         *,
         encoder: type[JSONEncoder] | None = None,
+        journal_keys: dict[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A store with journal_keys appends the changed items of the lists in
+        the data to a journal instead of rewriting the whole file. The keys
+        are the names of the lists, the values the item field to key them by.
+        The owner of the data marks the items it adds, changes or removes
+        with async_journal_item_changed.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -90,6 +105,16 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
+        self._journal_keys = journal_keys
+        # The keys of the items and the encoded remaining data as last
+        # persisted, and the keys of the items changed since
+        self._journal_item_keys: dict[str, set[str]] | None = None
+        self._journal_other: str | None = None
+        self._journal_changed: dict[str, set[str]] = {}
+        self._journal_writing: dict[str, set[str]] = {}
+        self._journal_id: str | None = None
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
 
     @property
     def path(self):
@@ -130,6 +155,10 @@ class Store:
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+        elif self._journal_keys:
+            data = await self.hass.async_add_executor_job(
+                self._load_journaled_data, self.path
+            )
         else:
             data = await self.hass.async_add_executor_job(
                 json_util.load_json, self.path
@@ -175,6 +204,14 @@ class Store:
             self.hass, delay, self._async_callback_delayed_write
         )
 
+    @callback
+    def async_journal_item_changed(self, list_name: str, key: str) -> None:
+        """Mark an item of a journaled list as added, changed or removed.
+
+        Only the marked items are encoded and appended to the journal.
+        """
+        self._journal_changed.setdefault(list_name, set()).add(key)
+
     @callback
     def _async_ensure_final_write_listener(self) -> None:
         """Ensure that we write if we quit before delay has passed."""
@@ -226,6 +263,9 @@ class Store:
                 data["data"] = data.pop("data_func")()
 
             self._data = None
+            if self._journal_keys:
+                self._journal_writing = self._journal_changed
+                self._journal_changed = {}
 
             try:
                 await self.hass.async_add_executor_job(
@@ -239,9 +279,194 @@ class Store:
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
+        if self._journal_keys:
+            self._write_journaled_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_util.save_json(path, data, self._private, encoder=self._encoder)
 
+    def _encode(self, data: Any) -> str:
+        """Encode data for the journal."""
+        try:
+            return json.dumps(data, cls=self._encoder, separators=(",", ":"))
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {self.key}: {err}"
+            ) from err
+
+    def _encode_journaled(self, data: dict) -> tuple[dict[str, set[str]], str]:
+        """Return the keys of the journaled items and encode the remaining data."""
+        assert self._journal_keys is not None
+        item_keys = {
+            list_name: {item[key_field] for item in data["data"].get(list_name, [])}
+            for list_name, key_field in self._journal_keys.items()
+        }
+        other = self._encode(
+            {
+                "version": data["version"],
+                "data": {
+                    key: value
+                    for key, value in data["data"].items()
+                    if key not in self._journal_keys
+                },
+            }
+        )
+        return item_keys, other
+
+    def _write_journaled_data(self, path: str, data: dict) -> None:
+        """Append the changed items to the journal, or write a new snapshot."""
+        assert self._journal_keys is not None
+        item_keys, other = self._encode_journaled(data)
+        old_item_keys = self._journal_item_keys
+        changed = self._journal_writing
+        self._journal_writing = {}
+        # Write a complete snapshot next time if this write fails
+        self._journal_item_keys = None
+
+        if (
+            old_item_keys is None
+            or other != self._journal_other
+            or self._journal_bytes
+            > max(
+                JOURNAL_COMPACT_MIN_BYTES,
+                self._snapshot_bytes * JOURNAL_COMPACT_RATIO,
+            )
+        ):
+            journal_id = uuid.uuid4().hex
+            _LOGGER.debug("Writing snapshot for %s to %s", self.key, path)
+            json_util.save_json(
+                path,
+                {**data, "journal_id": journal_id},
+                self._private,
+                encoder=self._encoder,
+            )
+            with suppress(FileNotFoundError):
+                os.unlink(f"{path}.journal")
+            self._journal_item_keys = item_keys
+            self._journal_other = other
+            self._journal_id = journal_id
+            self._journal_bytes = 0
+            self._snapshot_bytes = os.path.getsize(path)
+            return
+
+        records = []
+        for list_name, key_field in self._journal_keys.items():
+            if not (changed_keys := changed.get(list_name)):
+                continue
+            items = {item[key_field]: item for item in data["data"].get(list_name, [])}
+            for key in sorted(changed_keys):
+                if (item := items.get(key)) is not None:
+                    records.append(
+                        f'{{"list":{json.dumps(list_name)},"key":{json.dumps(key)},'
+                        f'"item":{self._encode(item)}}}\n'
+                    )
+                elif key in old_item_keys[list_name]:
+                    records.append(
+                        f'{{"list":{json.dumps(list_name)},"key":{json.dumps(key)}}}\n'
+                    )
+
+        if not records:
+            self._journal_item_keys = item_keys
+            return
+
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        if not self._journal_bytes:
+            # Start a new journal, replacing any left over from a failed write
+            records.insert(0, f'{{"journal_id":{json.dumps(self._journal_id)}}}\n')
+            flags |= os.O_TRUNC
+
+        _LOGGER.debug("Appending %s records for %s", len(records), self.key)
+        journal = "".join(records).encode("utf-8")
+        journal_path = f"{path}.journal"
+        try:
+            fd = os.open(journal_path, flags, 0o600 if self._private else 0o644)
+            with os.fdopen(fd, "ab") as fdesc:
+                fdesc.write(journal)
+        except OSError as err:
+            _LOGGER.exception("Appending to journal failed: %s", journal_path)
+            raise json_util.WriteError(err) from err
+
+        self._journal_item_keys = item_keys
+        self._journal_bytes += len(journal)
+
+    def _load_journaled_data(self, path: str) -> dict:
+        """Load the snapshot and replay the journal."""
+        data = json_util.load_json(path)
+        self._journal_item_keys = None
+        if not data:
+            return data
+
+        journal_id = data.pop("journal_id", None)
+        journal_path = f"{path}.journal"
+        journal_bytes = 0
+        replayed = True
+        try:
+            with open(journal_path, encoding="utf-8") as fdesc:
+                header_line = fdesc.readline()
+                header = json.loads(header_line or "{}")
+                if journal_id is None or header.get("journal_id") != journal_id:
+                    # The journal belongs to an older snapshot
+                    lines = []
+                else:
+                    journal_bytes = len(header_line.encode("utf-8"))
+                    lines = fdesc.readlines()
+        except FileNotFoundError:
+            lines = []
+        except (OSError, ValueError):
+            _LOGGER.exception("Could not read journal: %s", journal_path)
+            lines = []
+            replayed = False
+
+        if lines:
+            assert self._journal_keys is not None
+            lists = {
+                list_name: {
+                    item[key_field]: item
+                    for item in data["data"].get(list_name, [])
+                }
+                for list_name, key_field in self._journal_keys.items()
+            }
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # The last record was not completely written
+                    _LOGGER.warning(
+                        "Ignoring incomplete journal record for %s", self.key
+                    )
+                    replayed = False
+                    break
+                if (
+                    not isinstance(record, dict)
+                    or record.get("list") not in lists
+                    or "key" not in record
+                ):
+                    _LOGGER.warning(
+                        "Ignoring invalid journal record for %s: %s", self.key, line
+                    )
+                    replayed = False
+                    continue
+                journal_bytes += len(line.encode("utf-8"))
+                if "item" in record:
+                    lists[record["list"]][record["key"]] = record["item"]
+                else:
+                    lists[record["list"]].pop(record["key"], None)
+            for list_name, list_items in lists.items():
+                data["data"][list_name] = list(list_items.values())
+
+        # A snapshot written before journaling has no journal id, the first
+        # save writes a snapshot with one
+        if replayed and journal_id is not None and data["version"] == self.version:
+            # Changes are appended to the journal from here
+            self._journal_item_keys, self._journal_other = self._encode_journaled(
+                data
+            )
+            self._journal_id = journal_id
+            self._journal_bytes = journal_bytes
+            self._snapshot_bytes = os.path.getsize(path)
+        return data
+
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -253,3 +478,9 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_keys:
+            self._journal_item_keys = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}.journal"
+                )
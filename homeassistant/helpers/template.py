@@ -74,6 +74,13 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# What a template read from a state, besides the properties of the state
+READ_EXISTS = "exists"
+READ_OBJECT = "object"
+# Everything of a state is read when it is rendered as a whole
+READ_ALL = "all"
+READ_ATTRIBUTE_PREFIX = "attributes."
+
 _COLLECTABLE_STATE_ATTRIBUTES = {
     "state",
     "attributes",
@@ -226,6 +233,8 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entity id -> what the template read from its state
+        self.reads: dict[str, collections.abc.Set[str]] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -233,6 +242,24 @@ class RenderInfo:
         """Representation of RenderInfo."""
         return f"<RenderInfo {self.template} all_states={self.all_states} all_states_lifecycle={self.all_states_lifecycle} domains={self.domains} domains_lifecycle={self.domains_lifecycle} entities={self.entities} rate_limit={self.rate_limit}> has_time={self.has_time}"
 
+    def _collect_read(self, entity_id: str, read: str) -> None:
+        """Collect an entity and what the template read from its state."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        if (reads := self.reads.get(entity_id)) is None:
+            reads = self.reads[entity_id] = set()
+        reads.add(read)  # type: ignore[attr-defined]
+
+    def state_change_was_read(
+        self, entity_id: str, old_state: State, new_state: State
+    ) -> bool:
+        """Return if a state change altered anything the template read."""
+        if (reads := self.reads.get(entity_id)) is None:
+            return True
+        return any(
+            state_read_value(old_state, read) != state_read_value(new_state, read)
+            for read in reads
+        )
+
     def _filter_domains_and_entities(self, entity_id: str) -> bool:
         """Template should re-render if the entity state changes when we match specific domains or entities."""
         return (
@@ -260,6 +287,9 @@ class RenderInfo:
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
+        self.reads = {
+            entity_id: frozenset(reads) for entity_id, reads in self.reads.items()
+        }
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -292,6 +322,95 @@ class RenderInfo:
             self.filter = _false
 
 
+def state_read_value(state: State | None, read: str) -> Any:
+    """Return the value a template read from a state."""
+    if state is None:
+        return None
+    if read == READ_EXISTS:
+        return True
+    if read == READ_OBJECT:
+        return state
+    if read == READ_ALL:
+        return (
+            state.state,
+            state.attributes,
+            state.context,
+            state.last_changed,
+            state.last_updated,
+        )
+    if read.startswith(READ_ATTRIBUTE_PREFIX):
+        return state.attributes.get(read[len(READ_ATTRIBUTE_PREFIX) :])
+    return getattr(state, read)
+
+
+class RenderCache:
+    """Remember the last render of a template and the state values it read.
+
+    The render is reused while the values read from the state machine are
+    unchanged. Renders that iterate states, use the time or raise an error
+    are not reused. Neither are renders with other variables, which are
+    compared by identity.
+    """
+
+    __slots__ = ("hits", "misses", "_render_info", "_variables", "_values")
+
+    def __init__(self) -> None:
+        """Initialize the render cache."""
+        self.hits = 0
+        self.misses = 0
+        self._render_info: RenderInfo | None = None
+        self._variables: TemplateVarsType = None
+        self._values: dict[tuple[str, str], Any] = {}
+
+    @callback
+    def async_get(
+        self, hass: HomeAssistant, variables: TemplateVarsType
+    ) -> RenderInfo | None:
+        """Return the last render if it is still valid."""
+        if (render_info := self._render_info) is None or variables is not (
+            self._variables
+        ):
+            self.misses += 1
+            return None
+
+        states = hass.states
+        for (entity_id, read), value in self._values.items():
+            if state_read_value(states.get(entity_id), read) != value:
+                self.misses += 1
+                return None
+
+        self.hits += 1
+        return render_info
+
+    @callback
+    def async_set(
+        self,
+        hass: HomeAssistant,
+        render_info: RenderInfo,
+        variables: TemplateVarsType,
+    ) -> None:
+        """Remember a render if it only depends on the values it read."""
+        if (
+            render_info.exception
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+            or render_info.has_time
+        ):
+            self._render_info = None
+            return
+
+        states = hass.states
+        self._render_info = render_info
+        self._variables = variables
+        self._values = {
+            (entity_id, read): state_read_value(states.get(entity_id), read)
+            for entity_id, reads in render_info.reads.items()
+            for read in reads
+        }
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -300,6 +419,7 @@ class Template:
         "template",
         "hass",
         "is_static",
+        "render_cache",
         "_compiled_code",
         "_compiled",
         "_exc_info",
@@ -317,6 +437,7 @@ class Template:
         self._compiled: jinja2.Template | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
+        self.render_cache: RenderCache | None = None
         self._exc_info = None
         self._limited = None
         self._strict = None
@@ -493,6 +614,13 @@ class Template:
 
         return False
 
+    @callback
+    def async_enable_render_cache(self) -> RenderCache:
+        """Reuse renders to info while the state values they read are unchanged."""
+        if self.render_cache is None:
+            self.render_cache = RenderCache()
+        return self.render_cache
+
     @callback
     def async_render_to_info(
         self, variables: TemplateVarsType = None, strict: bool = False, **kwargs: Any
@@ -500,6 +628,12 @@ class Template:
         """Render the template and collect an entity filter."""
         assert self.hass and _RENDER_INFO not in self.hass.data
 
+        render_cache = None if kwargs or strict or self.is_static else self.render_cache
+        if render_cache is not None and (
+            cached := render_cache.async_get(self.hass, variables)
+        ):
+            return cached
+
         render_info = RenderInfo(self)
 
         # pylint: disable=protected-access
@@ -517,6 +651,8 @@ class Template:
             del self.hass.data[_RENDER_INFO]
 
         render_info._freeze()
+        if render_cache is not None:
+            render_cache.async_set(self.hass, render_info, variables)
         return render_info
 
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
@@ -720,9 +856,14 @@ class TemplateState(State):
         self._state = state
         self._collect = collect
 
-    def _collect_state(self) -> None:
+    def _collect_state(self, read: str) -> None:
         if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            self._hass.data[_RENDER_INFO]._collect_read(self._state.entity_id, read)
+
+    def _attribute(self, name: str) -> Any:
+        """Return an attribute, only collecting a read of that attribute."""
+        self._collect_state(f"{READ_ATTRIBUTE_PREFIX}{name}")
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -731,7 +872,9 @@ class TemplateState(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+                self._hass.data[_RENDER_INFO]._collect_read(
+                    self._state.entity_id, item
+                )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._state.entity_id
@@ -750,72 +893,76 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self):
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self):
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self):
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state("domain")
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state("object_id")
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("name")
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state(f"{READ_ATTRIBUTE_PREFIX}{ATTR_UNIT_OF_MEASUREMENT}")
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
     def __eq__(self, other: Any) -> bool:
         """Ensure we collect on equality check."""
-        self._collect_state()
+        self._collect_state(READ_OBJECT)
         return self._state.__eq__(other)
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state(READ_ALL)
         return f"<template TemplateState({self._state.__repr__()})>"
 
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     entity_collect = hass.data.get(_RENDER_INFO)
     if entity_collect is not None:
-        entity_collect.entities.add(entity_id)
+        entity_collect._collect_read(  # pylint: disable=protected-access
+            entity_id, READ_EXISTS
+        )
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
@@ -1182,7 +1329,7 @@ def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     state_obj = _get_state(hass, entity_id)
     if state_obj is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._attribute(name)  # pylint: disable=protected-access
     return None
 
 
@@ -7,11 +7,13 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
 import functools as ft
 import importlib
 import json
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -23,6 +25,7 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from homeassistant.const import __version__
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
@@ -45,6 +48,11 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_INTEGRATION_CACHE = "integration_cache"
+DATA_INTEGRATION_CACHE_STORE = "integration_cache_store"
+INTEGRATION_CACHE_KEY = "core.integration_cache"
+INTEGRATION_CACHE_VERSION = 1
+INTEGRATION_CACHE_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -57,6 +65,7 @@ CUSTOM_WARNING = (
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
 MAX_LOAD_CONCURRENTLY = 4
+MAX_IMPORT_CONCURRENTLY = 4
 
 
 class Manifest(TypedDict, total=False):
@@ -100,6 +109,154 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class IntegrationCache:
+    """Persisted manifests and resolved dependencies of integrations.
+
+    The manifests of built-in integrations are valid as long as the version of
+    Home Assistant does not change. Custom manifests and the sub directories of
+    the custom_components directories are valid as long as their modification
+    time does not change, which is checked on every lookup. The resolved
+    dependencies are dropped as soon as a custom manifest is added, changed or
+    removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the integration cache."""
+        # Manifest path -> modification time for custom manifests, manifest
+        self._manifests: dict[str, tuple[float | None, Manifest]] = {}
+        self._dependencies: dict[str, list[str]] = {}
+        # Custom components path -> modification time, sub directory names
+        self._sub_directories: dict[str, tuple[float, list[str]]] = {}
+
+    def restore(self, data: dict[str, Any] | None) -> None:
+        """Restore the cached data that is still valid."""
+        if not data or data["ha_version"] != __version__:
+            return
+
+        unchanged = True
+        for manifest_path, (mtime, manifest) in data["manifests"].items():
+            if mtime is not None:
+                try:
+                    if os.stat(manifest_path).st_mtime != mtime:
+                        unchanged = False
+                        continue
+                except OSError:
+                    unchanged = False
+                    continue
+            self._manifests[manifest_path] = (mtime, manifest)
+
+        if unchanged:
+            self._dependencies = data["dependencies"]
+        self._sub_directories = data.get("sub_directories", {})
+
+    def data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "ha_version": __version__,
+            "manifests": dict(self._manifests),
+            "dependencies": dict(self._dependencies),
+            "sub_directories": dict(self._sub_directories),
+        }
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the cached manifest at a path.
+
+        A custom manifest that changed since it was cached is dropped, with
+        the resolved dependencies.
+        """
+        if (cached := self._manifests.get(str(manifest_path))) is None:
+            return None
+        mtime, manifest = cached
+        if mtime is not None:
+            try:
+                changed = manifest_path.stat().st_mtime != mtime
+            except OSError:
+                changed = True
+            if changed:
+                del self._manifests[str(manifest_path)]
+                self._dependencies = {}
+                return None
+        return manifest
+
+    def set_manifest(
+        self, manifest_path: pathlib.Path, manifest: Manifest, built_in: bool
+    ) -> None:
+        """Cache a manifest that was read from disk."""
+        if built_in:
+            self._manifests[str(manifest_path)] = (None, manifest)
+            return
+        self._manifests[str(manifest_path)] = (manifest_path.stat().st_mtime, manifest)
+        self._dependencies = {}
+
+    def record(self, integrations: Iterable[Integration]) -> None:
+        """Cache the manifests of integrations resolved before the cache loaded."""
+        for integration in integrations:
+            manifest_path = integration.file_path / "manifest.json"
+            if str(manifest_path) in self._manifests or not manifest_path.is_file():
+                continue
+            self.set_manifest(
+                manifest_path, integration.manifest, integration.is_built_in
+            )
+
+    def get_sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a directory.
+
+        The directory is only listed again when its modification time changed.
+        """
+        mtime = os.stat(path).st_mtime
+        if (cached := self._sub_directories.get(path)) is not None and (
+            cached[0] == mtime
+        ):
+            return cached[1]
+        names = [entry.name for entry in pathlib.Path(path).iterdir() if entry.is_dir()]
+        self._sub_directories[path] = (mtime, names)
+        return names
+
+    def get_dependencies(self, domain: str) -> set[str] | None:
+        """Return the cached dependencies of an integration."""
+        if (dependencies := self._dependencies.get(domain)) is None:
+            return None
+        return set(dependencies)
+
+    def set_dependencies(self, domain: str, dependencies: set[str]) -> None:
+        """Cache the resolved dependencies of an integration."""
+        self._dependencies[domain] = sorted(dependencies)
+
+
+async def async_load_integration_cache(hass: HomeAssistant) -> None:
+    """Load the cached manifests and dependencies of integrations."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    store = Store(hass, INTEGRATION_CACHE_VERSION, INTEGRATION_CACHE_KEY)
+    cache = IntegrationCache()
+    await hass.async_add_executor_job(cache.restore, await store.async_load())
+
+    resolved = [
+        integration
+        for integration in hass.data.get(DATA_INTEGRATIONS, {}).values()
+        if isinstance(integration, Integration)
+    ]
+    if isinstance(custom := hass.data.get(DATA_CUSTOM_COMPONENTS), dict):
+        resolved.extend(custom.values())
+    if resolved:
+        await hass.async_add_executor_job(cache.record, resolved)
+    hass.data[DATA_INTEGRATION_CACHE] = cache
+    hass.data[DATA_INTEGRATION_CACHE_STORE] = store
+
+
+def async_schedule_save_integration_cache(hass: HomeAssistant) -> None:
+    """Schedule saving the cached manifests and dependencies of integrations.
+
+    This method must be run in the event loop.
+    """
+    if (store := hass.data.get(DATA_INTEGRATION_CACHE_STORE)) is not None:
+        store.async_delay_save(
+            hass.data[DATA_INTEGRATION_CACHE].data_to_save,
+            INTEGRATION_CACHE_SAVE_DELAY,
+        )
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -112,8 +269,16 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
+    cache: IntegrationCache | None = hass.data.get(DATA_INTEGRATION_CACHE)
+
     def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
         """Return all sub directories in a set of paths."""
+        if cache is not None:
+            return [
+                pathlib.Path(path) / name
+                for path in paths
+                for name in cache.get_sub_directories(path)
+            ]
         return [
             entry
             for path in paths
@@ -297,19 +462,28 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        cache: IntegrationCache | None = hass.data.get(DATA_INTEGRATION_CACHE)
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+            if cache is None or (manifest := cache.get_manifest(manifest_path)) is None:
+                if not manifest_path.is_file():
+                    continue
+
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                if cache is not None:
+                    cache.set_manifest(
+                        manifest_path,
+                        manifest,
+                        root_module.__name__ == PACKAGE_BUILTIN,
+                    )
 
             integration = cls(
                 hass,
@@ -492,6 +666,14 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        cache: IntegrationCache | None = self.hass.data.get(DATA_INTEGRATION_CACHE)
+        if cache is not None and (
+            cached_dependencies := cache.get_dependencies(self.domain)
+        ) is not None:
+            self._all_dependencies = cached_dependencies
+            self._all_dependencies_resolved = True
+            return True
+
         try:
             dependencies = await _async_component_dependencies(
                 self.hass, self.domain, self, set(), set()
@@ -499,6 +681,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if cache is not None:
+                cache.set_dependencies(self.domain, dependencies)
         except IntegrationNotFound as err:
             _LOGGER.error(
                 "Unable to resolve dependencies for %s:  we are unable to resolve (sub)dependency %s",
@@ -536,11 +720,67 @@ class Integration:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def preload(self, platform_names: Iterable[str]) -> None:
+        """Import the component and its platforms for the given domains.
+
+        This is run in the executor so get_component and get_platform only
+        have to look up the imported modules. Errors are left to be reported
+        when the integration is set up. Integrations with requirements that
+        are not installed yet are skipped, they are imported once the
+        requirements are processed.
+        """
+        cache = self.hass.data.get(DATA_COMPONENTS, {})
+        if self.domain in cache:
+            return
+
+        if self.requirements:
+            # pylint: disable=import-outside-toplevel
+            from homeassistant.util.package import is_installed
+
+            if not all(is_installed(req) for req in self.requirements):
+                return
+
+        try:
+            importlib.import_module(self.pkg_path)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to preload %s", self.pkg_path, exc_info=True)
+            return
+
+        for platform_name in platform_names:
+            if not (self.file_path / f"{platform_name}.py").is_file():
+                continue
+            try:
+                importlib.import_module(f"{self.pkg_path}.{platform_name}")
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Unable to preload %s.%s",
+                    self.pkg_path,
+                    platform_name,
+                    exc_info=True,
+                )
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+async def async_preload_integrations(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    platform_names: Iterable[str],
+) -> None:
+    """Import integrations and their platforms in the executor."""
+    platform_names = frozenset(platform_names)
+    await gather_with_concurrency(
+        MAX_IMPORT_CONCURRENTLY,
+        *(
+            hass.async_add_executor_job(integration.preload, platform_names)
+            for integration in integrations
+        ),
+        return_exceptions=True,
+    )
+
+
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration."""
     cache = hass.data.get(DATA_INTEGRATIONS)
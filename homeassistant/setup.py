@@ -5,8 +5,10 @@ import asyncio
 from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
 import logging.handlers
+from time import monotonic
 from timeit import default_timer as timer
 from types import ModuleType
+from typing import Any
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -57,6 +59,7 @@ BASE_PLATFORMS = {
 DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP_TIME = "setup_time"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
@@ -64,6 +67,9 @@ DATA_DEPS_REQS = "deps_reqs_processed"
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+TIMELINE_PROBE_INTERVAL = 0.1
+TIMELINE_LOOP_BLOCKED_THRESHOLD = 0.05
+
 
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str]) -> None:
@@ -203,7 +209,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_trace_setup_phase(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -211,9 +218,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_trace_setup_phase(hass, domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -250,8 +258,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_trace_setup_phase(hass, domain, "async_setup"):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 "Setup of %s is taking longer than %s seconds."
@@ -331,7 +340,8 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with async_trace_setup_phase(hass, integration.domain, f"import {domain}"):
+            platform = integration.get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -374,10 +384,11 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_trace_setup_phase(hass, integration.domain, "requirements"):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -463,6 +474,7 @@ def async_start_setup(
     """Keep track of when setup starts and finishes."""
     setup_started = hass.data.setdefault(DATA_SETUP_STARTED, {})
     started = dt_util.utcnow()
+    started_monotonic = monotonic()
     unique_components = {}
     for domain in components:
         unique = ensure_unique_string(domain, setup_started)
@@ -473,6 +485,7 @@ def async_start_setup(
 
     setup_time = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    timeline: SetupTimeline | None = hass.data.get(DATA_SETUP_TIMELINE)
     for unique, domain in unique_components.items():
         del setup_started[unique]
         if "." in domain:
@@ -483,3 +496,169 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+        if timeline is not None:
+            timeline.async_add(
+                integration, f"setup {domain}", started_monotonic, monotonic()
+            )
+
+
+@contextlib.contextmanager
+def async_trace_setup_phase(
+    hass: core.HomeAssistant, integration: str, phase: str
+) -> Generator[None, None, None]:
+    """Record a phase of the setup of an integration on the startup timeline."""
+    if (timeline := hass.data.get(DATA_SETUP_TIMELINE)) is None:
+        yield
+        return
+
+    start = monotonic()
+    try:
+        yield
+    finally:
+        timeline.async_add(integration, phase, start, monotonic())
+
+
+class SetupTimeline:
+    """Timeline of the setup of integrations during startup.
+
+    Besides the phases of the setup of each integration, the timeline probes
+    how long the event loop is blocked and how long jobs wait to be run in
+    the executor. It can be exported in the Chrome trace event format.
+
+    Spans on a thread of a trace must nest. Phases of an integration that
+    run concurrently, like the setup of its config entries, are put on
+    extra rows of the integration.
+    """
+
+    def __init__(self, hass: core.HomeAssistant) -> None:
+        """Initialize the timeline."""
+        self.hass = hass
+        self.start = monotonic()
+        self.recording = True
+        self._events: list[dict[str, Any]] = []
+        self._rows: dict[str, int] = {}
+        self._lanes: dict[str, list[list[tuple[float, float]]]] = {}
+        self._probes: list[asyncio.Task[None]] = []
+
+    @core.callback
+    def async_start_probes(self) -> None:
+        """Start probing the event loop and the executor."""
+        # Not tracked, or waiting for startup to finish would never end
+        self._probes = [
+            self.hass.loop.create_task(self._async_probe_loop()),
+            self.hass.loop.create_task(self._async_probe_executor()),
+        ]
+
+    @core.callback
+    def async_stop(self) -> None:
+        """Stop recording."""
+        self.recording = False
+        for probe in self._probes:
+            probe.cancel()
+        self._probes = []
+
+    @core.callback
+    def async_add(self, row: str, name: str, start: float, end: float) -> None:
+        """Add a span to a row of the timeline."""
+        if not self.recording:
+            return
+        self._events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": round((end - start) * 1_000_000),
+                "pid": 1,
+                "tid": self._lane(row, start, end),
+            }
+        )
+
+    @core.callback
+    def async_add_counter(self, name: str, at: float, value: float) -> None:
+        """Add a value in milliseconds of a counter to the timeline."""
+        if not self.recording:
+            return
+        self._events.append(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": self._timestamp(at),
+                "pid": 1,
+                "args": {"ms": value},
+            }
+        )
+
+    @core.callback
+    def async_as_trace(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format."""
+        rows = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": row},
+            }
+            for row, tid in self._rows.items()
+        ]
+        return {"traceEvents": rows + self._events, "displayTimeUnit": "ms"}
+
+    def _timestamp(self, at: float) -> int:
+        """Return the microseconds since the start of the timeline."""
+        return round((at - self.start) * 1_000_000)
+
+    def _lane(self, row: str, start: float, end: float) -> int:
+        """Return the id of the first row a span nests in.
+
+        Spans are added when they end, so a span nests in a row if the spans
+        of the row that end after it started also started after it.
+        """
+        lanes = self._lanes.setdefault(row, [])
+        for index, spans in enumerate(lanes):
+            if all(
+                span_start >= start
+                for span_start, span_end in spans
+                if span_end > start
+            ):
+                break
+        else:
+            index = len(lanes)
+            spans = []
+            lanes.append(spans)
+        spans.append((start, end))
+        return self._row(row if index == 0 else f"{row} ({index + 1})")
+
+    def _row(self, row: str) -> int:
+        """Return the id of a row."""
+        if (tid := self._rows.get(row)) is None:
+            tid = self._rows[row] = len(self._rows) + 1
+        return tid
+
+    async def _async_probe_loop(self) -> None:
+        """Record when the event loop was blocked."""
+        while True:
+            start = monotonic()
+            await asyncio.sleep(TIMELINE_PROBE_INTERVAL)
+            end = monotonic()
+            if end - start - TIMELINE_PROBE_INTERVAL > TIMELINE_LOOP_BLOCKED_THRESHOLD:
+                self.async_add(
+                    "event loop", "blocked", start + TIMELINE_PROBE_INTERVAL, end
+                )
+
+    async def _async_probe_executor(self) -> None:
+        """Record how long a job waits to be run in the executor."""
+        while True:
+            queued = monotonic()
+            started = await self.hass.loop.run_in_executor(None, monotonic)
+            self.async_add_counter(
+                "executor queue wait", queued, round((started - queued) * 1000, 3)
+            )
+            await asyncio.sleep(TIMELINE_PROBE_INTERVAL)
+
+
+@core.callback
+def async_start_timeline(hass: core.HomeAssistant) -> SetupTimeline:
+    """Start recording the startup timeline."""
+    timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline(hass)
+    timeline.async_start_probes()
+    return timeline
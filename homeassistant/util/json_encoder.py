@@ -0,0 +1,37 @@
+"""JSON encoding of Home Assistant objects.
+
+This module has no dependencies on the rest of Home Assistant, so it can be
+imported by the core as well as by the helpers.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import functools
+import json
+from typing import Any
+
+
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+
+        return json.JSONEncoder.default(self, o)
+
+
+# The encoding of State.as_json and Event.as_json which is shared
+# by the recorder, the websocket api and integrations
+JSON_DUMP: Callable[[Any], str] = functools.partial(
+    json.dumps, cls=JSONEncoder, separators=(",", ":"), allow_nan=False
+)
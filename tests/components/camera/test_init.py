@@ -2,14 +2,16 @@
 import asyncio
 import base64
 import io
-from unittest.mock import Mock, PropertyMock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
 import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import (
+    DATA_SCALED_IMAGES,
     DOMAIN,
     PREF_PRELOAD_STREAM,
+    SCALED_IMAGE_MAX_SIZES,
     STREAM_TYPE_WEB_RTC,
 )
 from homeassistant.components.camera.prefs import CameraEntityPreferences
@@ -166,6 +168,65 @@ async def test_get_image_from_camera_with_width_height_scaled(hass, image_mock_u
     assert image.content == EMPTY_8_6_JPEG
 
 
+async def test_get_image_from_camera_scaled_shared(hass, image_mock_url):
+    """Test scaled images are shared between requests for the same size."""
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch("homeassistant.components.camera.SCALED_IMAGE_CACHE_TTL", 0), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ) as mock_camera:
+        images = await asyncio.gather(
+            camera.async_get_image(hass, "camera.demo_camera", width=4, height=3),
+            camera.async_get_image(hass, "camera.demo_camera", width=4, height=3),
+        )
+        assert mock_camera.call_count == 1
+        assert turbo_jpeg.scale_with_quality.call_count == 1
+        assert images[0] == images[1]
+        assert images[0].content == EMPTY_8_6_JPEG
+
+        # The snapshot did not change, so it is fetched but not scaled again
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        assert mock_camera.call_count == 2
+        assert turbo_jpeg.scale_with_quality.call_count == 1
+        assert image.content == EMPTY_8_6_JPEG
+
+
+async def test_get_image_from_camera_scaled_bounded(hass, image_mock_url):
+    """Test the scaled images of a camera are dropped on expiry and bounded."""
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch("homeassistant.components.camera.SCALED_IMAGE_CACHE_TTL", 0), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ):
+        for width in range(4, 4 + SCALED_IMAGE_MAX_SIZES + 1):
+            await camera.async_get_image(
+                hass, "camera.demo_camera", width=width, height=3
+            )
+        await hass.async_block_till_done()
+
+    cache = hass.data[DATA_SCALED_IMAGES]
+    assert not cache._images
+    assert list(cache._scaled["camera.demo_camera"]) == [
+        (width, 3) for width in range(5, 5 + SCALED_IMAGE_MAX_SIZES)
+    ]
+
+
 async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     """Grab an image from camera entity that we cannot scale."""
 
@@ -491,6 +552,85 @@ async def test_camera_proxy_stream(hass, mock_camera, hass_client):
         assert response.status == HTTP_BAD_GATEWAY
 
 
+async def test_still_stream_broadcaster(hass):
+    """Test a still stream polls the camera once for all clients."""
+    images = iter([b"first", b"first", b"second", None])
+    image_cb = AsyncMock(side_effect=lambda: next(images))
+    done = Mock()
+    broadcaster = camera.StillStreamBroadcaster(
+        hass, image_cb, "image/jpeg", 0, done
+    )
+
+    first = broadcaster.async_attach()
+    second = broadcaster.async_attach()
+    frames = [await first.get(), await first.get()]
+
+    # The first image is sent twice
+    assert frames[0] == frames[1]
+    assert frames[0].endswith(b"first\r\n")
+    assert await second.get() == frames[0]
+    assert await second.get() == frames[0]
+    await hass.async_block_till_done()
+
+    # The unchanged image is skipped and the stream ends without images
+    assert (await first.get()).endswith(b"second\r\n")
+    assert (await second.get()).endswith(b"second\r\n")
+    assert await first.get() is None
+    assert await second.get() is None
+    assert image_cb.call_count == 4
+    assert done.call_count == 1
+
+
+async def test_still_stream_broadcaster_slow_client(hass):
+    """Test a slow client drops frames and the last client stops polling."""
+    images = [b"1", b"2", b"3"]
+    blocked = hass.loop.create_future()
+
+    async def get_image():
+        if images:
+            return images.pop(0)
+        return await blocked
+
+    image_cb = AsyncMock(side_effect=get_image)
+    done = Mock()
+    broadcaster = camera.StillStreamBroadcaster(
+        hass, image_cb, "image/jpeg", 0, done
+    )
+
+    queue = broadcaster.async_attach()
+    while image_cb.call_count < 4:
+        await asyncio.sleep(0)
+
+    # Both copies of the first image were dropped
+    assert queue.qsize() == camera.STILL_STREAM_QUEUE_SIZE
+    assert queue.get_nowait().endswith(b"2\r\n")
+    assert queue.get_nowait().endswith(b"3\r\n")
+
+    broadcaster.async_detach(queue)
+    await hass.async_block_till_done()
+    assert done.call_count == 1
+    assert image_cb.call_count == 4
+    assert broadcaster.done
+
+    with pytest.raises(RuntimeError):
+        broadcaster.async_attach()
+
+
+async def test_still_stream_broadcaster_image_error(hass, caplog):
+    """Test a still stream ends when getting an image fails."""
+    image_cb = AsyncMock(side_effect=HomeAssistantError("camera failure"))
+    done = Mock()
+    broadcaster = camera.StillStreamBroadcaster(
+        hass, image_cb, "image/jpeg", 0, done
+    )
+
+    queue = broadcaster.async_attach()
+    assert await queue.get() is None
+    await hass.async_block_till_done()
+    assert done.call_count == 1
+    assert "Error getting image for still stream" in caplog.text
+
+
 async def test_websocket_web_rtc_offer(
     hass,
     hass_ws_client,
@@ -1,6 +1,7 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
+from http import HTTPStatus
 import json
 from unittest.mock import patch, sentinel
 
@@ -613,6 +614,74 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_with_columnar(hass, hass_client):
+    """Test the fetch period view for history with columnar."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "12.5")
+    hass.states.async_set("sensor.power", "unavailable")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?filter_entity_id=sensor.power&columnar"
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json) == 1
+    assert response_json[0]["entity_id"] == "sensor.power"
+    assert response_json[0]["s"] == [12.5, "unavailable"]
+    assert len(response_json[0]["lc"]) == 2
+    assert len(response_json[0]["lu"]) == 2
+
+
+@pytest.mark.parametrize("max_points", ["2", "cats"])
+async def test_fetch_period_api_with_invalid_max_points(hass, hass_client, max_points):
+    """Test the fetch period view for history with an invalid max_points."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?max_points={max_points}"
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_fetch_period_api_with_max_points(hass, hass_client):
+    """Test the fetch period view for history with max_points."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    for i in range(10):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=start + timedelta(seconds=i + 1),
+        ):
+            hass.states.async_set("sensor.power", str(i))
+            await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}"
+        "?filter_entity_id=sensor.power&skip_initial_state&max_points=4"
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json[0]) == 4
+    assert response_json[0][0]["state"] == "0"
+    assert response_json[0][-1]["state"] == "9"
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -1046,3 +1115,47 @@ async def test_list_statistic_ids(hass, hass_ws_client, units, attributes, unit)
     response = await client.receive_json()
     assert response["success"]
     assert response["result"] == []
+
+
+async def test_history_columns_during_period(hass, hass_ws_client):
+    """Test history_columns_during_period."""
+    now = dt_util.utcnow()
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("sensor.test", "5", attributes={"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.test", "6", attributes={"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_columns_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]) == 1
+    columns = response["result"][0]
+    assert columns["entity_id"] == "sensor.test"
+    assert columns["s"] == [5.0, 6.0]
+    assert columns["lu"] == sorted(columns["lu"])
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_columns_during_period",
+            "start_time": "cats",
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
@@ -1873,6 +1873,187 @@ async def test_context_filter(hass, hass_client):
     assert response.status == 400
 
 
+async def test_event_stream(hass, hass_ws_client):
+    """Test streaming recorded and live logbook entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.recorded", STATE_OFF)
+    hass.states.async_set("switch.recorded", STATE_ON)
+    await _async_commit_and_wait(hass)
+
+    start = dt_util.utcnow() - timedelta(hours=3)
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": start.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    pages = []
+    while True:
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        pages.append(response["event"])
+        if not response["event"]["partial"]:
+            break
+
+    assert len(pages) >= 3
+    assert all(page["partial"] for page in pages[:-1])
+    for page, next_page in zip(pages, pages[1:]):
+        assert page["cursor"] < next_page["cursor"]
+    entries = [entry for page in pages for entry in page["events"]]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.recorded", state=STATE_ON)
+
+    hass.states.async_set("switch.live", STATE_OFF)
+    hass.states.async_set("switch.live", STATE_ON)
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert "partial" not in response["event"]
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.live", state=STATE_ON)
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["success"]
+
+
+async def test_event_stream_uncommitted_events(hass, hass_ws_client):
+    """Test events not yet committed by the recorder are in the last page."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("switch.pending", STATE_OFF)
+    hass.states.async_set("switch.pending", STATE_ON)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": start.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["event"]["partial"] is False
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.pending", state=STATE_ON)
+
+
+async def test_event_stream_recorder_not_recording(hass, hass_ws_client):
+    """Test the last page does not wait for a recorder which is not recording."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_ws_client()
+    with patch.object(instance, "is_alive", return_value=False):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": dt_util.utcnow().isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["event"]["partial"] is False
+
+
+async def test_event_stream_error(hass, hass_ws_client):
+    """Test an error while sending the pages is sent to the client."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.logbook._get_events", side_effect=ValueError("boom")
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": dt_util.utcnow().isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"] == {"code": "unknown_error", "message": "boom"}
+
+    # Live events are no longer buffered or sent
+    hass.states.async_set("switch.after", STATE_ON)
+    await hass.async_block_till_done()
+    await client.send_json({"id": 2, "type": "ping"})
+    assert (await client.receive_json())["type"] == "pong"
+
+
+async def test_event_stream_end_time_and_entity_ids(hass, hass_ws_client):
+    """Test streaming a closed period for some entities."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("switch.one", STATE_OFF)
+    hass.states.async_set("switch.one", STATE_ON)
+    hass.states.async_set("switch.two", STATE_OFF)
+    hass.states.async_set("switch.two", STATE_ON)
+    await _async_commit_and_wait(hass)
+    end = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["switch.two"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["event"]["partial"] is False
+    assert response["event"]["cursor"] == end.isoformat()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.two", state=STATE_ON)
+
+
+async def test_event_stream_bad_start_time(hass, hass_ws_client):
+    """Test streaming with an invalid start_time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": "cats"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
@@ -652,6 +652,48 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_subscribe_overlapping_topics(hass, mqtt_mock, calls, record_calls):
+    """Test messages are dispatched to every matching subscription."""
+    unsub_exact = await mqtt.async_subscribe(hass, "test-topic/a/b", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/+/b", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/a/b", "test-payload")
+    await hass.async_block_till_done()
+    assert sorted(call[0].subscribed_topic for call in calls) == [
+        "test-topic/#",
+        "test-topic/+/b",
+        "test-topic/a/b",
+    ]
+
+    calls.clear()
+    unsub_exact()
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "test-topic/a/b", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/a", "test-payload")
+    await hass.async_block_till_done()
+    assert [call[0].subscribed_topic for call in calls] == ["test-topic/+/b"]
+
+
+async def test_receive_messages_in_batches(hass, mqtt_mock, calls, record_calls):
+    """Test messages received by paho are handled in order in one batch."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    def receive_messages():
+        for index in range(3):
+            msg = mqtt.models.ReceiveMessage(
+                f"test-topic/{index}", str(index).encode(), 0, False
+            )
+            hass.data["mqtt"]._mqtt_on_message(None, None, msg)
+
+    with patch.object(hass, "add_job", wraps=hass.add_job) as add_job:
+        receive_messages()
+        await hass.async_block_till_done()
+
+    assert add_job.call_count == 1
+    assert [call[0].payload for call in calls] == ["0", "1", "2"]
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -923,13 +965,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=dir(hass.data["mqtt"]),
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -184,6 +184,84 @@ def test_get_significant_states(hass_recorder):
     assert states == hist
 
 
+def test_get_significant_states_columnar(hass_recorder):
+    """Test the columnar result matches the significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(hass, zero, four, columnar=True)
+
+    assert sorted(hist) == sorted(states)
+    for entity_id, entity_states in states.items():
+        columns = hist[entity_id]
+        assert isinstance(columns, history.HistoryColumns)
+        assert columns.entity_id == entity_id
+        assert columns.states == [state.state for state in entity_states]
+        assert columns.last_updated.tolist() == [
+            state.last_updated.timestamp() for state in entity_states
+        ]
+        assert columns.last_changed.tolist() == [
+            state.last_changed.timestamp() for state in entity_states
+        ]
+        for index, state in enumerate(entity_states):
+            assert columns.attributes(index) == state.attributes
+
+    therm = hist["thermostat.test"]
+    assert therm.values.typecode == "d"
+    assert therm.values.tolist() == [20.0, 21.0, 21.0]
+    assert therm.as_dict()["s"] == [20.0, 21.0, 21.0]
+    assert hist["media_player.test"].as_dict()["s"] == ["idle", "YouTube", "Netflix"]
+
+
+def test_history_columns_as_dict_non_finite():
+    """Test states that are not finite numbers are sent as strings."""
+    columns = history.HistoryColumns("sensor.test")
+    for state in ("1.5", "inf", "-inf", "nan", "unavailable"):
+        columns.append(state, 1.0, 1.0, None)
+
+    assert columns.as_dict()["s"] == [1.5, "inf", "-inf", "nan", "unavailable"]
+
+
+def test_get_significant_states_max_points(hass_recorder):
+    """Test numeric states are downsampled to max_points."""
+    hass = hass_recorder()
+    entity_id = "sensor.power"
+    zero = dt_util.utcnow()
+    for i in range(40):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=zero + timedelta(seconds=i + 1),
+        ):
+            hass.states.set(entity_id, "unavailable" if i == 20 else str(i % 7))
+    wait_recording_done(hass)
+    end = zero + timedelta(seconds=60)
+
+    hist = history.get_significant_states(
+        hass, zero, end, [entity_id], include_start_time_state=False, max_points=10
+    )
+    states = [state.state for state in hist[entity_id]]
+    assert len(states) == 11
+    assert states[0] == "0"
+    assert states[-1] == str(39 % 7)
+    assert "unavailable" in states
+
+    columns = history.get_significant_states(
+        hass,
+        zero,
+        end,
+        [entity_id],
+        include_start_time_state=False,
+        columnar=True,
+        max_points=10,
+    )[entity_id]
+    assert columns.states == states
+    assert columns.last_updated.tolist() == sorted(columns.last_updated)
+
+    hist = history.get_significant_states(
+        hass, zero, end, [entity_id], include_start_time_state=False, max_points=100
+    )
+    assert len(hist[entity_id]) == 40
+
+
 def test_get_significant_states_minimal_response(hass_recorder):
     """Test that only significant states are returned.
 
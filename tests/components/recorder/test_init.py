@@ -1,6 +1,7 @@
 """The tests for the Recorder component."""
 # pylint: disable=protected-access
 from datetime import datetime, timedelta
+import os
 import sqlite3
 from unittest.mock import patch
 
@@ -28,6 +29,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -121,7 +123,7 @@ async def test_state_gets_saved_when_set_before_start_event(
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
 
 
 async def test_saving_state(
@@ -141,10 +143,10 @@ async def test_saving_state(
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
         state = db_states[0].to_native()
 
-    assert state == _state_empty_context(hass, entity_id)
+    assert state == _state_with_context(hass, entity_id)
 
 
 async def test_saving_many_states(
@@ -170,7 +172,7 @@ async def test_saving_many_states(
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 6
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -196,7 +198,58 @@ async def test_saving_state_with_intermixed_time_changes(
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 2
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
+
+
+async def test_saving_rows_in_bulk(hass, async_setup_recorder_instance):
+    """Test the rows of a commit are written with one statement per table."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+    execute = instance.event_session.execute
+    written = []
+
+    def _record_writes(statement, *args, **kwargs):
+        if (table := getattr(statement, "table", None)) is not None:
+            written.append((statement.__visit_name__, table.name))
+        return execute(statement, *args, **kwargs)
+
+    with patch.object(instance.event_session, "execute", side_effect=_record_writes):
+        hass.bus.async_fire("first_event")
+        hass.states.async_set("test.one", "on")
+        hass.states.async_set("test.two", "on")
+        hass.states.async_set("test.one", "off")
+        hass.states.async_remove("test.two")
+        hass.states.async_set("test.two", "on")
+        hass.bus.async_fire("second_event")
+        await async_wait_recording_done(hass, instance)
+
+    assert written == [
+        ("insert", "events"),
+        ("insert", "state_attributes"),
+        ("insert", "states"),
+        ("update", "states"),
+    ]
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.entity_id for db_state in db_states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.two",
+        ]
+        assert db_states[2].old_state_id == db_states[0].state_id
+        assert db_states[3].old_state_id == db_states[1].state_id
+        assert db_states[3].state is None
+        assert db_states[4].old_state_id is None
+        assert db_states[0].attributes_id == db_states[1].attributes_id
+        assert (
+            session.query(Events)
+            .filter(Events.event_type.in_(["first_event", "second_event"]))
+            .count()
+            == 2
+        )
 
 
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
@@ -207,17 +260,16 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    session = hass.data[DATA_INSTANCE].event_session
+    execute = session.execute
+
+    def _throw_if_state_in_session(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is States.__table__:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return execute(statement, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        session, "execute", side_effect=_throw_if_state_in_session
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -245,17 +297,16 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    session = hass.data[DATA_INSTANCE].event_session
+    execute = session.execute
+
+    def _throw_if_state_in_session(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is States.__table__:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return execute(statement, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        session, "execute", side_effect=_throw_if_state_in_session
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -288,7 +339,7 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
 
     with patch.object(instance, "db_retry_wait", 0.2), patch.object(
         instance.event_session,
-        "flush",
+        "execute",
         side_effect=OperationalError(
             "insert the state", "fake params", "forced to fail"
         ),
@@ -362,7 +413,7 @@ def test_saving_state_with_commit_interval_zero(hass_recorder):
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
+        assert db_states[0].event_id is None
 
 
 def _add_entities(hass, entity_ids):
@@ -387,12 +438,9 @@ def _add_events(hass, events):
         return [ev.to_native() for ev in session.query(Events)]
 
 
-def _state_empty_context(hass, entity_id):
-    # We don't restore context unless we need it by joining the
-    # events table on the event_id for state_changed events
-    state = hass.states.get(entity_id)
-    state.context = Context(id=None)
-    return state
+def _state_with_context(hass, entity_id):
+    # The context is stored with the state so it is restored as well
+    return hass.states.get(entity_id)
 
 
 # pylint: disable=redefined-outer-name,invalid-name
@@ -401,7 +449,7 @@ def test_saving_state_include_domains(hass_recorder):
     hass = hass_recorder({"include": {"domains": "test2"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_include_domains_globs(hass_recorder):
@@ -413,8 +461,8 @@ def test_saving_state_include_domains_globs(hass_recorder):
         hass, ["test.recorder", "test2.recorder", "test3.included_entity"]
     )
     assert len(states) == 2
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
-    assert _state_empty_context(hass, "test3.included_entity") == states[1]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test3.included_entity") == states[1]
 
 
 def test_saving_state_incl_entities(hass_recorder):
@@ -422,7 +470,7 @@ def test_saving_state_incl_entities(hass_recorder):
     hass = hass_recorder({"include": {"entities": "test2.recorder"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_event_exclude_event_type(hass_recorder):
@@ -451,7 +499,7 @@ def test_saving_state_exclude_domains(hass_recorder):
     hass = hass_recorder({"exclude": {"domains": "test"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_exclude_domains_globs(hass_recorder):
@@ -463,7 +511,7 @@ def test_saving_state_exclude_domains_globs(hass_recorder):
         hass, ["test.recorder", "test2.recorder", "test2.excluded_entity"]
     )
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_exclude_entities(hass_recorder):
@@ -471,7 +519,7 @@ def test_saving_state_exclude_entities(hass_recorder):
     hass = hass_recorder({"exclude": {"entities": "test.recorder"}})
     states = _add_entities(hass, ["test.recorder", "test2.recorder"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test2.recorder") == states[0]
+    assert _state_with_context(hass, "test2.recorder") == states[0]
 
 
 def test_saving_state_exclude_domain_include_entity(hass_recorder):
@@ -504,8 +552,8 @@ def test_saving_state_include_domain_exclude_entity(hass_recorder):
     )
     states = _add_entities(hass, ["test.recorder", "test2.recorder", "test.ok"])
     assert len(states) == 1
-    assert _state_empty_context(hass, "test.ok") == states[0]
-    assert _state_empty_context(hass, "test.ok").state == "state2"
+    assert _state_with_context(hass, "test.ok") == states[0]
+    assert _state_with_context(hass, "test.ok").state == "state2"
 
 
 def test_saving_state_include_domain_glob_exclude_entity(hass_recorder):
@@ -520,8 +568,8 @@ def test_saving_state_include_domain_glob_exclude_entity(hass_recorder):
         hass, ["test.recorder", "test2.recorder", "test.ok", "test2.included_entity"]
     )
     assert len(states) == 1
-    assert _state_empty_context(hass, "test.ok") == states[0]
-    assert _state_empty_context(hass, "test.ok").state == "state2"
+    assert _state_with_context(hass, "test.ok") == states[0]
+    assert _state_with_context(hass, "test.ok").state == "state2"
 
 
 def test_saving_state_and_removing_entity(hass, hass_recorder):
@@ -830,6 +878,97 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_sets_old_state_within_one_commit(hass_recorder):
+    """Test saving sets old state for states written in the same commit."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "off", {})
+    hass.states.set("test.one", "on", {})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {})
+    hass.states.set("test.two", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 7
+
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert states[4].old_state_id == states[1].state_id
+        assert states[4].state is None
+        assert states[5].old_state_id == states[3].state_id
+        assert states[6].old_state_id is None
+        assert all(state.event_id is None for state in states)
+
+        assert hass.data[DATA_INSTANCE]._old_states == {
+            "test.one": states[5].state_id,
+            "test.two": states[6].state_id,
+        }
+
+
+def test_saving_states_shares_attributes(hass_recorder):
+    """Test states with identical attributes share one attributes row."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {"brightness": 100})
+    hass.states.set("test.two", "on", {"brightness": 100})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"brightness": 100})
+    hass.states.set("test.two", "off", {"brightness": 50})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[0].attributes_id == states[2].attributes_id
+        assert states[0].attributes_id != states[3].attributes_id
+
+        assert session.query(StateAttributes).count() == 2
+        assert states[2].to_native().attributes == {"brightness": 100}
+        assert states[3].to_native().attributes == {"brightness": 50}
+
+        assert hass.data[DATA_INSTANCE]._state_attributes_ids == {
+            '{"brightness":100}': states[0].attributes_id,
+            '{"brightness":50}': states[3].attributes_id,
+        }
+
+
+def test_saving_state_stores_context_without_event(hass_recorder):
+    """Test the context of a state change is stored with the state."""
+    hass = hass_recorder()
+
+    context = Context(user_id="user", parent_id="parent")
+    hass.states.set("test.one", "on", {}, context=context)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type == "state_changed")
+        assert events.count() == 0
+        db_state = session.query(States).one()
+        assert db_state.event_id is None
+        assert db_state.context_id == context.id
+        assert db_state.context_user_id == "user"
+        assert db_state.context_parent_id == "parent"
+        assert db_state.to_native().context == context
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -989,8 +1128,8 @@ def test_service_disable_states_not_recording(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         db_states = list(session.query(States))
         assert len(db_states) == 1
-        assert db_states[0].event_id > 0
-        assert db_states[0].to_native() == _state_empty_context(hass, "test.two")
+        assert db_states[0].event_id is None
+        assert db_states[0].to_native() == _state_with_context(hass, "test.two")
 
 
 def test_service_disable_run_information_recorded(tmpdir):
@@ -1089,7 +1228,7 @@ async def test_database_corruption_while_running(hass, tmpdir, caplog):
         with session_scope(hass=hass) as session:
             db_states = list(session.query(States))
             assert len(db_states) == 1
-            assert db_states[0].event_id > 0
+            assert db_states[0].event_id is None
             return db_states[0].to_native()
 
     state = await hass.async_add_executor_job(_get_last_state)
@@ -1134,3 +1273,33 @@ def test_entity_id_filter(hass_recorder):
             db_events = list(session.query(Events).filter_by(event_type="hello"))
             # Keep referring idx + 1, as no new events are being added
             assert len(db_events) == idx + 1, data
+
+
+def test_saving_spilled_states(hass_recorder):
+    """Test states spilled to disk while the queue is backlogged are saved."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+
+    with patch("homeassistant.components.recorder.SPILL_QUEUE_BACKLOG", 0):
+        hass.states.set("test.one", "on", {"attr": 1})
+        hass.states.set("test.one", "off", {"attr": 2})
+        hass.bus.fire("test_event", {"data": "spilled"})
+        hass.block_till_done()
+        assert instance.spill_buffer.active
+        assert instance.spill_buffer.pending_events >= 3
+        wait_recording_done(hass)
+
+    hass.block_till_done()
+    assert not instance.spill_buffer.active
+    assert instance.spill_buffer.pending_bytes == 0
+    assert not os.path.exists(instance.spill_buffer.path)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[0].state == "on"
+        assert states[1].state == "off"
+        assert states[1].old_state_id == states[0].state_id
+        events = list(session.query(Events).filter_by(event_type="test_event"))
+        assert len(events) == 1
+        assert events[0].to_native().data == {"data": "spilled"}
@@ -294,6 +294,60 @@ def test_forgiving_add_column():
         migration._add_columns(session, "hello", ["context_id CHARACTER(36)"])
 
 
+def test_backfill_states_context():
+    """Test the context of state_changed events is copied to the states."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(engine)
+    now = dt_util.utcnow()
+    with Session(engine) as session:
+        session.add(
+            models.Events(
+                event_id=1,
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                time_fired=now,
+                context_id="context",
+                context_user_id="user",
+                context_parent_id="parent",
+            )
+        )
+        session.add(
+            models.States(
+                entity_id="test.legacy",
+                domain="test",
+                state="on",
+                last_changed=now,
+                last_updated=now,
+                event_id=1,
+            )
+        )
+        session.add(
+            models.States(
+                entity_id="test.current",
+                domain="test",
+                state="on",
+                last_changed=now,
+                last_updated=now,
+                context_id="current",
+            )
+        )
+        session.commit()
+
+        # One state per batch
+        with patch.object(migration, "CONTEXT_BACKFILL_BATCH_SIZE", 1):
+            migration._backfill_states_context(session, "sqlite")
+
+        legacy = session.query(models.States).filter_by(entity_id="test.legacy").one()
+        assert legacy.context_id == "context"
+        assert legacy.context_user_id == "user"
+        assert legacy.context_parent_id == "parent"
+        current = (
+            session.query(models.States).filter_by(entity_id="test.current").one()
+        )
+        assert current.context_id == "current"
+
+
 def test_forgiving_add_index():
     """Test that add index will continue if index exists."""
     engine = create_engine("sqlite://", poolclass=StaticPool)
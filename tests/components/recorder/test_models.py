@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import json
 
 import pytest
 from sqlalchemy import create_engine
@@ -8,7 +9,9 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from homeassistant.components.recorder.models import (
     Base,
     Events,
+    LazyState,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -34,12 +37,42 @@ def test_from_event_to_db_state():
         {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
         context=state.context,
     )
-    # We don't restore context unless we need it by joining the
-    # events table on the event_id for state_changed events
-    state.context = ha.Context(id=None)
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_attributes():
+    """Test converting event to db state attributes."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    shared_attrs = StateAttributes.shared_attrs_from_event(event)
+    assert shared_attrs == '{"this_attr":true}'
+    assert StateAttributes.hash_shared_attrs(
+        shared_attrs
+    ) == StateAttributes.hash_shared_attrs('{"this_attr":true}')
+    assert StateAttributes.hash_shared_attrs(
+        shared_attrs
+    ) != StateAttributes.hash_shared_attrs('{"this_attr":false}')
+    assert StateAttributes(shared_attrs=shared_attrs).to_native() == attrs
+    # The encoding is shared with the other consumers of the state
+    assert shared_attrs is state.attributes_json()
+
+
+def test_from_event_to_db_state_attributes_nan():
+    """Test attributes that are not allowed in the shared encoding are recorded."""
+    state = ha.State("sensor.temperature", "18", {"value": float("nan")})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    assert StateAttributes.shared_attrs_from_event(event) == '{"value":NaN}'
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -215,3 +248,33 @@ async def test_event_to_db_model():
     native = Events.from_event(event, event_data="{}").to_native()
     event.data = {}
     assert native == event
+
+
+def test_lazy_state_as_json():
+    """Test a lazy state is encoded like its dict representation."""
+    state = ha.State("sensor.temperature", "18", {"unit": "C"})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    lazy_state = LazyState(States.from_event(event))
+
+    assert json.loads(lazy_state.attributes_json()) == {"unit": "C"}
+    assert json.loads(lazy_state.as_json()) == lazy_state.as_dict()
+    assert lazy_state.as_json() is lazy_state.as_json()
+
+    lazy_state.attributes = {"unit": "F"}
+    assert json.loads(lazy_state.as_json())["attributes"] == {"unit": "F"}
+
+
+def test_lazy_state_without_attributes():
+    """Test a lazy state of a row without attributes has empty attributes."""
+    row = States(
+        entity_id="sensor.temperature",
+        state="18",
+        attributes=None,
+        last_changed=dt_util.utcnow(),
+        last_updated=dt_util.utcnow(),
+    )
+    assert LazyState(row).attributes == {}
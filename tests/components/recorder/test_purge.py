@@ -10,7 +10,12 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -42,8 +47,9 @@ async def test_purge_old_states(
         assert states[0].old_state_id is None
         assert states[-1].old_state_id == states[-2].state_id
 
+        # State changes are recorded without an event
         events = session.query(Events).filter(Events.event_type == "state_changed")
-        assert events.count() == 6
+        assert events.count() == 0
         assert "test.recorder2" in instance._old_states
 
         purge_before = dt_util.utcnow() - timedelta(days=4)
@@ -80,11 +86,43 @@ async def test_purge_old_states(
         assert states[0].old_state_id is None
         assert states[-1].old_state_id == states[-2].state_id
 
+        # State changes are recorded without an event
         events = session.query(Events).filter(Events.event_type == "state_changed")
-        assert events.count() == 6
+        assert events.count() == 0
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_old_states_removes_unused_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states removes the attributes no state uses anymore."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        assert states.count() == 6
+        assert state_attributes.count() == 1
+        assert len(instance._state_attributes_ids) == 1
+
+        # The newest states still use the shared attributes
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        assert len(instance._state_attributes_ids) == 1
+
+        purge_before = dt_util.utcnow()
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+        assert states.count() == 0
+        assert state_attributes.count() == 0
+        assert len(instance._state_attributes_ids) == 0
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -0,0 +1,113 @@
+"""The tests for the recorder spill buffer."""
+from homeassistant.components.recorder.spill import (
+    SpillBuffer,
+    event_from_line,
+    event_to_line,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, State
+
+
+def _state_changed_event():
+    """Return a state changed event."""
+    context = Context(user_id="user", parent_id="parent")
+    old_state = State("sensor.one", "1", {"unit_of_measurement": "W"})
+    new_state = State("sensor.one", "2", {"unit_of_measurement": "W"}, context=context)
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.one", "old_state": old_state, "new_state": new_state},
+        context=context,
+    )
+
+
+def test_event_round_trip():
+    """Test an event survives the spill file encoding."""
+    event = _state_changed_event()
+    restored = event_from_line(event_to_line(event))
+
+    assert restored == event
+    assert restored.data["new_state"] == event.data["new_state"]
+    assert restored.data["old_state"] == event.data["old_state"]
+    assert restored.context.parent_id == "parent"
+
+    event = Event("test_event", {"value": float("nan")})
+    assert event_from_line(event_to_line(event)).event_type == "test_event"
+
+
+async def test_append_and_read_batches(hass, tmpdir):
+    """Test events are read back in order and the file is removed."""
+    path = str(tmpdir.join("recorder.spill"))
+    spill_buffer = SpillBuffer(hass, path, 1024 * 1024)
+    assert not spill_buffer.active
+
+    for value in range(5):
+        spill_buffer.async_append(Event("test_event", {"value": value}))
+    assert spill_buffer.active
+    assert spill_buffer.pending_events == 5
+    assert not spill_buffer.async_deactivate()
+
+    first = await hass.async_add_executor_job(spill_buffer.read_batch, 3)
+    second = await hass.async_add_executor_job(spill_buffer.read_batch, 3)
+    assert [event.data["value"] for event in first + second] == [0, 1, 2, 3, 4]
+    assert await hass.async_add_executor_job(spill_buffer.read_batch, 3) == []
+    assert spill_buffer.pending_bytes == 0
+    assert tmpdir.join("recorder.spill").exists()
+
+    await hass.async_add_executor_job(spill_buffer.mark_recorded)
+    assert spill_buffer.async_deactivate()
+    assert not spill_buffer.active
+    assert not tmpdir.join("recorder.spill").exists()
+
+
+async def test_spilled_events_survive_restart(hass, tmpdir):
+    """Test a spill file left by a previous run is replayed."""
+    path = str(tmpdir.join("recorder.spill"))
+    spill_buffer = SpillBuffer(hass, path, 1024 * 1024)
+    spill_buffer.async_append(Event("test_event", {"value": 1}))
+    await hass.async_add_executor_job(spill_buffer.flush)
+
+    spill_buffer = SpillBuffer(hass, path, 1024 * 1024)
+    assert not spill_buffer.active
+    await spill_buffer.async_load()
+    assert spill_buffer.active
+    events = await hass.async_add_executor_job(spill_buffer.read_batch, 10)
+    assert [event.data for event in events] == [{"value": 1}]
+
+
+async def test_recorded_events_not_replayed_after_restart(hass, tmpdir):
+    """Test a restart during a replay only replays the events not recorded."""
+    path = str(tmpdir.join("recorder.spill"))
+    spill_buffer = SpillBuffer(hass, path, 1024 * 1024)
+    for value in range(5):
+        spill_buffer.async_append(Event("test_event", {"value": value}))
+    await hass.async_add_executor_job(spill_buffer.read_batch, 2)
+    await hass.async_add_executor_job(spill_buffer.mark_recorded)
+    # Read but not recorded
+    await hass.async_add_executor_job(spill_buffer.read_batch, 2)
+    assert tmpdir.join("recorder.spill.offset").exists()
+
+    spill_buffer = SpillBuffer(hass, path, 1024 * 1024)
+    await spill_buffer.async_load()
+    assert spill_buffer.active
+    events = await hass.async_add_executor_job(spill_buffer.read_batch, 10)
+    assert [event.data["value"] for event in events] == [2, 3, 4]
+    assert spill_buffer.pending_bytes == 0
+
+    await hass.async_add_executor_job(spill_buffer.mark_recorded)
+    assert not tmpdir.join("recorder.spill").exists()
+    assert not tmpdir.join("recorder.spill.offset").exists()
+
+
+async def test_max_bytes(hass, tmpdir, caplog):
+    """Test events are dropped once the spill buffer is full."""
+    event = Event("test_event", {"value": 1})
+    path = str(tmpdir.join("recorder.spill"))
+    spill_buffer = SpillBuffer(hass, path, len(event_to_line(event)))
+
+    spill_buffer.async_append(event)
+    spill_buffer.async_append(Event("test_event", {"value": 2}))
+    spill_buffer.async_append(Event("test_event", {"value": 3}))
+
+    assert spill_buffer.pending_events == 1
+    assert spill_buffer.dropped_events == 2
+    assert caplog.text.count("spill buffer reached the maximum size") == 1
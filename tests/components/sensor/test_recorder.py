@@ -21,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor.recorder import STATES_ACCUMULATOR
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -133,6 +134,77 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_from_accumulated_states(hass_recorder, caplog):
+    """Test compiling hourly statistics from the states collected in memory."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    attributes = {"state_class": "measurement", "unit_of_measurement": "%"}
+
+    # The first run starts collecting states
+    recorder.do_adhoc_statistics(start=dt_util.utcnow() - timedelta(minutes=5))
+    wait_recording_done(hass)
+    hass.block_till_done()
+
+    zero = dt_util.utcnow()
+    four, states = record_states(hass, zero, "sensor.test1", attributes)
+    accumulator = hass.data[STATES_ACCUMULATOR]
+    hist = history.get_significant_states(hass, zero, four)
+    assert accumulator.get_history(
+        zero, four, ["sensor.test1"], True
+    ) == history.get_significant_states(
+        hass, zero - timedelta.resolution, four, ["sensor.test1"]
+    )
+    assert dict(states) == dict(hist)
+
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as get_significant_states:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+    assert not get_significant_states.called
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=5)),
+                "mean": approx(13.050847),
+                "min": approx(-10.0),
+                "max": approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+    # Only the state at the start of the next period is kept
+    assert accumulator.get_history(zero, four, ["sensor.test1"], True) is None
+    assert accumulator.get_history(
+        zero + timedelta(minutes=5), zero + timedelta(minutes=10), ["sensor.test1"], True
+    ) == {"sensor.test1": [states["sensor.test1"][-1]]}
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+    # A removed sensor is forgotten once a period is compiled without it
+    hass.states.remove("sensor.test1")
+    hass.block_till_done()
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
+    wait_recording_done(hass)
+    assert (
+        accumulator.get_history(
+            zero + timedelta(minutes=10),
+            zero + timedelta(minutes=15),
+            ["sensor.test1"],
+            True,
+        )
+        == {}
+    )
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
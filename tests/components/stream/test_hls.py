@@ -362,11 +362,28 @@ async def test_hls_max_segments(hass, hls_stream, stream_worker_sync):
     for sequence in range(1, MAX_SEGMENTS + 1):
         segment_response = await hls_client.get(f"/segment/{sequence}.m4s")
         assert segment_response.status == 200
+        assert segment_response.content_length == len(FAKE_PAYLOAD)
+        assert await segment_response.read() == FAKE_PAYLOAD
 
     stream_worker_sync.resume()
     stream.stop()
 
 
+def test_segment_data_size():
+    """Test the size of a segment is summed as parts are added."""
+    segment = Segment(sequence=0)
+    assert segment.data_size == 0
+
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"12"), 0)
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"345"), 0)
+    assert segment.data_size == 5
+    assert segment.get_part_data() == (5, [b"12", b"345"])
+
+    segment.parts = [Part(duration=1, has_keyframe=True, data=b"6")]
+    assert segment.data_size == 1
+    assert segment.get_data() == b"6"
+
+
 async def test_hls_playlist_view_discontinuity(hass, hls_stream, stream_worker_sync):
     """Test a discontinuity across segments in the stream with 3 segments."""
     await async_setup_component(hass, "stream", {"stream": {}})
@@ -0,0 +1,124 @@
+"""The tests for the stream ring buffer."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.components.stream import create_stream
+from homeassistant.components.stream.const import RING_BUFFER_PROVIDER
+from homeassistant.components.stream.core import Part
+from homeassistant.components.stream.ring_buffer import RingBufferOutput, RingFile
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_setup_component
+
+from tests.components.stream.common import DefaultSegment as Segment
+
+STREAM_SOURCE = "some-stream-source"
+INIT_BYTES = b"init"
+
+
+def create_segment(sequence, data, duration=1):
+    """Create a complete segment with a part for each item of data."""
+    segment = Segment(sequence=sequence, duration=duration)
+    segment.init = INIT_BYTES
+    segment.parts = [
+        Part(duration=duration / len(data), has_keyframe=True, data=part_data)
+        for part_data in data
+    ]
+    return segment
+
+
+def test_ring_file_wraps_around(tmp_path):
+    """Test the oldest segments are overwritten when the file is full."""
+    ring = RingFile(str(tmp_path / "ring" / "stream.ring"), 10)
+
+    ring.write_segment(create_segment(0, [b"000"]))
+    ring.write_segment(create_segment(1, [b"1", b"11"]))
+    ring.write_segment(create_segment(2, [b"222"]))
+    assert ring.read_segment(0).get_data() == b"000"
+
+    # Does not fit at the end, the first segment is overwritten
+    ring.write_segment(create_segment(3, [b"33"]))
+    assert ring.read_segment(0) is None
+    assert ring.read_segment(1).get_data() == b"111"
+    segment = ring.read_segment(3)
+    assert segment.get_data() == b"33"
+    assert segment.init == INIT_BYTES
+    assert segment.complete
+    assert [segment.sequence for segment in ring.read_segments(10)] == [1, 2, 3]
+    assert [segment.sequence for segment in ring.read_segments(1.5)] == [2, 3]
+
+    # Wrapping around again drops the segments after the head
+    ring.write_segment(create_segment(4, [b"4" * 9]))
+    assert [segment.sequence for segment in ring.read_segments(10)] == [4]
+
+    # A segment larger than the file is skipped
+    ring.write_segment(create_segment(5, [b"5" * 11]))
+    assert ring.read_segment(5) is None
+
+    ring.close()
+    assert not (tmp_path / "ring" / "stream.ring").exists()
+    assert ring.read_segment(4) is None
+
+
+async def test_ring_buffer_output(hass, tmp_path):
+    """Test complete segments are moved to the ring file."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream.start = lambda: None
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_enable_ring_buffer(str(tmp_path / "stream.ring"), 1024)
+    ring_buffer = stream.outputs()[RING_BUFFER_PROVIDER]
+
+    segment = Segment(sequence=0, stream_outputs=[ring_buffer])
+    segment.init = INIT_BYTES
+    await hass.async_block_till_done()
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"00"), 0)
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"0"), 2)
+    Segment(sequence=1, stream_outputs=[ring_buffer])
+    await hass.async_block_till_done()
+
+    # The first segment is only in the ring file
+    assert ring_buffer.get_segment(0) is None
+    assert (await ring_buffer.async_get_segment(0)).get_data() == b"000"
+    assert ring_buffer.get_segment(1) is not None
+
+    segments = await ring_buffer.async_get_segments(5)
+    assert [segment.sequence for segment in segments] == [0, 1]
+
+    stream.remove_provider(ring_buffer)
+    await hass.async_block_till_done()
+    assert not (tmp_path / "stream.ring").exists()
+
+
+async def test_ring_buffer_not_allowed_path(hass, tmp_path):
+    """Test the ring file is only written to an allowed path."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream.start = lambda: None
+    with patch.object(
+        hass.config, "is_allowed_path", return_value=False
+    ), pytest.raises(HomeAssistantError):
+        await stream.async_enable_ring_buffer(str(tmp_path / "stream.ring"), 1024)
+    assert RING_BUFFER_PROVIDER not in stream.outputs()
+
+
+async def test_ring_buffer_get_segments(hass, tmp_path):
+    """Test segments are returned once and trimmed to the duration."""
+    ring_buffer = RingBufferOutput(hass, Mock())
+    await ring_buffer.async_open(str(tmp_path / "stream.ring"), 1024)
+    for sequence in range(3):
+        ring_buffer.ring.write_segment(create_segment(sequence, [b"0"]))
+
+    # The last segment is still in memory while it is being written
+    segment = create_segment(2, [b"0"])
+    ring_buffer.put(segment)
+    await hass.async_block_till_done()
+
+    segments = await ring_buffer.async_get_segments(10)
+    assert [segment.sequence for segment in segments] == [0, 1, 2]
+    assert segments[-1] is segment
+    segments = await ring_buffer.async_get_segments(1.5)
+    assert [segment.sequence for segment in segments] == [1, 2]
+
+    ring_buffer.cleanup()
+    await hass.async_block_till_done()
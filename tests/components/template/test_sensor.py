@@ -1,6 +1,7 @@
 """The test for the Template sensor platform."""
 from asyncio import Event
 from datetime import timedelta
+import logging
 from unittest.mock import patch
 
 import pytest
@@ -53,6 +54,37 @@ async def test_template_legacy(hass, start_ha):
     assert hass.states.get(TEST_NAME).state == "It Works."
 
 
+@pytest.mark.parametrize("count,domain", [(1, sensor.DOMAIN)])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "sensor": {
+                "platform": "template",
+                "sensors": {
+                    "test_template_sensor": {
+                        "value_template": "{{ states('sensor.test_state') }}"
+                    }
+                },
+            },
+        },
+    ],
+)
+async def test_template_render_cache(hass, start_ha, caplog):
+    """Test the template is not rendered again for changes it did not read."""
+    caplog.set_level(logging.DEBUG)
+    hass.states.async_set("sensor.test_state", "1", {"unit": "W"})
+    await hass.async_block_till_done()
+    assert hass.states.get(TEST_NAME).state == "1"
+
+    hass.states.async_set("sensor.test_state", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test_state", "2", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert hass.states.get(TEST_NAME).state == "2"
+    assert "1 hits" in caplog.text
+
+
 @pytest.mark.parametrize("count,domain", [(1, sensor.DOMAIN)])
 @pytest.mark.parametrize(
     "config",
@@ -19,7 +19,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    SetupTimeline,
+    async_setup_component,
+)
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -412,6 +417,78 @@ async def test_get_states(hass, websocket_client):
     assert msg["result"] == states
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe_entities sends the states and then only the changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.other", "on")
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "off")
+    hass.states.async_set("light.permitted", "on", {"brightness": 100})
+    new_state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"brightness": 100},
+                    "c": new_state.context.id,
+                    "lc": new_state.last_changed.timestamp(),
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"brightness": 50})
+    updated_state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"brightness": 50},
+                    "c": updated_state.context.id,
+                    "lu": updated_state.last_updated.timestamp(),
+                },
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
@@ -1197,3 +1274,46 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_integration_setup_timeline(hass, websocket_client):
+    """Test exporting the startup timeline as Chrome trace events."""
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_timeline"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline(hass)
+    timeline.async_add("august", "import", timeline.start, timeline.start + 0.5)
+    timeline.async_add_counter("executor queue wait", timeline.start + 1, 2.5)
+
+    await websocket_client.send_json({"id": 8, "type": "integration/setup_timeline"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "august"},
+            },
+            {
+                "name": "import",
+                "ph": "X",
+                "ts": 0,
+                "dur": 500000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "executor queue wait",
+                "ph": "C",
+                "ts": 1000000,
+                "pid": 1,
+                "args": {"ms": 2.5},
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
@@ -67,6 +67,53 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_coalesced_messages(hass, hass_ws_client):
+    """Test pending messages are coalesced when the client supports it."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    # Not coalesced before the feature is enabled
+    instance._send_message({"id": 1, "type": "test"})
+    instance._send_message({"id": 2, "type": "test"})
+    assert await websocket_client.receive_json() == {"id": 1, "type": "test"}
+    assert await websocket_client.receive_json() == {"id": 2, "type": "test"}
+
+    await websocket_client.send_json(
+        {
+            "id": 3,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 3
+    assert msg["success"]
+
+    for iden in range(4, 7):
+        instance._send_message({"id": iden, "type": "test"})
+    assert await websocket_client.receive_json() == [
+        {"id": 4, "type": "test"},
+        {"id": 5, "type": "test"},
+        {"id": 6, "type": "test"},
+    ]
+
+    # A single pending message is sent on its own
+    await asyncio.sleep(const.COALESCE_MAX_FLUSH_WINDOW)
+    instance._send_message({"id": 7, "type": "test"})
+    assert await websocket_client.receive_json() == {"id": 7, "type": "test"}
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
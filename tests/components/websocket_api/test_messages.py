@@ -1,12 +1,16 @@
 """Test Websocket API messages module."""
+import json
+from unittest.mock import patch
 
+from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.messages import (
-    _cached_event_message as lru_event_cache,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
+from homeassistant.helpers.json import JSONEncoder
 
 
 async def test_cached_event_message(hass):
@@ -25,7 +29,6 @@ async def test_cached_event_message(hass):
     await hass.async_block_till_done()
 
     assert len(events) == 2
-    lru_event_cache.cache_clear()
 
     msg0 = cached_event_message(2, events[0])
     assert msg0 == cached_event_message(2, events[0])
@@ -35,16 +38,14 @@ async def test_cached_event_message(hass):
 
     assert msg0 != msg1
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
-
-    cached_event_message(2, events[1])
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 3
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+    # The encoding is cached on the event and shared with the state
+    assert events[1].as_json() is events[1].as_json()
+    assert events[1].data["old_state"].as_json() in events[1].as_json()
+    assert json.loads(msg1) == {
+        "id": 2,
+        "type": "event",
+        "event": json.loads(json.dumps(events[1], cls=JSONEncoder)),
+    }
 
 
 async def test_cached_event_message_with_different_idens(hass):
@@ -63,19 +64,65 @@ async def test_cached_event_message_with_different_idens(hass):
 
     assert len(events) == 1
 
-    lru_event_cache.cache_clear()
-
     msg0 = cached_event_message(2, events[0])
     msg1 = cached_event_message(3, events[0])
     msg2 = cached_event_message(4, events[0])
 
     assert msg0 != msg1
     assert msg0 != msg2
+    assert json.loads(msg1)["id"] == 3
+    assert json.loads(msg0)["event"] == json.loads(msg2)["event"]
+
+
+async def test_cached_state_diff_message(hass):
+    """Test the state diff is computed once per event."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 1
-    assert cache_info.currsize == 1
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.window", "off", {"brightness": 10})
+    await hass.async_block_till_done()
+
+    with patch.object(
+        messages, "_state_diff_event", wraps=messages._state_diff_event
+    ) as mock_state_diff_event:
+        msg0 = cached_state_diff_message(2, events[1])
+        msg1 = cached_state_diff_message(3, events[1])
+
+    assert mock_state_diff_event.call_count == 1
+    assert json.loads(msg0)["id"] == 2
+    assert json.loads(msg1)["id"] == 3
+    assert json.loads(msg0)["event"] == json.loads(msg1)["event"]
+    assert json.loads(msg1)["event"]["c"]["light.window"]["+"]["a"] == {
+        "brightness": 10
+    }
+
+
+async def test_cached_event_message_unserializable(hass, caplog):
+    """Test an event that can't be serialized results in an error message."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen("test_event", _event_listener)
+    hass.bus.async_fire("test_event", {"value": float("nan")})
+    await hass.async_block_till_done()
+
+    assert json.loads(cached_event_message(5, events[0])) == {
+        "id": 5,
+        "type": "result",
+        "success": False,
+        "error": {"code": "unknown_error", "message": "Invalid JSON in response"},
+    }
+    assert "Unable to serialize to JSON" in caplog.text
 
 
 async def test_message_to_json(caplog):
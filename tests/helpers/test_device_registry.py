@@ -1295,3 +1295,45 @@ async def test_only_disable_device_if_all_config_entries_are_disabled(hass, regi
 
     entry1 = registry.async_get(entry1.id)
     assert not entry1.disabled
+
+
+async def test_entries_for_attribute_follow_updates(registry):
+    """Test the device lookups stay consistent through updates and removal."""
+    device1 = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+    )
+    device2 = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "4567")},
+    )
+    device1 = registry.async_update_device(device1.id, area_id="area-1")
+    device2 = registry.async_update_device(device2.id, add_config_entry_id="456")
+
+    assert device_registry.async_entries_for_area(registry, "area-1") == [device1]
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        device2
+    ]
+
+    device2 = registry.async_update_device(device2.id, remove_config_entry_id="123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        device1
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        device2
+    ]
+
+    registry.async_clear_area_id("area-1")
+    assert device_registry.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove_device(device2.id)
+    assert device_registry.async_entries_for_config_entry(registry, "456") == []
+    # Deleted devices are not part of the lookups
+    registry.async_get_or_create(
+        config_entry_id="789", identifiers={("bridgeid", "4567")}
+    )
+    assert device_registry.async_entries_for_config_entry(registry, "456") == []
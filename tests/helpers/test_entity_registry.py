@@ -199,6 +199,21 @@ async def test_loading_saving_data(hass, registry):
     assert new_entry2.original_icon == "hass:original-icon"
 
 
+def test_changed_entries_are_journaled(registry):
+    """Test the store is told which entries were added, changed or removed."""
+    with patch.object(registry._store, "async_journal_item_changed") as mock_changed:
+        entry = registry.async_get_or_create("light", "hue", "1234")
+        registry.async_update_entity(entry.entity_id, new_entity_id="light.kitchen")
+        registry.async_remove("light.kitchen")
+
+    assert [call[1] for call in mock_changed.mock_calls] == [
+        ("entities", "light.hue_1234"),
+        ("entities", "light.hue_1234"),
+        ("entities", "light.kitchen"),
+        ("entities", "light.kitchen"),
+    ]
+
+
 def test_generate_entity_considers_registered_entities(registry):
     """Test that we don't create entity id that are already registered."""
     entry = registry.async_get_or_create("light", "hue", "1234")
@@ -949,3 +964,49 @@ async def test_entity_max_length_exceeded(hass, registry):
     assert exc_info.value.property_name == "generated_entity_id"
     assert exc_info.value.max_length == 255
     assert exc_info.value.value == f"sensor.{long_entity_id_name}_2"
+
+
+async def test_entries_for_attribute_follow_updates(hass, registry):
+    """Test the entry lookups stay consistent through updates and removal."""
+    config_entry = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=config_entry, device_id="device-1"
+    )
+    entry3 = registry.async_get_or_create("sensor", "hue", "9012")
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry1,
+        entry2,
+    ]
+    assert list(registry.async_entries_for_attribute("domain", "sensor")) == [
+        entry3.entity_id
+    ]
+
+    entry1 = registry.async_update_entity(entry1.entity_id, area_id="area-1")
+    entry3 = registry.async_update_entity(entry3.entity_id, area_id="area-1")
+    assert er.async_entries_for_area(registry, "area-1") == [entry1, entry3]
+    # The position of an updated entry is kept
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, new_entity_id="light.renamed"
+    )
+    assert er.async_entries_for_area(registry, "area-1") == [entry3, entry1]
+    assert er.async_entries_for_device(registry, "device-1") == [entry2, entry1]
+
+    registry.async_clear_area_id("area-1")
+    assert er.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove(entry2.entity_id)
+    assert er.async_entries_for_device(registry, "device-1") == [
+        registry.async_get("light.renamed")
+    ]
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == []
+    assert list(registry.entities) == [entry3.entity_id]
@@ -3347,3 +3347,120 @@ async def test_async_track_entity_registry_updated_event_with_empty_list(hass):
 
     unsub_single2()
     unsub_single()
+
+
+async def test_track_template_result_skips_unread_attributes(hass):
+    """Test changes to attributes the template did not read do not re-render."""
+    hass.states.async_set(
+        "climate.x", "heat", {"current_temperature": 20, "hvac_action": "idle"}
+    )
+    hass.states.async_set("sensor.y", "1", {"unit": "W"})
+    template = Template(
+        "{{ state_attr('climate.x', 'current_temperature') }}"
+        " {{ states.sensor.y.attributes.unit }}",
+        hass,
+    )
+    results = []
+
+    @ha.callback
+    def listener(event, updates):
+        results.append(updates.pop().result)
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        async_track_template_result(hass, [TrackTemplate(template, None)], listener)
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+
+        hass.states.async_set(
+            "climate.x", "cool", {"current_temperature": 20, "hvac_action": "heating"}
+        )
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+
+        hass.states.async_set(
+            "climate.x", "cool", {"current_temperature": 21, "hvac_action": "heating"}
+        )
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 2
+        assert results == ["21 W"]
+
+        # All attributes are read from sensor.y
+        hass.states.async_set("sensor.y", "2", {"unit": "W", "other": 1})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+
+        hass.states.async_remove("climate.x")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 4
+        assert results == ["21 W", "None W"]
+
+
+async def test_track_template_result_rendered_state_object(hass):
+    """Test a template rendering a whole state object re-renders on any change."""
+    hass.states.async_set("sensor.x", "1", {"unit": "W"})
+    template = Template("{{ states.sensor.x }}", hass)
+    results = []
+
+    @ha.callback
+    def listener(event, updates):
+        results.append(updates.pop().result)
+
+    async_track_template_result(hass, [TrackTemplate(template, None)], listener)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.x", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert len(results) == 1
+    assert "unit=kW" in results[0]
+
+    hass.states.async_set("sensor.x", "2", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert len(results) == 2
+    assert "sensor.x=2" in results[1]
+
+
+async def test_track_template_result_render_cache(hass):
+    """Test tracked templates can reuse renders while the values read are unchanged."""
+    hass.states.async_set("sensor.a", "1", {"unit": "W"})
+    hass.states.async_set("sensor.x", "1", {"unit": "W"})
+    template = Template("{{ states('sensor.a') }}", hass)
+    template_object = Template("{{ states.sensor.x }}", hass)
+    results = []
+
+    @ha.callback
+    def listener(event, updates):
+        results.extend(update.result for update in updates)
+
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template, None, render_cache=True),
+            TrackTemplate(template_object, None, render_cache=True),
+        ],
+        listener,
+    )
+    await hass.async_block_till_done()
+    cache = template.render_cache
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    hass.states.async_set("sensor.a", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert results == []
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    hass.states.async_set("sensor.a", "2", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert results == ["2"]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # A rendered state object depends on the whole state
+    hass.states.async_set("sensor.x", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert len(results) == 2
+    assert "unit=kW" in results[1]
+    assert template_object.render_cache.hits == 0
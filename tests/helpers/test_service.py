@@ -533,6 +533,72 @@ async def test_call_with_sync_func(hass, mock_entities):
     assert test_service_mock.call_count == 1
 
 
+async def test_call_targeting_entities_across_platforms(hass, mock_entities):
+    """Test referenced entities are looked up in every platform."""
+    test_service_mock = AsyncMock(return_value=None)
+    entities = list(mock_entities.values())
+    await service.entity_service_call(
+        hass,
+        [
+            Mock(entities={entity.entity_id: entity for entity in entities[:1]}),
+            Mock(entities={entity.entity_id: entity for entity in entities[1:]}),
+        ],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.bathroom", "light.unknown"]},
+        ),
+    )
+
+    assert test_service_mock.call_count == 2
+    actual = [call[0][0] for call in test_service_mock.call_args_list]
+    assert actual == [mock_entities["light.kitchen"], mock_entities["light.bathroom"]]
+
+    # Entities looked up by entity_id are called in a stable order
+    test_service_mock.reset_mock()
+    await service.entity_service_call(
+        hass,
+        [Mock(entities=mock_entities)],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.living_room", "light.bedroom"]},
+        ),
+    )
+    actual = [call[0][0] for call in test_service_mock.call_args_list]
+    assert actual == [
+        mock_entities["light.bedroom"],
+        mock_entities["light.living_room"],
+    ]
+
+    # Also when the platform has fewer entities than referenced
+    test_service_mock.reset_mock()
+    await service.entity_service_call(
+        hass,
+        [
+            Mock(
+                entities={
+                    entity_id: mock_entities[entity_id]
+                    for entity_id in ("light.living_room", "light.bedroom")
+                }
+            )
+        ],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.living_room", "light.bedroom", "light.unknown"]},
+        ),
+    )
+    actual = [call[0][0] for call in test_service_mock.call_args_list]
+    assert actual == [
+        mock_entities["light.bedroom"],
+        mock_entities["light.living_room"],
+    ]
+
+
 async def test_call_with_sync_attr(hass, mock_entities):
     """Test invoking sync service calls."""
     mock_method = mock_entities["light.kitchen"].sync_method = Mock(return_value=None)
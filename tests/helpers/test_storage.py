@@ -279,3 +279,205 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+_ORIG_ASYNC_LOAD = storage.Store._async_load
+_ORIG_WRITE_DATA = storage.Store._write_data
+_ORIG_ASYNC_REMOVE = storage.Store.async_remove
+
+
+@pytest.fixture
+def disk_storage(hass, tmp_path):
+    """Fixture to read and write stores on disk instead of the mock storage."""
+    hass.config.config_dir = str(tmp_path)
+    with patch.object(storage.Store, "_async_load", _ORIG_ASYNC_LOAD), patch.object(
+        storage.Store, "_write_data", _ORIG_WRITE_DATA
+    ), patch.object(storage.Store, "async_remove", _ORIG_ASYNC_REMOVE):
+        yield tmp_path / storage.STORAGE_DIR
+
+
+def _journaled_store(hass):
+    """Return a store journaling its entities."""
+    return storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_keys={"entities": "entity_id"}
+    )
+
+
+def _journaled_data(*entities, other="value"):
+    """Return data for a journaled store."""
+    return {"entities": list(entities), "other": other}
+
+
+async def _async_save(store, data, *changed):
+    """Mark the changed entities and save the data."""
+    for entity_id in changed:
+        store.async_journal_item_changed("entities", entity_id)
+    await store.async_save(data)
+
+
+def _journal_records(storage_dir):
+    """Return the records of the journal."""
+    return [
+        json.loads(line)
+        for line in (storage_dir / f"{MOCK_KEY}.journal").read_text().splitlines()
+    ]
+
+
+async def test_journaled_store_appends_changes(hass, disk_storage):
+    """Test a journaled store appends changed items to the journal."""
+    store = _journaled_store(hass)
+    journal = disk_storage / f"{MOCK_KEY}.journal"
+    light = {"entity_id": "light.kitchen", "name": "Kitchen"}
+    switch = {"entity_id": "switch.fan", "name": "Fan"}
+
+    await _async_save(store, _journaled_data(light, switch), "light.kitchen")
+    assert not journal.exists()
+
+    renamed = {**light, "name": "Cooking"}
+    sensor = {"entity_id": "sensor.temp", "name": "Temp"}
+    await _async_save(
+        store,
+        _journaled_data(renamed, sensor),
+        "switch.fan",
+        "sensor.temp",
+        "light.kitchen",
+    )
+    records = _journal_records(disk_storage)
+    assert records[1:] == [
+        {"list": "entities", "key": "light.kitchen", "item": renamed},
+        {"list": "entities", "key": "sensor.temp", "item": sensor},
+        {"list": "entities", "key": "switch.fan"},
+    ]
+    snapshot = json.loads((disk_storage / MOCK_KEY).read_text())
+    assert records[0] == {"journal_id": snapshot["journal_id"]}
+
+    # Nothing is written when nothing changed
+    await store.async_save(_journaled_data(renamed, sensor))
+    assert len(_journal_records(disk_storage)) == 4
+
+    # Only the marked items are encoded
+    await _async_save(
+        store,
+        _journaled_data(renamed, {**sensor, "name": "Unmarked"}),
+        "light.kitchen",
+    )
+    assert len(_journal_records(disk_storage)) == 5
+
+    reloaded = _journaled_store(hass)
+    assert await reloaded.async_load() == _journaled_data(renamed, sensor)
+
+    # The reloaded store continues the journal
+    await _async_save(reloaded, _journaled_data(renamed), "sensor.temp")
+    assert _journal_records(disk_storage)[-1] == {
+        "list": "entities",
+        "key": "sensor.temp",
+    }
+    assert await _journaled_store(hass).async_load() == _journaled_data(renamed)
+
+    await reloaded.async_remove()
+    assert not journal.exists()
+    assert not (disk_storage / MOCK_KEY).exists()
+
+
+async def test_journaled_store_writes_snapshot(hass, disk_storage):
+    """Test a journaled store writes a snapshot when the other data changes."""
+    store = _journaled_store(hass)
+    journal = disk_storage / f"{MOCK_KEY}.journal"
+    light = {"entity_id": "light.kitchen", "name": "Kitchen"}
+
+    await store.async_save(_journaled_data())
+    await _async_save(store, _journaled_data(light), "light.kitchen")
+    assert journal.exists()
+
+    await store.async_save(_journaled_data(light, other="changed"))
+    assert not journal.exists()
+    snapshot = json.loads((disk_storage / MOCK_KEY).read_text())
+    assert snapshot["data"] == {"entities": [light], "other": "changed"}
+
+    # The journal is compacted into a snapshot once it grows too big
+    with patch.object(storage, "JOURNAL_COMPACT_MIN_BYTES", 0), patch.object(
+        storage, "JOURNAL_COMPACT_RATIO", 0
+    ):
+        for number in range(3):
+            await _async_save(
+                store,
+                _journaled_data({**light, "name": str(number)}, other="changed"),
+                "light.kitchen",
+            )
+    snapshot = json.loads((disk_storage / MOCK_KEY).read_text())
+    assert snapshot["data"]["entities"] == [{**light, "name": "1"}]
+    assert len(_journal_records(disk_storage)) == 2
+    assert await _journaled_store(hass).async_load() == _journaled_data(
+        {**light, "name": "2"}, other="changed"
+    )
+
+
+async def test_journaled_store_ignores_stale_journal(hass, disk_storage):
+    """Test a journal of another snapshot or a torn record is not replayed."""
+    store = _journaled_store(hass)
+    journal = disk_storage / f"{MOCK_KEY}.journal"
+    light = {"entity_id": "light.kitchen", "name": "Kitchen"}
+    switch = {"entity_id": "switch.fan", "name": "Fan"}
+    await _async_save(store, _journaled_data(light), "light.kitchen")
+    await _async_save(store, _journaled_data(light, switch), "switch.fan")
+
+    # A torn record at the end is skipped, the records before it are replayed
+    with open(journal, "a") as journal_file:
+        journal_file.write('{"list":"entities","key":"light.kit')
+    store = _journaled_store(hass)
+    data = await store.async_load()
+    assert data == _journaled_data(light, switch)
+
+    # The next save writes a snapshot since the journal is damaged
+    await store.async_save(data)
+    assert not journal.exists()
+
+    journal.write_text(
+        '{"journal_id":"other"}\n{"list":"entities","key":"light.kitchen"}\n'
+    )
+    assert await _journaled_store(hass).async_load() == _journaled_data(light, switch)
+
+
+async def test_journaled_store_skips_invalid_records(hass, disk_storage):
+    """Test records without a list or key are skipped and the journal restarts."""
+    store = _journaled_store(hass)
+    journal = disk_storage / f"{MOCK_KEY}.journal"
+    light = {"entity_id": "light.kitchen", "name": "Kitchen"}
+    switch = {"entity_id": "switch.fan", "name": "Fan"}
+    await _async_save(store, _journaled_data(light), "light.kitchen")
+    await _async_save(store, _journaled_data(light, switch), "switch.fan")
+
+    # A second header line, as appended to a journal torn after its header
+    header = journal.read_text().splitlines()[0]
+    with open(journal, "a") as journal_file:
+        journal_file.write(f"{header}\n")
+    store = _journaled_store(hass)
+    data = await store.async_load()
+    assert data == _journaled_data(light, switch)
+
+    # The next save writes a snapshot instead of appending to the journal
+    await _async_save(store, _journaled_data(switch), "light.kitchen")
+    assert not journal.exists()
+    await _async_save(store, _journaled_data(), "switch.fan")
+    records = _journal_records(disk_storage)
+    assert len(records) == 2
+    assert records[1] == {"list": "entities", "key": "switch.fan"}
+    assert await _journaled_store(hass).async_load() == _journaled_data()
+
+
+async def test_journaled_store_upgrade(hass, disk_storage):
+    """Test a snapshot written without journal id is replaced on the first save."""
+    light = {"entity_id": "light.kitchen", "name": "Kitchen"}
+    switch = {"entity_id": "switch.fan", "name": "Fan"}
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(
+        _journaled_data(light)
+    )
+
+    store = _journaled_store(hass)
+    assert await store.async_load() == _journaled_data(light)
+    await _async_save(store, _journaled_data(light, switch), "switch.fan")
+    assert not (disk_storage / f"{MOCK_KEY}.journal").exists()
+    assert "journal_id" in json.loads((disk_storage / MOCK_KEY).read_text())
+
+    await _async_save(store, _journaled_data(switch), "light.kitchen")
+    assert await _journaled_store(hass).async_load() == _journaled_data(switch)
@@ -3055,3 +3055,66 @@ async def test_undefined_variable(hass, caplog):
         "Template variable warning: 'no_such_variable' is undefined when rendering '{{ no_such_variable }}'"
         in caplog.text
     )
+
+
+async def test_render_cache(hass):
+    """Test renders are reused while the values they read are unchanged."""
+    hass.states.async_set("sensor.a", "1", {"unit": "W"})
+    hass.states.async_set("sensor.b", "on", {"x": 2, "y": 3})
+    tmp = template.Template(
+        "{{ states('sensor.a') }} {{ state_attr('sensor.b', 'x') }}"
+        " {{ states('sensor.missing') }}",
+        hass,
+    )
+    cache = tmp.async_enable_render_cache()
+
+    info = tmp.async_render_to_info()
+    assert info.result() == "1 2 unknown"
+    assert info.reads == {
+        "sensor.a": {"state"},
+        "sensor.b": {"attributes.x"},
+        "sensor.missing": {"exists"},
+    }
+    assert tmp.async_render_to_info() is info
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Values the template did not read changed
+    hass.states.async_set("sensor.a", "1", {"unit": "kW"})
+    hass.states.async_set("sensor.b", "off", {"x": 2, "y": 4})
+    assert tmp.async_render_to_info() is info
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    hass.states.async_set("sensor.b", "off", {"x": 5, "y": 4})
+    info = tmp.async_render_to_info()
+    assert info.result() == "1 5 unknown"
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    hass.states.async_set("sensor.missing", "here")
+    assert tmp.async_render_to_info().result() == "1 5 here"
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # Other variables are rendered
+    assert tmp.async_render_to_info({"extra": 1}) is not info
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    # Strict renders bypass the cache
+    info = tmp.async_render_to_info()
+    assert tmp.async_render_to_info(strict=True) is not info
+    assert tmp.async_render_to_info() is info
+    assert (cache.hits, cache.misses) == (3, 5)
+
+
+async def test_render_cache_not_used(hass):
+    """Test renders that do not only depend on the states read are not reused."""
+    hass.states.async_set("sensor.a", "1")
+    for template_str in (
+        "{{ states.sensor | count }}",
+        "{{ states | count }}",
+        "{{ now() }}",
+        "{{ states('sensor.a') | float / 0 }}",
+    ):
+        tmp = template.Template(template_str, hass)
+        cache = tmp.async_enable_render_cache()
+        tmp.async_render_to_info()
+        tmp.async_render_to_info()
+        assert (cache.hits, cache.misses) == (0, 2)
@@ -167,6 +167,45 @@ async def test_setup_after_deps_all_present(hass):
 
 
 @pytest.mark.parametrize("load_registries", [False])
+async def test_integrations_preloaded_before_each_stage(hass):
+    """Test the integrations of each stage are imported before it is set up."""
+    order = []
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    for domain in ("logger", "cloud", "normal_integration", "light"):
+        mock_integration(
+            hass, MockModule(domain=domain, async_setup=gen_domain_setup(domain))
+        )
+
+    async def mock_preload(hass, integrations, platform_names):
+        order.append({integration.domain for integration in integrations})
+        # Only the entity components being set up have platforms
+        assert set(platform_names) == {"light"}
+
+    with patch(
+        "homeassistant.loader.async_preload_integrations", side_effect=mock_preload
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"logger": {}, "cloud": {}, "normal_integration": {}, "light": {}}
+        )
+
+    assert [step for step in order if isinstance(step, set)] == [
+        {"logger"},
+        {"cloud"},
+        {"normal_integration", "light"},
+    ]
+    assert order.index({"logger"}) < order.index("logger")
+    assert order.index({"cloud"}) < order.index("cloud")
+    for domain in ("normal_integration", "light"):
+        assert order.index({"normal_integration", "light"}) < order.index(domain)
+
+
 async def test_setup_after_deps_in_stage_1_ignored(hass):
     """Test after_dependencies are ignored in stage 1."""
     # This test relies on this
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +385,56 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_json():
+    """Test a State encoded as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog", "when": last_time},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    assert json.loads(state.as_json()) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+    assert state.attributes_json() == '{"pig":"dog","when":"1984-12-08T12:00:00"}'
+    # The encoding is cached
+    assert state.as_json() is state.as_json()
+    assert state.attributes_json() in state.as_json()
+
+    state = ha.State("happy.happy", "on", {"pig": float("nan")})
+    with pytest.raises(ValueError):
+        state.as_json()
+
+
+def test_event_as_json():
+    """Test an Event encoded as JSON."""
+    now = dt_util.utcnow()
+    event = ha.Event("some_type", {"some": "attr"}, ha.EventOrigin.local, now)
+    assert json.loads(event.as_json()) == event.as_dict()
+    assert event.as_json() is event.as_json()
+
+    old_state = ha.State("light.kitchen", "off")
+    new_state = ha.State("light.kitchen", "on")
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.kitchen", "old_state": old_state, "new_state": new_state},
+    )
+    assert json.loads(event.as_json()) == json.loads(
+        json.dumps(event.as_dict(), cls=JSONEncoder)
+    )
+    # The encoding of the states is reused
+    assert old_state.as_json() in event.data_json()
+    assert new_state.as_json() in event.data_json()
+
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.kitchen", "old_state": None, "new_state": new_state},
+    )
+    assert json.loads(event.data_json())["old_state"] is None
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +483,99 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_match_all_exclude_event_types(hass):
+    """Test excluded event types are not dispatched to match all listeners."""
+    calls = []
+    filtered = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.event_type)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        filtered.append(event.event_type)
+        return True
+
+    unsub = hass.bus.async_listen(
+        MATCH_ALL, listener, event_filter=filter, exclude_event_types={"excluded"}
+    )
+
+    hass.bus.async_fire("excluded")
+    hass.bus.async_fire("included")
+    await hass.async_block_till_done()
+
+    assert calls == ["included"]
+    assert filtered == ["included"]
+
+    # Listeners added after the dispatch list was built are called
+    unsub_second = hass.bus.async_listen("excluded", listener)
+    hass.bus.async_fire("excluded")
+    await hass.async_block_till_done()
+
+    assert calls == ["included", "excluded"]
+    assert filtered == ["included"]
+
+    unsub()
+    unsub_second()
+    hass.bus.async_fire("included")
+    await hass.async_block_till_done()
+
+    assert calls == ["included", "excluded"]
+
+
+async def test_eventbus_dispatch_cache_invalidation(hass):
+    """Test only the dispatch lists affected by a listener change are rebuilt."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.event_type)
+
+    # Event types without listeners are not cached
+    hass.bus.async_fire("a")
+    assert "a" not in hass.bus._dispatch
+
+    unsub_b = hass.bus.async_listen("b", listener)
+    hass.bus.async_fire("b")
+    dispatch_b = hass.bus._dispatch["b"]
+
+    unsub_a = hass.bus.async_listen("a", listener)
+    assert "a" not in hass.bus._dispatch
+    assert hass.bus._dispatch["b"] is dispatch_b
+
+    hass.bus.async_fire("a")
+    hass.bus.async_fire("b")
+    await hass.async_block_till_done()
+    assert calls == ["b", "a", "b"]
+
+    # Match all listeners are part of every dispatch list
+    unsub_all = hass.bus.async_listen(MATCH_ALL, listener)
+    assert not hass.bus._dispatch
+    hass.bus.async_fire("a")
+    hass.bus.async_fire("b")
+    await hass.async_block_till_done()
+    assert calls == ["b", "a", "b", "a", "a", "b", "b"]
+
+    unsub_all()
+    unsub_a()
+    unsub_b()
+    hass.bus.async_fire("a")
+    hass.bus.async_fire("b")
+    await hass.async_block_till_done()
+    assert len(calls) == 7
+    assert not hass.bus._dispatch
+
+
+async def test_eventbus_exclude_event_types_requires_match_all(hass):
+    """Test event types can only be excluded for match all listeners."""
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen("test", lambda event: None, exclude_event_types=["a"])
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
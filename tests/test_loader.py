@@ -1,9 +1,10 @@
 """Test to verify that we can load components."""
-from unittest.mock import patch
+import json
+from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import core, loader
+from homeassistant import components, core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 
@@ -171,6 +172,102 @@ async def test_get_integration_custom_component(hass, enable_custom_integrations
     assert integration.name == "Test Package"
 
 
+async def test_preload_integrations(hass, enable_custom_integrations):
+    """Test integrations and their platforms are imported in the executor."""
+    integration = await loader.async_get_integration(hass, "test")
+    mock_integration(hass, MockModule("mocked"))
+    mocked = await loader.async_get_integration(hass, "mocked")
+    # Requirements that are not installed yet
+    mock_integration(
+        hass, MockModule("with_reqs", requirements=["not-installed-package==1.0"])
+    )
+    with_reqs = await loader.async_get_integration(hass, "with_reqs")
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        await loader.async_preload_integrations(
+            hass, [integration, mocked, with_reqs], ["light", "not_a_platform"]
+        )
+
+    assert [call[0][0] for call in mock_import.call_args_list] == [
+        "custom_components.test",
+        "custom_components.test.light",
+    ]
+
+
+async def test_preload_integrations_import_error(hass, enable_custom_integrations):
+    """Test import errors are left to the setup of the integration."""
+    integration = await loader.async_get_integration(hass, "test")
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", side_effect=ImportError
+    ) as mock_import:
+        await loader.async_preload_integrations(hass, [integration], ["light"])
+
+    assert len(mock_import.mock_calls) == 1
+
+
+async def test_integration_cache(hass, enable_custom_integrations):
+    """Test manifests and dependencies are cached while unchanged."""
+    await loader.async_load_integration_cache(hass)
+    custom = await loader.async_get_integration(hass, "test_package")
+    integration = await loader.async_get_integration(hass, "hue")
+    assert await integration.resolve_dependencies()
+
+    cache = hass.data[loader.DATA_INTEGRATION_CACHE]
+    data = json.loads(json.dumps(cache.data_to_save()))
+    custom_manifest_path = str(custom.file_path / "manifest.json")
+    manifest_path = integration.file_path / "manifest.json"
+    assert data["manifests"][custom_manifest_path][0] is not None
+    assert data["manifests"][str(manifest_path)] == [None, integration.manifest]
+    custom_path = str(custom.file_path.parent)
+    assert custom.domain in data["sub_directories"][custom_path][1]
+
+    cache = loader.IntegrationCache()
+    cache.restore(data)
+    assert cache.get_manifest(manifest_path) == integration.manifest
+    assert cache.get_dependencies("hue") == integration.all_dependencies
+    with patch("pathlib.Path.iterdir", side_effect=AssertionError):
+        assert custom.domain in cache.get_sub_directories(custom_path)
+
+    hass.data[loader.DATA_INTEGRATION_CACHE] = cache
+    with patch("pathlib.Path.read_text", side_effect=AssertionError):
+        resolved = loader.Integration.resolve_from_root(hass, components, "hue")
+    assert resolved.manifest == integration.manifest
+
+    # A custom manifest changed during the boot drops the resolved dependencies
+    mtime = data["manifests"][custom_manifest_path][0]
+    with patch("pathlib.Path.stat", return_value=Mock(st_mtime=mtime + 1)):
+        assert cache.get_manifest(custom.file_path / "manifest.json") is None
+    assert cache.get_dependencies("hue") is None
+
+    # A changed custom manifest drops the resolved dependencies
+    data["manifests"][custom_manifest_path][0] -= 1
+    cache = loader.IntegrationCache()
+    cache.restore(data)
+    assert cache.get_manifest(manifest_path) == integration.manifest
+    assert cache.get_manifest(custom.file_path / "manifest.json") is None
+    assert cache.get_dependencies("hue") is None
+
+    # Nothing is used after an update of Home Assistant
+    data["ha_version"] = "0.1.0"
+    cache = loader.IntegrationCache()
+    cache.restore(data)
+    assert cache.get_manifest(manifest_path) is None
+
+
+async def test_integration_cache_records_resolved(hass, enable_custom_integrations):
+    """Test manifests resolved before the cache is loaded are cached."""
+    custom = await loader.async_get_integration(hass, "test_package")
+    integration = await loader.async_get_integration(hass, "hue")
+    await loader.async_load_integration_cache(hass)
+
+    cache = hass.data[loader.DATA_INTEGRATION_CACHE]
+    assert cache.get_manifest(integration.file_path / "manifest.json") == (
+        integration.manifest
+    )
+    assert cache.get_manifest(custom.file_path / "manifest.json") == custom.manifest
+
+
 def test_integration_properties(hass):
     """Test integration properties."""
     integration = loader.Integration(
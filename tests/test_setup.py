@@ -4,6 +4,7 @@ import asyncio
 import datetime
 import os
 import threading
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -708,3 +709,73 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of the setup are recorded on the startup timeline."""
+    mock_integration(hass, MockModule("comp", async_setup=AsyncMock(return_value=True)))
+    timeline = setup.async_start_timeline(hass)
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    # Block the event loop
+    time.sleep(0.3)
+    await asyncio.sleep(0.01)
+    timeline.async_stop()
+
+    trace = timeline.async_as_trace()
+    rows = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    spans = {
+        (event["tid"], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    assert {
+        (rows["comp"], "import"),
+        (rows["comp"], "config"),
+        (rows["comp"], "async_setup"),
+        (rows["comp"], "setup comp"),
+        (rows["event loop"], "blocked"),
+    } <= spans
+    assert any(
+        event["name"] == "executor queue wait"
+        for event in trace["traceEvents"]
+        if event["ph"] == "C"
+    )
+
+    # Nothing is recorded after startup
+    with setup.async_trace_setup_phase(hass, "comp", "late"):
+        pass
+    assert timeline.async_as_trace() == trace
+
+
+async def test_setup_timeline_concurrent_phases(hass):
+    """Test concurrent phases of an integration are put on rows they nest in."""
+    timeline = setup.SetupTimeline(hass)
+
+    timeline.async_add("comp", "entry 1", 1.0, 3.0)
+    timeline.async_add("comp", "entry 2", 2.0, 4.0)
+    timeline.async_add("comp", "entry 3", 2.5, 4.5)
+    timeline.async_add("comp", "async_setup", 0.5, 5.0)
+    timeline.async_add("comp", "platform", 6.0, 7.0)
+
+    trace = timeline.async_as_trace()
+    rows = {
+        event["tid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert {
+        event["name"]: rows[event["tid"]]
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    } == {
+        "entry 1": "comp",
+        "entry 2": "comp (2)",
+        "entry 3": "comp (3)",
+        "async_setup": "comp",
+        "platform": "comp",
+    }